@@ -0,0 +1,59 @@
+"""Per-cell cost of TOON value coercion, generic vs planned by column type.
+
+For columns of each kind found in post payloads, times the generic
+``_coerce`` (string literals, then ``int()``, then ``float()``) against the
+coercer the column plan picks from the models in ``xpoz.types``. Cells are
+typical values for the column, so text columns mostly fail both numeric
+attempts under the generic path.
+
+Run from repo root:
+    python benchmarks/bench_column_coercion.py [--cells 200000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from xpoz._transform._response_parser import _coerce, _column_plan
+
+COLUMNS: dict[str, list[str]] = {
+    "text": ["hello world", '"quoted, text"', "AI is here", "null", "1.5 stars"],
+    "authorUsername": ["alice", "bob_42", "carol", "dave", "erin"],
+    "id": ["1790000000000000001", "17", "1790000000000000002", "42", "1790000000000000003"],
+    "likeCount": ["0", "12", "345", "6789", ""],
+    "possiblySensitive": ["false", "true", "false", "false", ""],
+    "createdAt": ["2024-05-01T12:00:00Z"] * 5,
+}
+
+
+def per_cell_ns(coerce: Callable[[str], Any], cells: list[str]) -> float:
+    started = time.perf_counter()
+    for cell in cells:
+        coerce(cell)
+    return (time.perf_counter() - started) / len(cells) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=200_000)
+    args = parser.parse_args()
+
+    plan = dict(zip(COLUMNS, _column_plan(tuple(COLUMNS)) or ()))
+    print(
+        f"{'column':>18}  {'planned as':>14}  {'generic ns':>10}  {'planned ns':>10}  "
+        f"{'speedup':>7}"
+    )
+    for column, samples in COLUMNS.items():
+        cells = (samples * (args.cells // len(samples) + 1))[: args.cells]
+        generic = min(per_cell_ns(_coerce, cells) for _ in range(3))
+        planned = min(per_cell_ns(plan[column], cells) for _ in range(3))
+        print(
+            f"{column:>18}  {plan[column].__name__:>14}  {generic:>10.1f}  {planned:>10.1f}  "
+            f"{generic / planned:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
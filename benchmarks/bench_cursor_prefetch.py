@@ -0,0 +1,117 @@
+"""Wall time of walking a cursor-paged result with and without prefetch.
+
+Starts a local HTTP stand-in for the Instagram live posts endpoint whose
+responses take a fixed amount of time, then walks every page with
+``iter_items()`` while spending a fixed amount of time per page, as a real
+consumer would. Reports the total time for the sync and async clients
+with ``prefetch`` off and on; the async client prefetches through
+``stream_pages()``.
+
+Run from repo root:
+    python benchmarks/bench_cursor_prefetch.py [--pages 20] [--latency 0.05] [--work 0.05]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from xpoz._config import _routes
+from xpoz._rest import AsyncRestTransport, RestTransport
+from xpoz.namespaces.instagram_live import AsyncInstagramLiveNamespace, InstagramLiveNamespace
+
+
+def start_stand_in(pages: int, latency: float, page_size: int) -> str:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            parsed = urlparse(self.path)
+            if parsed.path != _routes.INSTAGRAM_LIVE_POSTS:
+                self.send_error(404)
+                return
+            time.sleep(latency)
+            number = int(parse_qs(parsed.query).get("cursor", ["1"])[0])
+            more = number < pages
+            body = json.dumps(
+                {
+                    "results": [
+                        {"id": f"{number}-{i}", "username": "bench", "likeCount": i}
+                        for i in range(page_size)
+                    ],
+                    "count": page_size,
+                    "dataSource": "api",
+                    "has_more": more,
+                    "next_page_cursor": str(number + 1) if more else None,
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def measure_sync(url: str, prefetch: bool, work: float) -> float:
+    transport = RestTransport(url, "bench-key")
+    try:
+        live = InstagramLiveNamespace(transport)
+        started = time.perf_counter()
+        for page in live.search_posts("bench").iter_pages(prefetch=prefetch):
+            time.sleep(work)
+        return time.perf_counter() - started
+    finally:
+        transport.close()
+
+
+async def measure_async(url: str, prefetch: bool, work: float) -> float:
+    transport = AsyncRestTransport(url, "bench-key")
+    try:
+        live = AsyncInstagramLiveNamespace(transport)
+        started = time.perf_counter()
+        first = await live.search_posts("bench")
+        if prefetch:
+            async with first.stream_pages() as pages:
+                async for page in pages:
+                    await asyncio.sleep(work)
+        else:
+            async for page in first.iter_pages():
+                await asyncio.sleep(work)
+        return time.perf_counter() - started
+    finally:
+        await transport.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--work", type=float, default=0.05)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+
+    url = start_stand_in(args.pages, args.latency, args.page_size)
+    print(
+        f"{args.pages} pages, {args.latency * 1000:.0f} ms/request, "
+        f"{args.work * 1000:.0f} ms consumer work/page"
+    )
+    print(f"{'client':>6}  {'prefetch':>8}  {'seconds':>8}")
+    for prefetch in (False, True):
+        elapsed = measure_sync(url, prefetch, args.work)
+        print(f"{'sync':>6}  {prefetch!s:>8}  {elapsed:>8.3f}")
+    for prefetch in (False, True):
+        elapsed = asyncio.run(measure_async(url, prefetch, args.work))
+        print(f"{'async':>6}  {prefetch!s:>8}  {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Decode throughput of the JSON backends on realistic response bodies.
+
+Builds an Instagram live posts page (the REST endpoint's camelCase JSON) and
+a Twitter search page (the JSON an MCP tool returns), then decodes each
+with every installed backend. The ``json (str)`` row is what the transports
+did before, decoding text with the standard library; the others decode the
+body bytes through ``xpoz._json.loads``.
+
+Run from repo root:
+    python benchmarks/bench_json_decode.py [--rows 1000] [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from xpoz import _json
+
+
+def instagram_live_page(rows: int) -> bytes:
+    results = [
+        {
+            "id": f"3{row:018d}",
+            "userId": 1000 + row % 300,
+            "username": f"creator_{row % 300}",
+            "fullName": f"Creator Number {row % 300}",
+            "caption": f"Sunset #{row} at the beach ☀️ #travel #summer \"quoted\"",
+            "mediaType": "video" if row % 3 else "image",
+            "codeUrl": f"https://www.instagram.com/p/C{row:010d}/",
+            "imageUrl": f"https://scontent.cdninstagram.com/v/t51/{row}_n.jpg?stp=dst-jpg",
+            "likeCount": row * 13 % 100_000,
+            "commentCount": row % 900,
+            "videoPlayCount": row * 101,
+            "videoDuration": 12.5 + row % 40,
+            "createdAt": 1714560000 + row,
+            "createdAtDate": "2024-05-01",
+        }
+        for row in range(rows)
+    ]
+    body = {"results": results, "count": rows, "has_more": True, "next_page_cursor": "QVFE"}
+    return json.dumps(body).encode()
+
+
+def twitter_search_page(rows: int) -> bytes:
+    results = [
+        {
+            "id": str(1790000000000000000 + row),
+            "text": f"Thread {row}/10: what the new model release means for agents \U0001f9f5",
+            "authorId": str(44196397 + row % 500),
+            "authorUsername": f"user_{row % 500}",
+            "lang": "en",
+            "likeCount": row * 7 % 50_000,
+            "retweetCount": row % 700,
+            "replyCount": row % 90,
+            "quoteCount": row % 30,
+            "impressionCount": row * 311,
+            "possiblySensitive": False,
+            "isRetweet": row % 5 == 0,
+            "hashtags": ["AI", "LLM"],
+            "mentions": [f"user_{(row + 1) % 500}"],
+            "createdAt": "2024-05-01T12:00:00.000Z",
+            "createdAtDate": "2024-05-01",
+        }
+        for row in range(rows)
+    ]
+    pagination = {"tableName": "t_abc", "totalRows": rows * 10, "totalPages": 10,
+                  "pageNumber": 1, "pageSize": rows, "resultsCount": rows}
+    return json.dumps({"results": results, "pagination": pagination}).encode()
+
+
+def best_of(repeat: int, decode: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "instagram live": instagram_live_page(args.rows),
+        "twitter search": twitter_search_page(args.rows),
+    }
+    print(f"{'payload':>15}  {'backend':>12}  {'ms':>7}  {'MiB/s':>7}")
+    for name, body in payloads.items():
+        mib = len(body) / 2**20
+        elapsed = best_of(args.repeat, lambda body=body: json.loads(body.decode()))
+        print(f"{name:>15}  {'json (str)':>12}  {elapsed * 1000:>7.2f}  {mib / elapsed:>7.1f}")
+        for backend in _json.JSON_BACKENDS:
+            try:
+                _json.set_json_backend(backend)
+            except ImportError:
+                continue
+            elapsed = best_of(args.repeat, functools.partial(_json.loads, body))
+            print(f"{name:>15}  {backend:>12}  {elapsed * 1000:>7.2f}  {mib / elapsed:>7.1f}")
+        _json.set_json_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Cost of mapping response keys from camelCase to snake_case.
+
+Maps the rows of a Twitter search page three ways: the two regex
+substitutions per key the SDK used to run, the key table one row at a
+time (``map_dict_keys_to_snake``), and the table once per key layout
+(``map_list_of_dicts_to_snake``, which namespaces use for result pages).
+
+Run from repo root:
+    python benchmarks/bench_key_mapping.py [--rows 10000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from bench_json_decode import twitter_search_page
+
+from xpoz._transform._field_mapping import (
+    camel_to_snake,
+    map_dict_keys_to_snake,
+    map_list_of_dicts_to_snake,
+)
+
+
+def regex_per_key(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{camel_to_snake(k): v for k, v in row.items()} for row in rows]
+
+
+def table_per_row(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [map_dict_keys_to_snake(row) for row in rows]
+
+
+def best_of(repeat: int, run: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = json.loads(twitter_search_page(args.rows))["results"]
+    keys = len(rows) * len(rows[0])
+    strategies: dict[str, Callable[[list[dict[str, Any]]], list[dict[str, Any]]]] = {
+        "regex per key": regex_per_key,
+        "table per row": table_per_row,
+        "table per layout": map_list_of_dicts_to_snake,
+    }
+    expected = regex_per_key(rows)
+    print(f"{args.rows} rows, {keys} keys")
+    print(f"{'strategy':>17}  {'ms':>8}  {'ns/key':>7}")
+    for name, strategy in strategies.items():
+        assert strategy(rows) == expected
+        elapsed = best_of(args.repeat, functools.partial(strategy, rows))
+        print(f"{name:>17}  {elapsed * 1000:>8.2f}  {elapsed / keys * 1e9:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""End-to-end decode cost of an MCP search response, by payload format.
+
+Builds the JSON-RPC response a server sends for a search tool call, with
+the rows as TOON text, as JSON text, or as structured content (alongside a
+short text block, as servers do), and times everything from the raw
+message bytes to the dict namespaces consume: message validation by the
+MCP client types, then ``_parse_tool_result``.
+
+Run from repo root:
+    python benchmarks/bench_mcp_decode.py [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any
+
+from bench_response_parser import make_toon
+from mcp.types import CallToolResult, JSONRPCResponse
+
+from xpoz._mcp._transport import _parse_tool_result
+from xpoz._transform._response_parser import parse_response_text
+
+
+def _message(result: dict[str, Any]) -> bytes:
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+
+
+def build_messages(rows: int) -> dict[str, bytes]:
+    toon = make_toon(rows)
+    decoded = parse_response_text(toon)
+    return {
+        "toon text": _message({"content": [{"type": "text", "text": toon}]}),
+        "json text": _message({"content": [{"type": "text", "text": json.dumps(decoded)}]}),
+        "structured": _message(
+            {
+                "content": [{"type": "text", "text": f"{rows} results"}],
+                "structuredContent": decoded,
+            }
+        ),
+    }
+
+
+def decode(raw: bytes) -> dict[str, Any]:
+    message = JSONRPCResponse.model_validate_json(raw)
+    return _parse_tool_result("bench", CallToolResult.model_validate(message.result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6}  {'format':>10}  {'KiB':>8}  {'ms':>8}  {'us/row':>7}")
+    for rows in (100, 1_000, 10_000):
+        for name, raw in build_messages(rows).items():
+            assert len(decode(raw)["results"]) == rows
+            best = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                decode(raw)
+                best = min(best, time.perf_counter() - started)
+            print(
+                f"{rows:>6}  {name:>10}  {len(raw) / 1024:>8.1f}  {best * 1000:>8.2f}  "
+                f"{best / rows * 1e6:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Validating a page of rows into models: per row vs one cached TypeAdapter.
+
+Validates 10k snake_case ``TwitterPost`` and ``RedditComment`` rows with
+``model_validate`` once per row, the way pages used to be parsed, and with
+``validate_rows``, which validates the whole list through a cached
+``TypeAdapter(list[Model])``. The garbage collector is paused while timing
+so the numbers compare the validation work rather than collection pauses.
+
+``--record FILE`` appends the results as one JSON line (with the date and
+SDK version), so the speedup can be tracked over time.
+
+Run from repo root:
+    python benchmarks/bench_model_validation.py [--rows 10000] [--record bench.jsonl]
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import functools
+import gc
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from bench_json_decode import twitter_search_page
+
+from xpoz import __version__
+from xpoz._rows import validate_rows
+from xpoz._transform._field_mapping import map_list_of_dicts_to_snake
+from xpoz.types.reddit import RedditComment
+from xpoz.types.twitter import TwitterPost
+
+
+def reddit_comment_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"l{row:07x}",
+            "author_username": f"redditor_{row % 800}",
+            "body": f"Comment {row}: this is **mostly** right, see [link](https://x.y/{row})",
+            "parent_id": f"t3_{row // 20:06x}",
+            "parent_post_id": f"{row // 20:06x}",
+            "post_subreddit_name": "MachineLearning",
+            "score": row % 1000 - 50,
+            "upvotes": row % 1000,
+            "depth": row % 6,
+            "is_submitter": row % 11 == 0,
+            "stickied": False,
+            "created_at": 1714564800 + row,
+            "created_at_date": "2024-05-01",
+        }
+        for row in range(rows)
+    ]
+
+
+def best_of(repeat: int, run: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--record", help="append results to this JSON-lines file")
+    args = parser.parse_args()
+
+    pages: dict[str, tuple[type[Any], list[dict[str, Any]]]] = {
+        "TwitterPost": (
+            TwitterPost,
+            map_list_of_dicts_to_snake(json.loads(twitter_search_page(args.rows))["results"]),
+        ),
+        "RedditComment": (RedditComment, reddit_comment_rows(args.rows)),
+    }
+    results: dict[str, dict[str, float]] = {}
+    print(f"{'model':>14}  {'per row ms':>10}  {'batch ms':>8}  {'speedup':>7}")
+    for name, (model, rows) in pages.items():
+        assert validate_rows(model, rows) == [model.model_validate(row) for row in rows]
+        per_row = best_of(
+            args.repeat, lambda model=model, rows=rows: [model.model_validate(r) for r in rows]
+        )
+        batch = best_of(args.repeat, functools.partial(validate_rows, model, rows))
+        results[name] = {"per_row_ms": per_row * 1000, "batch_ms": batch * 1000}
+        print(
+            f"{name:>14}  {per_row * 1000:>10.1f}  {batch * 1000:>8.1f}  "
+            f"{per_row / batch:>6.2f}x"
+        )
+
+    if args.record:
+        entry = {
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "version": __version__,
+            "rows": args.rows,
+            "results": results,
+        }
+        with open(args.record, "a") as file:
+            file.write(json.dumps(entry) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Latency added by operation polling, fixed 5 s interval vs PollingStrategy.
+
+Draws operation durations from a log-normal distribution (median ~1.5 s with
+a long tail) and drives the real wait_for_result_sync loop against a
+simulated clock, so thousands of operations run in well under a second.
+Added latency is the gap between the operation finishing server-side and
+the poll that observes it.
+
+Run from repo root:
+    python benchmarks/bench_polling.py [--operations 5000] [--rtt 0.08]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from typing import Any
+
+from xpoz._mcp import _polling
+from xpoz._mcp._polling import PollingStrategy, wait_for_result_sync
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def wait_for_one(
+    strategy: PollingStrategy,
+    clock: SimulatedClock,
+    duration: float,
+    rtt: float,
+    timeout: float,
+) -> int:
+    """Poll one operation that finishes after ``duration``; returns the poll count."""
+    clock.now = 0.0
+    count = 0
+
+    def check_status(_name: str, _args: dict[str, Any]) -> dict[str, Any]:
+        nonlocal count
+        count += 1
+        clock.now += rtt
+        return {"status": "success" if clock.now >= duration else "running"}
+
+    wait_for_result_sync(check_status, "op", timeout, strategy)
+    return count
+
+
+def run(
+    strategy: PollingStrategy,
+    durations: list[float],
+    rtt: float,
+    timeout: float,
+) -> tuple[list[float], list[int]]:
+    clock = SimulatedClock()
+    _polling.time = clock  # type: ignore[assignment]
+    added: list[float] = []
+    polls: list[int] = []
+    for duration in durations:
+        polls.append(wait_for_one(strategy, clock, duration, rtt, timeout))
+        added.append(clock.now - duration)
+    return added, polls
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=5000)
+    parser.add_argument("--rtt", type=float, default=0.08, help="status call round trip (s)")
+    parser.add_argument("--median", type=float, default=1.5, help="median duration (s)")
+    parser.add_argument("--sigma", type=float, default=1.2, help="log-normal shape")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    timeout = 3600.0
+    rng = random.Random(args.seed)
+    durations = [
+        min(rng.lognormvariate(0, args.sigma) * args.median, timeout / 2)
+        for _ in range(args.operations)
+    ]
+    strategies = {
+        "fixed 5s": PollingStrategy(initial_interval=5, multiplier=1),
+        "adaptive (default)": PollingStrategy(),
+        "adaptive 0.1s start": PollingStrategy(initial_interval=0.1, multiplier=1.5),
+    }
+
+    print(
+        f"{args.operations} operations, median {args.median}s, "
+        f"p99 {percentile(durations, 99):.1f}s, status RTT {args.rtt * 1000:.0f} ms"
+    )
+    print(f"{'strategy':<22}{'p50 added':>11}{'p99 added':>11}{'mean polls':>12}")
+    for name, strategy in strategies.items():
+        added, polls = run(strategy, durations, args.rtt, timeout)
+        print(
+            f"{name:<22}{percentile(added, 50):>10.2f}s{percentile(added, 99):>10.2f}s"
+            f"{statistics.mean(polls):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
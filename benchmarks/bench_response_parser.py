@@ -0,0 +1,92 @@
+"""Throughput of the TOON response parser on small, wide and huge payloads.
+
+Builds TOON text shaped like MCP tool results, a ``data[N]{fields}:`` table
+of post-like rows with ids, counts, booleans, dates and quoted text
+containing commas and escaped quotes, and times ``parse_response_text`` on
+each. Reports the best of ``--repeat`` runs.
+
+Run from repo root:
+    python benchmarks/bench_response_parser.py [--repeat 5] [--huge-rows 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from xpoz._transform._response_parser import parse_response_text
+
+_BASE_COLUMNS = ["id", "text", "authorUsername", "likeCount", "retweetCount", "possiblySensitive",
+                 "createdAt", "lang", "quoteScore"]
+
+
+def _cell(column: str, row: int) -> str:
+    if column == "id":
+        return str(1790000000000000000 + row)
+    if column == "text":
+        return f'"post {row}, about \\"AI\\" and more"'
+    if column == "authorUsername":
+        return f"user_{row % 997}"
+    if column == "possiblySensitive":
+        return "true" if row % 7 == 0 else "false"
+    if column == "createdAt":
+        return "2024-05-01T12:00:00Z"
+    if column == "lang":
+        return "en" if row % 5 else "null"
+    if column == "quoteScore":
+        return f"{row % 100 / 3:.3f}"
+    return str(row % 5000)
+
+
+def make_toon(rows: int, extra_columns: int = 0) -> str:
+    """TOON text with ``rows`` table rows and ``extra_columns`` numeric columns."""
+    columns = _BASE_COLUMNS + [f"metric{i}" for i in range(extra_columns)]
+    lines = [
+        "success: true",
+        "operationId: null",
+        f"data[{rows}]{{{','.join(columns)}}}:",
+    ]
+    for row in range(rows):
+        lines.append("  " + ",".join(_cell(column, row) for column in columns))
+    lines.append("pagination:")
+    lines.append(f"  totalRows: {rows}")
+    lines.append("  pageNumber: 1")
+    return "\n".join(lines)
+
+
+PAYLOADS: dict[str, Callable[[int], str]] = {
+    "small": lambda huge: make_toon(10),
+    "wide": lambda huge: make_toon(1000, extra_columns=120),
+    "huge": lambda huge: make_toon(huge),
+}
+
+
+def _timed_loop(text: str, loops: int) -> float:
+    started = time.perf_counter()
+    for _ in range(loops):
+        parse_response_text(text)
+    return (time.perf_counter() - started) / loops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--huge-rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'payload':>8}  {'rows':>6}  {'KiB':>8}  {'ms':>9}  {'rows/s':>10}  {'MiB/s':>7}")
+    for name, build in PAYLOADS.items():
+        text = build(args.huge_rows)
+        rows = len(parse_response_text(text)["results"])
+        # Small payloads finish in microseconds; time a batch of them instead.
+        loops = max(1, 2000 // max(rows, 1))
+        elapsed = min(_timed_loop(text, loops) for _ in range(args.repeat))
+        size = len(text.encode())
+        print(
+            f"{name:>8}  {rows:>6}  {size / 1024:>8.1f}  {elapsed * 1000:>9.3f}  "
+            f"{rows / elapsed:>10.0f}  {size / elapsed / 2**20:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Throughput of XpozClient's MCP session pool against a local mock server.
+
+Starts an in-process streamable-HTTP MCP server whose tools take a fixed
+amount of time and, like the production server, handle one call per session
+at a time. 32 worker threads then hammer a single XpozClient for a few
+seconds at each pool size and report calls per second.
+
+Run from repo root:
+    python benchmarks/bench_session_pool.py [--threads 32] [--latency 0.05]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import uvicorn
+
+try:
+    from mcp.server.mcpserver import Context
+    from mcp.server.mcpserver import MCPServer as McpServer
+except ImportError:  # mcp < 2
+    from mcp.server.fastmcp import Context  # type: ignore[no-redef]
+    from mcp.server.fastmcp import FastMCP as McpServer  # type: ignore[no-redef]
+
+from xpoz._mcp._transport import SyncTransport
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def start_mock_server(latency: float) -> str:
+    server = McpServer("xpoz-mock", log_level="ERROR")
+    session_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @server.tool()
+    async def getTwitterUser(identifier: str, ctx: Context) -> str:
+        session_id = ctx.request_context.request.headers.get("mcp-session-id", "")
+        async with session_locks[session_id]:
+            await asyncio.sleep(latency)
+        return f"id: 1\nusername: {identifier}"
+
+    port = _free_port()
+    config = uvicorn.Config(
+        server.streamable_http_app(), host="127.0.0.1", port=port, log_level="error"
+    )
+    uv = uvicorn.Server(config)
+    threading.Thread(target=uv.run, daemon=True).start()
+    while not uv.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}/mcp"
+
+
+def measure(url: str, pool_size: int, threads: int, duration: float) -> float:
+    transport = SyncTransport(url, "bench-key", pool_size=pool_size)
+    transport.connect()
+    deadline = time.monotonic() + duration
+    counts = [0] * threads
+
+    def worker(index: int) -> None:
+        while time.monotonic() < deadline:
+            transport.call_tool("getTwitterUser", {"identifier": "bench"})
+            counts[index] += 1
+
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+    finally:
+        transport.close()
+    return sum(counts) / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    url = start_mock_server(args.latency)
+    print(f"{args.threads} threads, {args.latency * 1000:.0f} ms/tool call")
+    print(f"{'pool_size':>9}  {'calls/s':>8}")
+    for pool_size in args.pool_sizes:
+        rate = measure(url, pool_size, args.threads, args.duration)
+        print(f"{pool_size:>9}  {rate:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Throughput of the client ``validation`` modes.
+
+Parses 10k snake_case ``TwitterPost``, ``TiktokPost`` and ``InstagramUser``
+rows with ``parse_rows`` in each mode: ``"full"`` validates the page through
+the cached ``TypeAdapter`` and ``"none"`` hands the dicts back untouched.
+Every run gets fresh copies of the rows, made outside the timed region.
+The garbage collector is paused while timing. Exits non-zero if a mode that
+skips validation is not faster than ``"full"``.
+
+Run from repo root:
+    python benchmarks/bench_validation_modes.py [--rows 10000] [--repeat 7]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+from typing import Any
+
+from bench_json_decode import twitter_search_page
+
+from xpoz._rows import VALIDATION_MODES, Validation, parse_rows
+from xpoz._transform._field_mapping import map_list_of_dicts_to_snake
+from xpoz.types.instagram import InstagramUser
+from xpoz.types.tiktok import TiktokPost
+from xpoz.types.twitter import TwitterPost
+
+
+def tiktok_post_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": str(7360000000000000000 + row),
+            "post_type": 0,
+            "is_private": False,
+            "description": f"Clip {row} #ai #fyp",
+            "user_id": str(6800000000000000000 + row % 900),
+            "username": f"creator_{row % 900}",
+            "like_count": row * 7 % 100_000,
+            "comment_count": row % 400,
+            "play_count": row * 31 % 2_000_000,
+            "hashtags": ["ai", "fyp"],
+            "duration": 15 + row % 45,
+            "created_at": 1714564800 + row,
+            "created_at_date": "2024-05-01",
+        }
+        for row in range(rows)
+    ]
+
+
+def instagram_user_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": str(50000000000 + row),
+            "username": f"insta_{row}",
+            "full_name": f"Insta User {row}",
+            "biography": "Photos, mostly.",
+            "is_private": row % 9 == 0,
+            "is_verified": row % 97 == 0,
+            "follower_count": row * 13 % 500_000,
+            "following_count": row % 2_000,
+            "media_count": row % 700,
+        }
+        for row in range(rows)
+    ]
+
+
+def best_of(repeat: int, model: type[Any], rows: list[dict[str, Any]], mode: Validation) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        page = [dict(row) for row in rows]
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            parse_rows(model, page, mode)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    pages: dict[str, tuple[type[Any], list[dict[str, Any]]]] = {
+        "TwitterPost": (
+            TwitterPost,
+            map_list_of_dicts_to_snake(json.loads(twitter_search_page(args.rows))["results"]),
+        ),
+        "TiktokPost": (TiktokPost, tiktok_post_rows(args.rows)),
+        "InstagramUser": (InstagramUser, instagram_user_rows(args.rows)),
+    }
+    print(f"{'model':>14}  {'mode':>8}  {'ms':>8}  {'rows/s':>10}  {'vs full':>7}")
+    slower = []
+    for name, (model, rows) in pages.items():
+        full = best_of(args.repeat, model, rows, "full")
+        for mode in VALIDATION_MODES:
+            elapsed = full if mode == "full" else best_of(args.repeat, model, rows, mode)
+            print(
+                f"{name:>14}  {mode:>8}  {elapsed * 1000:>8.2f}  "
+                f"{len(rows) / elapsed:>10,.0f}  {full / elapsed:>6.1f}x"
+            )
+            if mode != "full" and elapsed >= full:
+                slower.append(f"{name} {mode}")
+    if slower:
+        raise SystemExit(f"Slower than full validation: {', '.join(slower)}")
+
+
+if __name__ == "__main__":
+    main()
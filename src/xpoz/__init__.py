@@ -4,6 +4,7 @@ from xpoz._exceptions import (
     XpozError,
     AuthenticationError,
     XpozConnectionError,
+    CircuitOpenError,
     OperationTimeoutError,
     OperationFailedError,
     OperationCancelledError,
@@ -12,8 +13,17 @@ from xpoz._exceptions import (
 )
 from xpoz._pagination import PaginatedResult, AsyncPaginatedResult
 from xpoz._cursor import CursorResult, AsyncCursorResult
+from xpoz._parquet import ParquetSink
+from xpoz._batch import BatchResult
+from xpoz._loader import BatchLoader, AsyncBatchLoader
+from xpoz._operation import OperationHandle, AsyncOperationHandle
 from xpoz._config._constants import ResponseType
+from xpoz._retry import RetryPolicy
+from xpoz._mcp._polling import PollingStrategy
+from xpoz._mcp._journal import OperationJournal
+from xpoz._cache import CacheStats, DiskCache, MemoryCache, ResponseCache
 from xpoz._update_check import XpozUpdateWarning
+from xpoz._json import json_backend, set_json_backend
 from xpoz._version import __version__
 
 __all__ = [
@@ -22,6 +32,7 @@ __all__ = [
     "XpozError",
     "AuthenticationError",
     "XpozConnectionError",
+    "CircuitOpenError",
     "OperationTimeoutError",
     "OperationFailedError",
     "OperationCancelledError",
@@ -31,7 +42,22 @@ __all__ = [
     "AsyncPaginatedResult",
     "CursorResult",
     "AsyncCursorResult",
+    "ParquetSink",
+    "BatchResult",
+    "BatchLoader",
+    "AsyncBatchLoader",
+    "OperationHandle",
+    "AsyncOperationHandle",
     "ResponseType",
+    "RetryPolicy",
+    "PollingStrategy",
+    "OperationJournal",
+    "ResponseCache",
+    "MemoryCache",
+    "DiskCache",
+    "CacheStats",
     "XpozUpdateWarning",
+    "set_json_backend",
+    "json_backend",
     "__version__",
 ]
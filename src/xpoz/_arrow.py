@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import types
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _import(module: str, extra: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"This method needs '{module}'; install it with pip install 'xpoz[{extra}]'"
+        ) from exc
+
+
+def require_pyarrow() -> Any:
+    return _import("pyarrow", "arrow")
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return args[0] if len(args) == 1 else Any
+    return annotation
+
+
+def _to_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_bool(value: Any) -> bool | None:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "1", "yes"):
+            return True
+        if lowered in ("false", "0", "no"):
+            return False
+        return None
+    return bool(value)
+
+
+def _to_json(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, default=str)
+
+
+def _column(annotation: Any) -> tuple[pa.DataType, Callable[[Any], Any]]:
+    """Arrow type for a model field and the conversion applied to raw values."""
+    pa = require_pyarrow()
+    annotation = _strip_optional(annotation)
+    if annotation is bool:
+        return pa.bool_(), _to_bool
+    if annotation is int:
+        return pa.int64(), _to_int
+    if annotation is float:
+        return pa.float64(), _to_float
+    if annotation is str or get_origin(annotation) is Literal:
+        return pa.string(), _to_str
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation) or (Any,)
+        item_type, convert_item = _column(item)
+
+        def convert_list(values: Any) -> list[Any] | None:
+            if not isinstance(values, list):
+                return None
+            return [None if value is None else convert_item(value) for value in values]
+
+        return pa.list_(item_type), convert_list
+    # Objects, dicts and anything else are kept as JSON text.
+    return pa.string(), _to_json
+
+
+class ArrowSchema:
+    """Arrow schema of a model, with per-column converters for raw rows.
+
+    Columns are the model's declared fields (or ``columns``), in order, so
+    every page produces the same schema whatever ``fields=`` projection was
+    used; fields missing from a row are null.
+    """
+
+    schema: pa.Schema
+
+    def __init__(self, model: type[BaseModel], columns: list[str] | None = None):
+        pa = require_pyarrow()
+        names = list(columns) if columns is not None else list(model.model_fields)
+        unknown = [name for name in names if name not in model.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown columns for {model.__name__}: {', '.join(unknown)}")
+        self.names = names
+        self._columns = [_column(model.model_fields[name].annotation) for name in names]
+        self.schema = pa.schema(
+            [pa.field(name, arrow_type) for name, (arrow_type, _) in zip(names, self._columns)]
+        )
+
+    def record_batch(self, rows: list[dict[str, Any]]) -> pa.RecordBatch:
+        pa = require_pyarrow()
+        arrays = []
+        for name, (arrow_type, convert) in zip(self.names, self._columns):
+            values = [row.get(name) for row in rows]
+            arrays.append(
+                pa.array(
+                    [None if value is None else convert(value) for value in values],
+                    type=arrow_type,
+                )
+            )
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def table(self, batches: Iterable[pa.RecordBatch]) -> pa.Table:
+        pa = require_pyarrow()
+        return pa.Table.from_batches(list(batches), schema=self.schema)
+
+
+def model_rows(items: list[Any]) -> list[dict[str, Any]]:
+    return [item.model_dump() if isinstance(item, BaseModel) else item for item in items]
+
+
+def to_pandas(table: pa.Table) -> Any:
+    _import("pandas", "pandas")
+    return table.to_pandas()
+
+
+def to_polars(table: pa.Table) -> Any:
+    polars = _import("polars", "polars")
+    return polars.from_arrow(table)
@@ -5,10 +5,18 @@ import threading
 from typing import Any
 
 from xpoz._mcp._transport import McpTransport
-from xpoz._mcp._polling import DEFAULT_TIMEOUT_SECONDS
+from xpoz._mcp._journal import OperationJournal, open_journal
+from xpoz._mcp._polling import DEFAULT_TIMEOUT_SECONDS, PollingStrategy
+from xpoz._mcp._scheduler import DEFAULT_MAX_POLL_QPS, AsyncPollScheduler
+from xpoz._batch import DEFAULT_BATCH_CONCURRENCY, DEFAULT_MAX_BATCH_SIZE
+from xpoz._cache import ResponseCache
 from xpoz._exceptions import AuthenticationError
+from xpoz._operation import AsyncOperationHandle
+from xpoz._retry import RetryPolicy
+from xpoz._rows import Validation, check_validation
 from xpoz._config._constants import DEFAULT_SERVER_URL, ENV_API_KEY, ENV_SERVER_URL
 from xpoz._config._routes import DEFAULT_API_URL, ENV_API_URL
+from xpoz._singleflight import AsyncSingleFlight
 from xpoz._rest import AsyncRestTransport
 from xpoz._update_check import check_for_update
 from xpoz.namespaces.twitter import AsyncTwitterNamespace
@@ -29,9 +37,42 @@ class AsyncXpozClient:
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
         check_update: bool = True,
         api_url: str | None = None,
+        retry: RetryPolicy | None = None,
+        polling: PollingStrategy | None = None,
+        max_poll_qps: float = DEFAULT_MAX_POLL_QPS,
+        journal: str | os.PathLike[str] | OperationJournal | None = None,
+        cache: ResponseCache | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        validation: Validation = "full",
         _user_agent: str | None = None,
     ):
         """
+        retry: Backoff and circuit-breaker settings shared by the MCP and
+        REST transports. Defaults to ``RetryPolicy()``.
+
+        polling: How long to wait between status checks while a server-side
+        operation runs. Defaults to ``PollingStrategy()``.
+
+        max_poll_qps: Ceiling on status checks per second across every
+        operation this client is waiting on.
+
+        journal: SQLite file (or ``OperationJournal``) recording pending
+        server-side operations, so a restarted process re-attaches to them
+        instead of submitting the same work again. See ``resume_pending()``.
+
+        cache: Response cache (e.g. ``MemoryCache()``) consulted before each
+        read-only tool call. Calls with ``force_latest=True`` skip it.
+
+        max_batch_size, batch_concurrency: ``*_by_ids`` and ``get_users``
+        calls split their ids into chunks of at most ``max_batch_size`` and
+        fetch up to ``batch_concurrency`` chunks at once.
+
+        validation: How returned items are built. ``"full"`` validates
+        every field with pydantic; ``"none"`` skips validation and returns
+        plain snake_case dicts. Composite results such as
+        ``RedditPostWithComments`` and account details are always models.
+
         _user_agent: Private API. Reserved for first-party Xpoz clients
         (CLI, IDE plugins, etc.) to set their own canonical User-Agent for
         server-side telemetry. When set, replaces the SDK's default
@@ -50,11 +91,26 @@ class AsyncXpozClient:
         self._user_agent_override = _user_agent
         self._rest_transport: AsyncRestTransport | None = None
         self._timeout = timeout
+        self._retry = retry or RetryPolicy()
+        self._polling = polling or PollingStrategy()
+        self._journal = open_journal(journal)
+        self._cache = cache
+        self._max_batch_size = max_batch_size
+        self._batch_concurrency = batch_concurrency
+        self._validation = check_validation(validation)
+        self._singleflight: AsyncSingleFlight[dict[str, Any]] = AsyncSingleFlight()
+        self._owns_journal = self._journal is not None and journal is not self._journal
         self._transport = McpTransport(
             self._server_url,
             self._api_key,
+            retry=self._retry,
             _user_agent=_user_agent,
         )
+        self._poller = AsyncPollScheduler(
+            self._transport.call_tool,
+            strategy=self._polling,
+            max_qps=max_poll_qps,
+        )
         self._connected = False
         self._check_update = check_update
 
@@ -69,26 +125,77 @@ class AsyncXpozClient:
     async def connect(self) -> None:
         if not self._connected:
             await self._transport.connect()
+            await self._poller.start()
             self._connected = True
-            self.twitter = AsyncTwitterNamespace(self._transport.call_tool, self._timeout)
-            self.instagram = AsyncInstagramNamespace(self._transport.call_tool, self._timeout)
-            self.reddit = AsyncRedditNamespace(self._transport.call_tool, self._timeout)
-            self.tiktok = AsyncTiktokNamespace(self._transport.call_tool, self._timeout)
-            self.tracking = AsyncTrackingNamespace(self._transport.call_tool, self._timeout)
-            self.account = AsyncAccountNamespace(self._transport.call_tool, self._timeout)
+            call_tool = self._transport.call_tool
+            options = self._namespace_options()
+            self.twitter = AsyncTwitterNamespace(call_tool, self._timeout, **options)
+            self.instagram = AsyncInstagramNamespace(call_tool, self._timeout, **options)
+            self.reddit = AsyncRedditNamespace(call_tool, self._timeout, **options)
+            self.tiktok = AsyncTiktokNamespace(call_tool, self._timeout, **options)
+            self.tracking = AsyncTrackingNamespace(call_tool, self._timeout, **options)
+            self.account = AsyncAccountNamespace(call_tool, self._timeout, **options)
 
             if self._check_update:
                 threading.Thread(target=check_for_update, daemon=True, name="xpoz-update-check").start()
 
+    def _namespace_options(self) -> dict[str, Any]:
+        return {
+            "polling": self._polling,
+            "poller": self._poller,
+            "journal": self._journal,
+            "cache": self._cache,
+            "singleflight": self._singleflight,
+            "max_batch_size": self._max_batch_size,
+            "batch_concurrency": self._batch_concurrency,
+            "validation": self._validation,
+        }
+
+    async def resume_pending(self) -> list[AsyncOperationHandle[dict[str, Any]]]:
+        """Re-attach to the operations recorded in the journal.
+
+        Each handle resolves to the raw tool result of one operation left
+        running by an earlier process; ``handle.tool_name`` tells which tool
+        produced it. Calling the original method again with the same
+        arguments picks up the same operation as well.
+        """
+        if self._journal is None:
+            return []
+        if not self._connected:
+            await self.connect()
+        journal = self._journal
+
+        async def raw_result(outcomes: list[dict[str, Any] | BaseException]) -> dict[str, Any]:
+            (outcome,) = outcomes
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+        handles: list[AsyncOperationHandle[dict[str, Any]]] = []
+        for entry in journal.pending():
+            op = self._poller.register(entry.operation_id, self._timeout)
+            handles.append(
+                AsyncOperationHandle(
+                    self._poller,
+                    [op],
+                    raw_result,
+                    operation_id=entry.operation_id,
+                    tool_name=entry.tool_name,
+                    on_done=journal.finish,
+                )
+            )
+        return handles
+
     @property
     def instagram_live(self) -> AsyncInstagramLiveNamespace:
-        return AsyncInstagramLiveNamespace(self._rest())
+        return AsyncInstagramLiveNamespace(self._rest(), validation=self._validation)
 
     def _rest(self) -> AsyncRestTransport:
         if self._rest_transport is None:
             self._rest_transport = AsyncRestTransport(
                 self._api_url,
                 self._api_key,
+                retry=self._retry,
                 _user_agent=self._user_agent_override,
             )
         return self._rest_transport
@@ -98,8 +205,11 @@ class AsyncXpozClient:
             await self._rest_transport.close()
             self._rest_transport = None
         if self._connected:
+            await self._poller.aclose()
             await self._transport.close()
             self._connected = False
+        if self._owns_journal and self._journal is not None:
+            self._journal.close()
 
     async def __aenter__(self) -> AsyncXpozClient:
         await self.connect()
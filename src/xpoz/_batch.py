@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+class BatchResult(list[T], Generic[T]):
+    """Items fetched for a list of ids, in the order the ids were given.
+
+    ``missing`` lists ids the server returned nothing for. When a chunk
+    fails its first error is raised, unless the call passed
+    ``allow_partial=True``: then ``failed`` maps the ids of failed chunks to
+    their exception (an error is still raised when every chunk fails).
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        *,
+        missing: list[str] | None = None,
+        failed: dict[str, BaseException] | None = None,
+    ):
+        super().__init__(items)
+        self.missing: list[str] = missing or []
+        self.failed: dict[str, BaseException] = failed or {}
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing and not self.failed
+
+
+def chunked(ids: list[str], size: int) -> list[list[str]]:
+    unique = list(dict.fromkeys(ids))
+    return [unique[i : i + size] for i in range(0, len(unique), size)] or [[]]
+
+
+def assemble(
+    ids: list[str],
+    chunks: list[list[str]],
+    outcomes: list[list[dict[str, Any]] | BaseException],
+    key_field: str,
+    *,
+    case_insensitive: bool = False,
+    allow_partial: bool = False,
+) -> tuple[list[dict[str, Any]], list[str], dict[str, BaseException]]:
+    """Reorder chunk results to follow ``ids``; returns (rows, missing, failed).
+
+    Rows are matched to ids through ``key_field``.
+    """
+
+    def normalize(value: Any) -> str:
+        text = str(value)
+        return text.lower() if case_insensitive else text
+
+    errors = [o for o in outcomes if isinstance(o, BaseException)]
+    if errors and (not allow_partial or len(errors) == len(outcomes)):
+        raise errors[0]
+
+    failed: dict[str, BaseException] = {}
+    rows: list[dict[str, Any]] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, BaseException):
+            failed.update(dict.fromkeys(chunk, outcome))
+        else:
+            rows.extend(outcome)
+
+    by_key: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        key = row.get(key_field)
+        if key is None:
+            # Without the id field (e.g. excluded via fields=) rows cannot be
+            # matched to ids; keep the server's order instead.
+            return rows, [], failed
+        by_key.setdefault(normalize(key), row)
+
+    ordered: list[dict[str, Any]] = []
+    missing: list[str] = []
+    for requested in dict.fromkeys(ids):
+        match = by_key.get(normalize(requested))
+        if match is not None:
+            ordered.append(match)
+        elif requested not in failed:
+            missing.append(requested)
+    return ordered, missing, failed
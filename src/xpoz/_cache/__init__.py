@@ -0,0 +1,5 @@
+from xpoz._cache._base import CacheStats, ResponseCache, cache_key
+from xpoz._cache._disk import DiskCache
+from xpoz._cache._memory import MemoryCache
+
+__all__ = ["CacheStats", "DiskCache", "MemoryCache", "ResponseCache", "cache_key"]
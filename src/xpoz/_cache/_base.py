@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import abc
+import hashlib
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from xpoz._config import _tools
+from xpoz._json import canonical_dumps, dumps, loads
+
+DEFAULT_CACHE_TTL = 300.0
+
+# Account state changes with every billed call, so it is never cached unless
+# the caller sets a TTL for these tools explicitly.
+DEFAULT_TOOL_TTLS: Mapping[str, float] = {
+    _tools.GET_ACCOUNT_DETAILS: 0.0,
+    _tools.GET_CREDITS_USAGE_HISTORY: 0.0,
+}
+
+
+def canonical_arguments(arguments: dict[str, Any]) -> str:
+    """Serialize tool arguments so equal requests give equal strings."""
+    return canonical_dumps(arguments)
+
+
+def cache_key(tool_name: str, arguments: dict[str, Any]) -> str:
+    digest = hashlib.sha256(tool_name.encode())
+    digest.update(b"\0")
+    digest.update(canonical_arguments(arguments).encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    bypasses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache(abc.ABC):
+    """Base class for caches of raw tool responses keyed on (tool, arguments).
+
+    Subclasses store serialized payloads through ``_load``/``_save``; this
+    class handles keys, TTLs and the hit/miss counters. Lookups for calls
+    with ``forceLatest`` set always miss, but their fresh result is stored.
+    """
+
+    def __init__(self, *, ttl: float = DEFAULT_CACHE_TTL, ttls: Mapping[str, float] | None = None):
+        self._ttl = ttl
+        self._ttls = {**DEFAULT_TOOL_TTLS, **(ttls or {})}
+        self._counter_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+        self._evictions = 0
+
+    def ttl_for(self, tool_name: str) -> float:
+        return self._ttls.get(tool_name, self._ttl)
+
+    def get(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any] | None:
+        if arguments.get("forceLatest") or self.ttl_for(tool_name) <= 0:
+            self._count(bypasses=1)
+            return None
+        data = self._load(cache_key(tool_name, arguments))
+        if data is None:
+            self._count(misses=1)
+            return None
+        self._count(hits=1)
+        value: dict[str, Any] = loads(data)
+        return value
+
+    def set(self, tool_name: str, arguments: dict[str, Any], value: dict[str, Any]) -> None:
+        ttl = self.ttl_for(tool_name)
+        if ttl <= 0:
+            return
+        data = dumps(value)
+        self._save(cache_key(tool_name, arguments), data, ttl)
+
+    def stats(self) -> CacheStats:
+        entries, size = self._usage()
+        with self._counter_lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                bypasses=self._bypasses,
+                evictions=self._evictions,
+                entries=entries,
+                bytes=size,
+            )
+
+    @abc.abstractmethod
+    def clear(self) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+    def _count(
+        self, *, hits: int = 0, misses: int = 0, bypasses: int = 0, evictions: int = 0
+    ) -> None:
+        with self._counter_lock:
+            self._hits += hits
+            self._misses += misses
+            self._bypasses += bypasses
+            self._evictions += evictions
+
+    @abc.abstractmethod
+    def _load(self, key: str) -> bytes | None: ...
+
+    @abc.abstractmethod
+    def _save(self, key: str, data: bytes, ttl: float) -> None: ...
+
+    @abc.abstractmethod
+    def _usage(self) -> tuple[int, int]: ...
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Mapping
+
+from xpoz._cache._base import DEFAULT_CACHE_TTL, ResponseCache
+
+DEFAULT_DISK_MAX_BYTES = 512 * 1024 * 1024
+
+# Reads refresh an entry's LRU position at most this often, so a hot entry
+# does not turn every lookup into a write.
+_TOUCH_INTERVAL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires_at);
+
+-- Running total of stored bytes, so eviction need not scan the table.
+CREATE TABLE IF NOT EXISTS cache_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total_size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_meta
+    SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN
+    UPDATE cache_meta SET total_size = total_size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size ON responses BEGIN
+    UPDATE cache_meta SET total_size = total_size - OLD.size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN
+    UPDATE cache_meta SET total_size = total_size - OLD.size;
+END;
+"""
+
+
+class DiskCache(ResponseCache):
+    """Response cache in a SQLite file, shared by every process that opens it.
+
+    The database runs in WAL mode, so readers never block on a writer and
+    short-lived processes on one machine reuse each other's results.
+    Payloads are zlib-compressed; ``max_bytes`` bounds their compressed size
+    and the least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Mapping[str, float] | None = None,
+        compress_level: int = 6,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls)
+        self.path = os.fspath(path)
+        self._max_bytes = max_bytes
+        self._compress_level = compress_level
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, accessed_at FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            data, accessed_at = row
+            if now - accessed_at > _TOUCH_INTERVAL:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        return zlib.decompress(data)
+
+    def _save(self, key: str, data: bytes, ttl: float) -> None:
+        blob = zlib.compress(data, self._compress_level)
+        if len(blob) > self._max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO responses VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE"
+                    " SET data = excluded.data, size = excluded.size,"
+                    " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (key, blob, len(blob), now + ttl, now),
+                )
+                evicted = self._evict(now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if evicted:
+            self._count(evictions=evicted)
+
+    def _evict(self, now: float) -> int:
+        evicted = self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (now,)
+        ).rowcount
+        (total,) = self._conn.execute("SELECT total_size FROM cache_meta").fetchone()
+        if total <= self._max_bytes:
+            return evicted
+        victims: list[str] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total <= self._max_bytes:
+                break
+            victims.append(key)
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in victims])
+        return evicted + len(victims)
+
+    def _usage(self) -> tuple[int, int]:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        return count, size
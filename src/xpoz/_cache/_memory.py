@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from xpoz._cache._base import DEFAULT_CACHE_TTL, ResponseCache
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache bounded by entry count and payload bytes.
+
+    Payloads are kept serialized, so the byte bound is exact and callers
+    never share mutable results. Thread-safe; one instance can back both a
+    sync and an async client.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Mapping[str, float] | None = None,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _load(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def _save(self, key: str, data: bytes, ttl: float) -> None:
+        if len(data) > self._max_bytes:
+            return
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._bytes += len(data)
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._drop(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self._count(evictions=evicted)
+
+    def _drop(self, key: str) -> None:
+        _, data = self._entries.pop(key)
+        self._bytes -= len(data)
+
+    def _usage(self) -> tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._bytes
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Awaitable, Callable, Generic, Iterator, TypeVar
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, aclosing
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from xpoz._arrow import to_pandas, to_polars
+from xpoz._page_stream import page_stream
+from xpoz._rows import RowBacked, Validation
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 T = TypeVar("T")
 
 
-class CursorResult(Generic[T]):
+class CursorResult(RowBacked[T]):
     def __init__(
         self,
-        data: list[T],
+        data: list[T] | None,
         has_more: bool,
         next_page_cursor: str | None,
         fetch_page: Callable[[str], CursorResult[T]],
+        *,
+        model: type[Any] | None = None,
+        rows: list[dict[str, Any]] | None = None,
+        validation: Validation = "full",
     ):
-        self.data = data
+        self._init_rows(data, model, rows, validation)
         self.has_more = has_more
         self.next_page_cursor = next_page_cursor
         self._fetch_page = fetch_page
@@ -26,17 +40,57 @@ class CursorResult(Generic[T]):
             raise IndexError("No more pages available")
         return self._fetch_page(self.next_page_cursor or "")
 
-    def iter_pages(self) -> Iterator[CursorResult[T]]:
+    def iter_pages(self, *, prefetch: bool = False) -> Iterator[CursorResult[T]]:
+        """Yield this page and every following one, fetching each on demand.
+
+        With ``prefetch=True`` the request for the next cursor starts on a
+        background thread as soon as a page arrives, so it overlaps with
+        the caller's work on that page. Its errors are raised when the loop
+        reaches it. Leaving the loop early abandons the prefetch: a request
+        already sent still completes and its result is discarded.
+        """
         page = self
-        yield page
-        while page.has_next_page():
-            page = page.next_page()
+        if not prefetch:
             yield page
-
-    def iter_items(self) -> Iterator[T]:
-        for page in self.iter_pages():
+            while page.has_next_page():
+                page = page.next_page()
+                yield page
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xpoz-cursor-prefetch")
+        try:
+            while True:
+                pending = executor.submit(page.next_page) if page.has_next_page() else None
+                yield page
+                if pending is None:
+                    return
+                page = pending.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_items(self, *, prefetch: bool = False) -> Iterator[T]:
+        for page in self.iter_pages(prefetch=prefetch):
             yield from page.data
 
+    def iter_record_batches(
+        self, *, columns: list[str] | None = None, prefetch: bool = False
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield an Arrow record batch per page, built without model objects."""
+        schema = self._arrow_schema(columns)
+        for page in self.iter_pages(prefetch=prefetch):
+            yield schema.record_batch(page._raw_rows())
+
+    def to_arrow(self, *, columns: list[str] | None = None) -> pa.Table:
+        schema = self._arrow_schema(columns)
+        # Every page is read, so fetching ahead costs no extra requests.
+        return schema.table(self.iter_record_batches(columns=columns, prefetch=True))
+
+    def to_pandas(self, *, columns: list[str] | None = None) -> Any:
+        return to_pandas(self.to_arrow(columns=columns))
+
+    def to_polars(self, *, columns: list[str] | None = None) -> Any:
+        return to_polars(self.to_arrow(columns=columns))
+
     def __iter__(self) -> Iterator[T]:
         return iter(self.data)
 
@@ -47,15 +101,19 @@ class CursorResult(Generic[T]):
         return f"CursorResult(items={len(self.data)}, has_more={self.has_more})"
 
 
-class AsyncCursorResult(Generic[T]):
+class AsyncCursorResult(RowBacked[T]):
     def __init__(
         self,
-        data: list[T],
+        data: list[T] | None,
         has_more: bool,
         next_page_cursor: str | None,
         fetch_page: Callable[[str], Awaitable[AsyncCursorResult[T]]],
+        *,
+        model: type[Any] | None = None,
+        rows: list[dict[str, Any]] | None = None,
+        validation: Validation = "full",
     ):
-        self.data = data
+        self._init_rows(data, model, rows, validation)
         self.has_more = has_more
         self.next_page_cursor = next_page_cursor
         self._fetch_page = fetch_page
@@ -68,17 +126,66 @@ class AsyncCursorResult(Generic[T]):
             raise IndexError("No more pages available")
         return await self._fetch_page(self.next_page_cursor or "")
 
-    async def iter_pages(self) -> Any:
+    async def iter_pages(self) -> AsyncGenerator[AsyncCursorResult[T], None]:
+        """Yield this page and every following one, fetching each on demand.
+
+        To request the next page while the current one is being worked on,
+        use ``stream_pages()``.
+        """
         page = self
         yield page
         while page.has_next_page():
             page = await page.next_page()
             yield page
 
-    async def iter_items(self) -> Any:
-        async for page in self.iter_pages():
-            for item in page.data:
-                yield item
+    def stream_pages(self) -> AbstractAsyncContextManager[AsyncIterator[AsyncCursorResult[T]]]:
+        """Iterate this page and every following one, one request ahead.
+
+        The next page is requested in the background as soon as the consumer
+        takes a page, and its errors are raised when the loop reaches it. The
+        request runs while the consumer holds a page, so it belongs to an
+        ``async with`` block; leaving the block cancels it::
+
+            async with result.stream_pages() as pages:
+                async for page in pages:
+                    ...
+        """
+
+        async def produce(emit: Callable[[AsyncCursorResult[T]], Awaitable[None]]) -> None:
+            page = self
+            await emit(page)
+            while page.has_next_page():
+                page = await page.next_page()
+                await emit(page)
+
+        return page_stream(produce)
+
+    async def iter_items(self) -> AsyncGenerator[T, None]:
+        async with aclosing(self.iter_pages()) as pages:
+            async for page in pages:
+                for item in page.data:
+                    yield item
+
+    async def iter_record_batches(
+        self, *, columns: list[str] | None = None
+    ) -> AsyncGenerator[pa.RecordBatch, None]:
+        """Yield an Arrow record batch per page, built without model objects."""
+        schema = self._arrow_schema(columns)
+        async with aclosing(self.iter_pages()) as pages:
+            async for page in pages:
+                yield schema.record_batch(page._raw_rows())
+
+    async def to_arrow(self, *, columns: list[str] | None = None) -> pa.Table:
+        schema = self._arrow_schema(columns)
+        # Every page is read, so fetching ahead costs no extra requests.
+        async with self.stream_pages() as pages:
+            return schema.table([schema.record_batch(page._raw_rows()) async for page in pages])
+
+    async def to_pandas(self, *, columns: list[str] | None = None) -> Any:
+        return to_pandas(await self.to_arrow(columns=columns))
+
+    async def to_polars(self, *, columns: list[str] | None = None) -> Any:
+        return to_polars(await self.to_arrow(columns=columns))
 
     def __iter__(self) -> Iterator[T]:
         return iter(self.data)
@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import anyio
+import httpx
+
+from xpoz._exceptions import XpozConnectionError, XpozError
+from xpoz._rest._transport import _raise_for_status
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_DOWNLOAD_PARTS = 4
+
+_DOWNLOAD_TIMEOUT_SECONDS = 300.0
+# Consecutive connection failures tolerated before a download gives up.
+_MAX_RESUMES = 5
+# Files smaller than this per part are not worth splitting further.
+_MIN_PART_BYTES = 8 * 1024 * 1024
+_STATE_SAVE_INTERVAL = 1.0
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _split(chunk: bytes, size: int) -> Iterator[bytes]:
+    # httpx's own chunk_size waits until a chunk is full; this only caps it.
+    for start in range(0, len(chunk), size):
+        yield chunk[start : start + size]
+
+
+def _range_headers(start: int = 0, end: int | None = None) -> dict[str, str]:
+    # Byte offsets must refer to the stored file, so ask for it unencoded.
+    headers = {"Accept-Encoding": "identity"}
+    if start or end is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    return headers
+
+
+def _client() -> httpx.Client:
+    return httpx.Client(timeout=_DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True)
+
+
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=_DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True)
+
+
+def _zstd_decompressobj() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "This export is zstd-compressed; install 'zstandard' (pip install 'xpoz[zstd]')"
+        ) from exc
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
+class _Decoder:
+    """Decompresses gzip or zstd streams, recognized by their magic bytes.
+
+    Anything else passes through unchanged. Concatenated gzip members are
+    decoded one after another.
+    """
+
+    def __init__(self) -> None:
+        self._head = b""
+        self._decode: Callable[[bytes], bytes] | None = None
+        self._gzip: Any = None
+
+    def feed(self, data: bytes) -> bytes:
+        if self._decode is None:
+            self._head += data
+            if len(self._head) < len(_ZSTD_MAGIC):
+                return b""
+            data, self._head = self._head, b""
+            self._decode = self._pick(data)
+        return self._decode(data)
+
+    def flush(self) -> bytes:
+        if self._decode is None:
+            data, self._head = self._head, b""
+            self._decode = self._pick(data)
+            return self._decode(data)
+        return b""
+
+    def _pick(self, head: bytes) -> Callable[[bytes], bytes]:
+        if head.startswith(_GZIP_MAGIC):
+            return self._gunzip
+        if head.startswith(_ZSTD_MAGIC):
+            return _zstd_decompressobj().decompress  # type: ignore[no-any-return]
+        return _passthrough
+
+    def _gunzip(self, data: bytes) -> bytes:
+        gzip = self._gzip or zlib.decompressobj(zlib.MAX_WBITS | 16)
+        out = [gzip.decompress(data)]
+        while gzip.eof and gzip.unused_data:
+            rest = gzip.unused_data
+            gzip = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            out.append(gzip.decompress(rest))
+        self._gzip = gzip
+        return b"".join(out)
+
+
+def _passthrough(data: bytes) -> bytes:
+    return data
+
+
+def is_compressed(head: bytes) -> bool:
+    return head.startswith((_GZIP_MAGIC, _ZSTD_MAGIC))
+
+
+def decode_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    decoder = _Decoder()
+    for chunk in chunks:
+        data = decoder.feed(chunk)
+        if data:
+            yield data
+    data = decoder.flush()
+    if data:
+        yield data
+
+
+async def adecode_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    decoder = _Decoder()
+    async for chunk in chunks:
+        data = decoder.feed(chunk)
+        if data:
+            yield data
+    data = decoder.flush()
+    if data:
+        yield data
+
+
+def iter_download(url: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Stream the raw body at ``url`` in chunks of at most ``chunk_size`` bytes.
+
+    A dropped connection is picked up where it stopped with a Range request,
+    as long as the server honours them.
+    """
+    received = 0
+    failures = 0
+    with _client() as client:
+        while True:
+            try:
+                with client.stream("GET", url, headers=_range_headers(received)) as response:
+                    _check_status_streamed(response, received)
+                    for chunk in response.iter_raw():
+                        received += len(chunk)
+                        failures = 0
+                        yield from _split(chunk, chunk_size)
+                return
+            except httpx.TransportError as error:
+                failures += 1
+                if failures > _MAX_RESUMES:
+                    raise XpozConnectionError(str(error)) from error
+            except httpx.HTTPError as error:
+                raise XpozConnectionError(str(error)) from error
+
+
+async def aiter_download(
+    url: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    received = 0
+    failures = 0
+    async with _async_client() as client:
+        while True:
+            try:
+                async with client.stream(
+                    "GET", url, headers=_range_headers(received)
+                ) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                    _check_status_streamed(response, received)
+                    async for chunk in response.aiter_raw():
+                        received += len(chunk)
+                        failures = 0
+                        for piece in _split(chunk, chunk_size):
+                            yield piece
+                return
+            except httpx.TransportError as error:
+                failures += 1
+                if failures > _MAX_RESUMES:
+                    raise XpozConnectionError(str(error)) from error
+            except httpx.HTTPError as error:
+                raise XpozConnectionError(str(error)) from error
+
+
+def _check_status_streamed(response: httpx.Response, received: int) -> None:
+    if response.status_code >= 400:
+        if not response.is_stream_consumed:
+            response.read()
+        _raise_for_status(response)
+    if received and response.status_code != 206:
+        raise XpozConnectionError(
+            "Export download was interrupted and the server does not support resuming it"
+        )
+
+
+class _RangePlan:
+    """Byte ranges of one download and how much of each is on disk.
+
+    Progress lives next to the target as ``<name>.part.json``; it is only
+    reused when the remote file still has the same size and validator.
+    """
+
+    def __init__(self, target: Path, size: int, validator: str | None, parts: int):
+        self.target = target
+        self.partial = target.with_name(target.name + ".part")
+        self.state_path = target.with_name(target.name + ".part.json")
+        self.size = size
+        self.validator = validator
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+        loaded = self._load()
+        self.ranges: list[list[int]] = self._split(parts) if loaded is None else loaded
+        if loaded is None:
+            with open(self.partial, "wb") as file:
+                file.truncate(size)
+            self.save()
+
+    def _load(self) -> list[list[int]] | None:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if (
+            state.get("size") != self.size
+            or state.get("validator") != self.validator
+            or not self.partial.exists()
+        ):
+            return None
+        ranges: list[list[int]] = state["ranges"]
+        return ranges
+
+    def _split(self, parts: int) -> list[list[int]]:
+        count = max(1, min(parts, self.size // _MIN_PART_BYTES))
+        step = -(-self.size // count)
+        # [start, end inclusive, bytes done]
+        return [
+            [start, min(start + step, self.size) - 1, 0]
+            for start in range(0, self.size, step)
+        ]
+
+    def pending(self) -> list[tuple[int, int, int]]:
+        return [
+            (index, start + done, end)
+            for index, (start, end, done) in enumerate(self.ranges)
+            if start + done <= end
+        ]
+
+    def advance(self, index: int, nbytes: int) -> None:
+        with self._lock:
+            self.ranges[index][2] += nbytes
+            if time.monotonic() - self._saved_at >= _STATE_SAVE_INTERVAL:
+                self._save_locked()
+
+    def save(self) -> None:
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        state = {"size": self.size, "validator": self.validator, "ranges": self.ranges}
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp.write_text(json.dumps(state))
+        tmp.replace(self.state_path)
+        self._saved_at = time.monotonic()
+
+    def complete(self, *, decompress: bool) -> Path:
+        with open(self.partial, "rb") as file:
+            compressed = is_compressed(file.read(len(_ZSTD_MAGIC)))
+        if decompress and compressed:
+            _decode_file(self.partial, self.target)
+            self.partial.unlink()
+        else:
+            self.partial.replace(self.target)
+        self.state_path.unlink(missing_ok=True)
+        return self.target
+
+
+def _decode_file(source: Path, target: Path) -> None:
+    decoding = target.with_name(target.name + ".decoding")
+    with open(source, "rb") as src, open(decoding, "wb") as dst:
+        dst.writelines(decode_chunks(iter(lambda: src.read(DEFAULT_CHUNK_SIZE), b"")))
+    decoding.replace(target)
+
+
+def _parse_probe(response: httpx.Response) -> tuple[int, str | None] | None:
+    """(size, validator) from a ``bytes=0-0`` probe, or None without range support."""
+    if response.status_code != 206:
+        return None
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    if not total.isdigit() or int(total) == 0:
+        return None
+    return int(total), response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def _write_stream(
+    path: Path, chunks: Iterable[bytes], *, decompress: bool
+) -> Path:
+    partial = path.with_name(path.name + ".part")
+    try:
+        with open(partial, "wb") as file:
+            file.writelines(decode_chunks(chunks) if decompress else chunks)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(path)
+    return path
+
+
+def download_to(
+    url: str,
+    path: str | os.PathLike[str],
+    *,
+    parts: int = DEFAULT_DOWNLOAD_PARTS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    decompress: bool = True,
+) -> Path:
+    """Download ``url`` to ``path`` in ``parts`` parallel byte ranges.
+
+    Ranges are written at their offsets in ``<path>.part`` and progress is
+    saved to ``<path>.part.json``, so calling this again after a failure
+    resumes the missing bytes. Servers without Range support get a plain
+    streamed download. Compressed files are decoded once complete.
+    """
+    target = Path(path)
+    with _client() as client:
+        with client.stream("GET", url, headers=_range_headers(0, 0)) as probe:
+            _check_status_streamed(probe, 0)
+            info = _parse_probe(probe)
+        if info is None:
+            return _write_stream(
+                target, iter_download(url, chunk_size=chunk_size), decompress=decompress
+            )
+
+        plan = _RangePlan(target, *info, parts)
+        stop = threading.Event()
+
+        def fetch(index: int, start: int, end: int) -> None:
+            failures = 0
+            with open(plan.partial, "r+b") as file:
+                while start <= end and not stop.is_set():
+                    offset = start
+                    try:
+                        with client.stream(
+                            "GET", url, headers=_range_headers(start, end)
+                        ) as response:
+                            _check_range(response)
+                            file.seek(start)
+                            for chunk in response.iter_raw():
+                                chunk = chunk[: end - start + 1]
+                                file.write(chunk)
+                                file.flush()
+                                start += len(chunk)
+                                plan.advance(index, len(chunk))
+                                failures = 0
+                                if stop.is_set() or start > end:
+                                    break
+                    except httpx.TransportError as error:
+                        failures += 1
+                        if failures > _MAX_RESUMES:
+                            raise XpozConnectionError(str(error)) from error
+                    except httpx.HTTPError as error:
+                        raise XpozConnectionError(str(error)) from error
+                    else:
+                        failures = _count_stalled(start, offset, failures)
+
+        pending = plan.pending()
+        try:
+            if pending:
+                with ThreadPoolExecutor(
+                    max_workers=len(pending), thread_name_prefix="xpoz-download"
+                ) as pool:
+                    futures = [pool.submit(fetch, *task) for task in pending]
+                    try:
+                        for future in futures:
+                            future.result()
+                    except BaseException:
+                        stop.set()
+                        raise
+        finally:
+            plan.save()
+    return plan.complete(decompress=decompress)
+
+
+def _count_stalled(start: int, offset: int, failures: int) -> int:
+    """Count a range response that ended cleanly without data as a failure.
+
+    A server that keeps answering with an empty or short ``206`` body raises
+    no transport error, so without this the range would be re-requested
+    forever.
+    """
+    if start > offset:
+        return failures
+    failures += 1
+    if failures > _MAX_RESUMES:
+        raise XpozConnectionError("Server stopped sending the bytes of a ranged download")
+    return failures
+
+
+def _check_range(response: httpx.Response) -> None:
+    if response.status_code >= 400:
+        if not response.is_stream_consumed:
+            response.read()
+        _raise_for_status(response)
+    if response.status_code != 206:
+        raise XpozConnectionError("Server ignored the Range header of a ranged download")
+
+
+async def adownload_to(
+    url: str,
+    path: str | os.PathLike[str],
+    *,
+    parts: int = DEFAULT_DOWNLOAD_PARTS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    decompress: bool = True,
+) -> Path:
+    """Async counterpart of ``download_to``; ranges are fetched as tasks."""
+    target = Path(path)
+    async with _async_client() as client:
+        async with client.stream("GET", url, headers=_range_headers(0, 0)) as probe:
+            if probe.status_code >= 400:
+                await probe.aread()
+            _check_status_streamed(probe, 0)
+            info = _parse_probe(probe)
+        if info is None:
+            partial = target.with_name(target.name + ".part")
+            chunks = aiter_download(url, chunk_size=chunk_size)
+            try:
+                async with await anyio.open_file(partial, "wb") as file:
+                    async for chunk in adecode_chunks(chunks) if decompress else chunks:
+                        await file.write(chunk)
+            except BaseException:
+                partial.unlink(missing_ok=True)
+                raise
+            await anyio.to_thread.run_sync(partial.replace, target)
+            return target
+
+        plan = await anyio.to_thread.run_sync(_RangePlan, target, *info, parts)
+        errors: list[Exception] = []
+
+        async def fetch(index: int, start: int, end: int, task_group: Any) -> None:
+            failures = 0
+            try:
+                async with await anyio.open_file(plan.partial, "r+b") as file:
+                    while start <= end:
+                        offset = start
+                        try:
+                            async with client.stream(
+                                "GET", url, headers=_range_headers(start, end)
+                            ) as response:
+                                if response.status_code >= 400:
+                                    await response.aread()
+                                _check_range(response)
+                                await file.seek(start)
+                                async for chunk in response.aiter_raw():
+                                    chunk = chunk[: end - start + 1]
+                                    await file.write(chunk)
+                                    await file.flush()
+                                    start += len(chunk)
+                                    plan.advance(index, len(chunk))
+                                    failures = 0
+                                    if start > end:
+                                        break
+                        except httpx.TransportError as error:
+                            failures += 1
+                            if failures > _MAX_RESUMES:
+                                raise XpozConnectionError(str(error)) from error
+                        except httpx.HTTPError as error:
+                            raise XpozConnectionError(str(error)) from error
+                        else:
+                            failures = _count_stalled(start, offset, failures)
+            except (XpozError, OSError) as exc:
+                errors.append(exc)
+                task_group.cancel_scope.cancel()
+
+        try:
+            async with anyio.create_task_group() as task_group:
+                for task in plan.pending():
+                    task_group.start_soon(fetch, *task, task_group)
+        finally:
+            await anyio.to_thread.run_sync(plan.save)
+        if errors:
+            raise errors[0]
+    return await anyio.to_thread.run_sync(
+        functools.partial(plan.complete, decompress=decompress)
+    )
@@ -10,6 +10,16 @@ class XpozConnectionError(XpozError):
     pass
 
 
+class CircuitOpenError(XpozConnectionError):
+    def __init__(self, endpoint: str, retry_in_seconds: float):
+        self.endpoint = endpoint
+        self.retry_in_seconds = retry_in_seconds
+        super().__init__(
+            f"Circuit open for {endpoint}: too many consecutive failures, "
+            f"retrying in {retry_in_seconds:.0f}s"
+        )
+
+
 class OperationTimeoutError(XpozError):
     def __init__(self, operation_id: str, elapsed_seconds: float):
         self.operation_id = operation_id
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+from xpoz._transform._field_mapping import to_snake
+
+
+def _convert_cell(value: str) -> Any:
+    if value == "":
+        return None
+    if value[0] in "[{":
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+class _Records:
+    """Re-iterable source of complete CSV records for a long-lived ``csv.reader``."""
+
+    def __init__(self) -> None:
+        self.queue: deque[str] = deque()
+
+    def __iter__(self) -> _Records:
+        return self
+
+    def __next__(self) -> str:
+        if not self.queue:
+            raise StopIteration
+        return self.queue.popleft()
+
+
+class CsvRowParser:
+    """Incremental CSV parser: feed it bytes, get back the completed rows.
+
+    Only whole records (tracked by quote parity, so quoted newlines are
+    fine) reach the ``csv`` module, and nothing beyond the current partial
+    record is kept between chunks. Rows are dicts keyed by the snake_case
+    header; empty cells become ``None`` and JSON arrays/objects are decoded.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._records = _Records()
+        self._reader = csv.reader(self._records)
+        self._tail = ""
+        self._record: list[str] = []
+        self._in_quotes = False
+        self._header: list[str] | None = None
+
+    def feed(self, data: bytes) -> list[dict[str, Any]]:
+        text = self._tail + self._decoder.decode(data)
+        lines = text.split("\n")
+        self._tail = lines.pop()
+        for line in lines:
+            self._add_line(line + "\n")
+        return self._drain()
+
+    def close(self) -> list[dict[str, Any]]:
+        tail = self._tail + self._decoder.decode(b"", final=True)
+        self._tail = ""
+        if tail:
+            self._add_line(tail)
+        if self._record:
+            self._records.queue.append("".join(self._record))
+            self._record = []
+        return self._drain()
+
+    def _add_line(self, line: str) -> None:
+        self._record.append(line)
+        if line.count('"') % 2:
+            self._in_quotes = not self._in_quotes
+        if not self._in_quotes:
+            self._records.queue.append("".join(self._record))
+            self._record = []
+
+    def _drain(self) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        for values in self._reader:
+            if not values:
+                continue
+            if self._header is None:
+                self._header = [to_snake(name.strip()) for name in values]
+                continue
+            rows.append(dict(zip(self._header, map(_convert_cell, values))))
+        return rows
+
+
+def iter_csv_rows(chunks: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    parser = CsvRowParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_csv_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[dict[str, Any]]:
+    parser = CsvRowParser()
+    async for chunk in chunks:
+        for row in parser.feed(chunk):
+            yield row
+    for row in parser.close():
+        yield row
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+_Decoder = Callable[[Any], Any]
+_Encoder = Callable[[Any], bytes]
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _orjson() -> tuple[_Decoder, _Encoder]:
+    import orjson
+
+    return orjson.loads, orjson.dumps
+
+
+def _msgspec() -> tuple[_Decoder, _Encoder]:
+    import msgspec
+
+    decode = msgspec.json.decode
+
+    def loads(data: Any) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return loads, msgspec.json.encode
+
+
+_FACTORIES: dict[str, Callable[[], tuple[_Decoder, _Encoder]]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": lambda: (json.loads, _json_dumps),
+}
+
+_backend = "json"
+_decode: _Decoder = json.loads
+_encode: _Encoder = _json_dumps
+
+
+def set_json_backend(name: str | None = None) -> str:
+    """Choose the JSON codec used for responses and cached payloads; returns its name.
+
+    ``None`` picks the first installed of orjson, msgspec and the standard
+    library ``json``. Naming a backend that is not installed raises
+    ``ImportError``.
+    """
+    global _backend, _decode, _encode
+    if name is None:
+        for candidate in JSON_BACKENDS:
+            try:
+                return set_json_backend(candidate)
+            except ImportError:
+                continue
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend {name!r}; expected one of {JSON_BACKENDS}")
+    try:
+        decoder, encoder = _FACTORIES[name]()
+    except ImportError as exc:
+        raise ImportError(
+            f"JSON backend '{name}' is not installed; install it with pip install 'xpoz[{name}]'"
+        ) from exc
+    _backend, _decode, _encode = name, decoder, encoder
+    return name
+
+
+def json_backend() -> str:
+    return _backend
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Decode JSON from bytes (no intermediate str) or text.
+
+    Documents a fast backend refuses but the standard library accepts, such
+    as ones containing ``NaN``, are decoded with the standard library.
+    """
+    try:
+        return _decode(data)
+    except ValueError:
+        if _decode is json.loads:
+            raise
+        return json.loads(data)
+
+
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact JSON bytes.
+
+    Values a fast backend cannot encode, such as integers wider than 64
+    bits, are encoded with the standard library.
+    """
+    try:
+        return _encode(value)
+    except (TypeError, ValueError, OverflowError):
+        if _encode is _json_dumps:
+            raise
+        return _json_dumps(value)
+
+
+def canonical_dumps(value: Any) -> str:
+    """JSON with sorted keys that is the same whichever backend is selected.
+
+    Used where the text is compared or stored across runs, such as cache
+    keys and the operation journal.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+set_json_backend()
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+import anyio
+
+from xpoz._batch import DEFAULT_BATCH_CONCURRENCY, DEFAULT_MAX_BATCH_SIZE, BatchResult
+from xpoz._exceptions import NotFoundError
+from xpoz._tasks import OwnedTask
+
+T = TypeVar("T")
+
+DEFAULT_LOADER_WINDOW = 0.01
+
+
+def _identity(key: str) -> str:
+    return key
+
+
+def _resolve_batch(
+    keys: list[str],
+    outcome: BatchResult[T] | BaseException,
+    key_of: Callable[[T], str],
+    normalize: Callable[[str], str],
+) -> dict[str, T | BaseException]:
+    if isinstance(outcome, BaseException):
+        return dict.fromkeys(keys, outcome)
+    found = {normalize(key_of(item)): item for item in outcome}
+    resolved: dict[str, T | BaseException] = {}
+    for key in keys:
+        norm = normalize(key)
+        if norm in found:
+            resolved[key] = found[norm]
+        elif key in outcome.failed:
+            resolved[key] = outcome.failed[key]
+        else:
+            resolved[key] = NotFoundError(f"{key!r} not found")
+    return resolved
+
+
+class BatchLoader(Generic[T]):
+    """Merges single-key lookups into batched calls, DataLoader style.
+
+    Keys passed to ``load()`` within ``window`` seconds of each other (or
+    until ``max_batch_size`` are waiting) are fetched with one call to
+    ``fetch_many``; each caller gets its own item, or ``NotFoundError`` if
+    the batch came back without it. Batches are dispatched from a
+    background thread that exits when the loader is idle.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[list[str]], BatchResult[T]],
+        key_of: Callable[[T], str],
+        *,
+        normalize: Callable[[str], str] = _identity,
+        window: float = DEFAULT_LOADER_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
+        self._fetch_many = fetch_many
+        self._key_of = key_of
+        self._normalize = normalize
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._concurrency = concurrency
+        self._cond = threading.Condition()
+        self._queue: dict[str, tuple[str, Future[T]]] = {}
+        self._first_queued = 0.0
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def load(self, key: str) -> Future[T]:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchLoader is closed")
+            norm = self._normalize(key)
+            queued = self._queue.get(norm)
+            if queued is not None:
+                return queued[1]
+            future: Future[T] = Future()
+            if not self._queue:
+                self._first_queued = time.monotonic()
+            self._queue[norm] = (key, future)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="xpoz-batch-loader"
+                )
+                self._thread.start()
+            self._cond.notify()
+            return future
+
+    def get(self, key: str, timeout: float | None = None) -> T:
+        return self.load(key).result(timeout)
+
+    def get_many(self, keys: list[str], timeout: float | None = None) -> list[T]:
+        futures = [self.load(key) for key in keys]
+        return [future.result(timeout) for future in futures]
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            queued = list(self._queue.values())
+            self._queue.clear()
+            self._cond.notify_all()
+        for _, future in queued:
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> BatchLoader[T]:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed and self._queue:
+                remaining = self._first_queued + self._window - time.monotonic()
+                if remaining > 0 and len(self._queue) < self._max_batch_size:
+                    self._cond.wait(remaining)
+                    continue
+                batch = self._take_batch()
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._concurrency, thread_name_prefix="xpoz-batch"
+                    )
+                self._executor.submit(self._dispatch, batch)
+            self._thread = None
+
+    def _take_batch(self) -> list[tuple[str, Future[T]]]:
+        norms = list(self._queue)[: self._max_batch_size]
+        batch = [self._queue.pop(norm) for norm in norms]
+        # Keys left over from a full batch keep their deadline.
+        if not self._queue:
+            self._first_queued = time.monotonic()
+        return batch
+
+    def _dispatch(self, batch: list[tuple[str, Future[T]]]) -> None:
+        keys = [key for key, _ in batch]
+        outcome: BatchResult[T] | BaseException
+        try:
+            outcome = self._fetch_many(keys)
+        except Exception as exc:  # noqa: BLE001 - handed to every waiter in the batch
+            outcome = exc
+        resolved = _resolve_batch(keys, outcome, self._key_of, self._normalize)
+        for key, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            value = resolved[key]
+            if isinstance(value, BaseException):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+
+class _AsyncLoad(Generic[T]):
+    def __init__(self, key: str):
+        self.key = key
+        self.done = anyio.Event()
+        self.value: T | None = None
+        self.error: BaseException | None = None
+
+
+class AsyncBatchLoader(Generic[T]):
+    """Async counterpart of ``BatchLoader``, run as a background task.
+
+    Use it as an async context manager, or ``start()``/``aclose()``, which
+    may run in different tasks::
+
+        async with client.twitter.user_loader() as loader:
+            users = await asyncio.gather(*(loader.load(name) for name in names))
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[list[str]], Awaitable[BatchResult[T]]],
+        key_of: Callable[[T], str],
+        *,
+        normalize: Callable[[str], str] = _identity,
+        window: float = DEFAULT_LOADER_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
+        self._fetch_many = fetch_many
+        self._key_of = key_of
+        self._normalize = normalize
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._concurrency = concurrency
+        self._queue: dict[str, _AsyncLoad[T]] = {}
+        # Created in start(): anyio primitives need a running event loop.
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._queued: anyio.Event | None = None
+        self._full: anyio.Event | None = None
+        self._worker: OwnedTask | None = None
+
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._limiter = anyio.CapacityLimiter(self._concurrency)
+        self._queued = anyio.Event()
+        self._full = anyio.Event()
+        self._worker = OwnedTask(self._run, name="xpoz-batch-loader")
+
+    async def aclose(self) -> None:
+        if self._worker is None:
+            return
+        worker, self._worker = self._worker, None
+        await worker.cancel()
+        for load in self._queue.values():
+            load.error = RuntimeError("AsyncBatchLoader closed")
+            load.done.set()
+        self._queue.clear()
+
+    async def __aenter__(self) -> AsyncBatchLoader[T]:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def load(self, key: str) -> T:
+        if self._worker is None:
+            raise RuntimeError("AsyncBatchLoader not started. Use 'async with' or call start().")
+        assert self._queued is not None and self._full is not None
+        norm = self._normalize(key)
+        load = self._queue.get(norm)
+        if load is None:
+            load = self._queue[norm] = _AsyncLoad(key)
+            self._queued.set()
+            if len(self._queue) >= self._max_batch_size:
+                self._full.set()
+        await load.done.wait()
+        if load.error is not None:
+            raise load.error
+        return load.value  # type: ignore[return-value]
+
+    async def load_many(self, keys: list[str]) -> list[T]:
+        results: list[Any] = [None] * len(keys)
+
+        async def load_one(index: int) -> None:
+            results[index] = await self.load(keys[index])
+
+        async with anyio.create_task_group() as task_group:
+            for index in range(len(keys)):
+                task_group.start_soon(load_one, index)
+        return results
+
+    async def _run(self) -> None:
+        # Keys left over from a full batch have already waited out a window.
+        carried = False
+        async with anyio.create_task_group() as task_group:
+            while True:
+                assert self._queued is not None and self._full is not None
+                await self._queued.wait()
+                if not carried:
+                    with anyio.move_on_after(self._window):
+                        await self._full.wait()
+                norms = list(self._queue)[: self._max_batch_size]
+                batch = [self._queue.pop(norm) for norm in norms]
+                self._queued = anyio.Event()
+                self._full = anyio.Event()
+                carried = bool(self._queue)
+                if carried:
+                    self._queued.set()
+                    if len(self._queue) >= self._max_batch_size:
+                        self._full.set()
+                if batch:
+                    task_group.start_soon(self._dispatch, batch)
+
+    async def _dispatch(self, batch: list[_AsyncLoad[T]]) -> None:
+        assert self._limiter is not None
+        keys = [load.key for load in batch]
+        outcome: BatchResult[T] | BaseException
+        try:
+            async with self._limiter:
+                outcome = await self._fetch_many(keys)
+        except Exception as exc:  # noqa: BLE001 - handed to every waiter in the batch
+            outcome = exc
+        resolved = _resolve_batch(keys, outcome, self._key_of, self._normalize)
+        for load in batch:
+            value = resolved[load.key]
+            if isinstance(value, BaseException):
+                load.error = value
+            else:
+                load.value = value
+            load.done.set()
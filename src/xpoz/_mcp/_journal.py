@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from typing import Any
+
+from xpoz._cache._base import canonical_arguments
+from xpoz._exceptions import OperationCancelledError, OperationFailedError
+from xpoz._json import loads
+
+DEFAULT_JOURNAL_MAX_AGE = 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_operations (
+    operation_id TEXT PRIMARY KEY,
+    tool_name TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    table_name TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pending_operations_request
+    ON pending_operations (tool_name, arguments);
+"""
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    operation_id: str
+    tool_name: str
+    arguments: dict[str, Any]
+    table_name: str | None
+    created_at: float
+
+
+class OperationJournal:
+    """SQLite record of server-side operations this client is waiting on.
+
+    An operation is written when the server hands back an ``operationId``
+    and removed once it reaches a final state, so after a crash the file
+    holds exactly the work that was still running. A later call with the
+    same tool and arguments re-attaches to the recorded operation instead
+    of submitting it again, and ``resume_pending()`` on the client polls
+    every recorded operation. Entries older than ``max_age`` seconds are
+    dropped, as the server no longer keeps their results.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, max_age: float = DEFAULT_JOURNAL_MAX_AGE):
+        self.path = os.fspath(path)
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def record(self, operation_id: str, tool_name: str, arguments: dict[str, Any]) -> None:
+        table_name = arguments.get("tableName")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pending_operations VALUES (?, ?, ?, ?, ?)",
+                (
+                    operation_id,
+                    tool_name,
+                    canonical_arguments(arguments),
+                    table_name,
+                    time.time(),
+                ),
+            )
+
+    def find(self, tool_name: str, arguments: dict[str, Any]) -> str | None:
+        """The operation already running for this exact request, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT operation_id FROM pending_operations"
+                " WHERE tool_name = ? AND arguments = ? AND created_at >= ?"
+                " ORDER BY created_at DESC LIMIT 1",
+                (tool_name, canonical_arguments(arguments), time.time() - self._max_age),
+            ).fetchone()
+        return row[0] if row else None
+
+    def remove(self, operation_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM pending_operations WHERE operation_id = ?", (operation_id,)
+            )
+
+    def finish(self, operation_id: str, error: BaseException | None = None) -> None:
+        """Drop the entry unless ``error`` leaves the operation worth resuming.
+
+        Timeouts and connection failures say nothing about the server-side
+        work, so those entries are kept.
+        """
+        if error is None or isinstance(
+            error, (OperationFailedError, OperationCancelledError, CancelledError)
+        ):
+            self.remove(operation_id)
+
+    def finish_when_done(self, operation_id: str, future: Future[Any]) -> None:
+        def done(future: Future[Any]) -> None:
+            self.finish(operation_id, CancelledError() if future.cancelled() else future.exception())
+
+        future.add_done_callback(done)
+
+    def pending(self) -> list[JournalEntry]:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM pending_operations WHERE created_at < ?",
+                (time.time() - self._max_age,),
+            )
+            rows = self._conn.execute(
+                "SELECT operation_id, tool_name, arguments, table_name, created_at"
+                " FROM pending_operations ORDER BY created_at"
+            ).fetchall()
+        return [
+            JournalEntry(op_id, tool, loads(args), table, created)
+            for op_id, tool, args, table, created in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_journal(
+    journal: str | os.PathLike[str] | OperationJournal | None,
+) -> OperationJournal | None:
+    if journal is None or isinstance(journal, OperationJournal):
+        return journal
+    return OperationJournal(journal)
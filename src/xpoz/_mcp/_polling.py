@@ -14,70 +14,142 @@ from xpoz._exceptions import (
 POLL_INTERVAL_SECONDS = 5
 DEFAULT_TIMEOUT_SECONDS = 300
 
+_ETA_KEYS = ("etaSeconds", "eta", "estimatedSecondsRemaining")
+
+
+def _server_eta(status: dict[str, Any] | None, elapsed: float) -> float | None:
+    """Seconds until the server expects the operation to finish, if it says."""
+    if not status:
+        return None
+    for key in _ETA_KEYS:
+        value = status.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return max(float(value), 0.0)
+    progress = status.get("progress")
+    if isinstance(progress, (int, float)) and not isinstance(progress, bool) and progress > 0:
+        fraction = progress / 100 if progress > 1 else float(progress)
+        if fraction >= 1:
+            return 0.0
+        return elapsed * (1 - fraction) / fraction
+    return None
+
+
+class PollingStrategy:
+    """Decides how long to sleep between ``checkOperationStatus`` calls.
+
+    Polls start at ``initial_interval`` and grow by ``multiplier`` up to
+    ``max_interval``, so short operations resolve quickly while long ones
+    settle into infrequent polls. An ETA or progress field on the status
+    response overrides the schedule, bounded by ``initial_interval`` and
+    ``max_hinted_interval``. Sleeps never run past the caller's timeout: the
+    final poll lands exactly on the deadline.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_interval: float = 0.25,
+        multiplier: float = 2.0,
+        max_interval: float = POLL_INTERVAL_SECONDS,
+        max_hinted_interval: float = 30.0,
+    ):
+        if initial_interval <= 0 or multiplier < 1:
+            raise ValueError("initial_interval must be > 0 and multiplier >= 1")
+        self.initial_interval = initial_interval
+        self.multiplier = multiplier
+        self.max_interval = max(max_interval, initial_interval)
+        self.max_hinted_interval = max(max_hinted_interval, self.max_interval)
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        timeout: float,
+        status: dict[str, Any] | None = None,
+    ) -> float:
+        """Delay after poll number ``attempt`` (1-based) came back pending."""
+        eta = _server_eta(status, elapsed)
+        if eta is not None:
+            delay = min(max(eta, self.initial_interval), self.max_hinted_interval)
+        else:
+            delay = min(
+                self.max_interval,
+                self.initial_interval * self.multiplier ** (attempt - 1),
+            )
+        return max(0.0, min(delay, timeout - elapsed))
+
+    def __repr__(self) -> str:
+        return (
+            f"PollingStrategy(initial_interval={self.initial_interval}, "
+            f"multiplier={self.multiplier}, max_interval={self.max_interval})"
+        )
+
+
+DEFAULT_POLLING = PollingStrategy()
+
+
+def is_finished(operation_id: str, result: dict[str, Any]) -> bool:
+    """Whether a status response is final; raises for failed or cancelled ops."""
+    status = result.get("status")
+
+    if status == "error":
+        error = result.get("error", "Unknown error")
+        raise OperationFailedError(operation_id, str(error))
+
+    if status == "cancelled":
+        raise OperationCancelledError(operation_id)
+
+    return (
+        status == "success"
+        or status == "no_data"
+        or "results" in result
+        or "downloadUrl" in result
+    )
+
 
 async def wait_for_result(
     call_tool: Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]],
     operation_id: str,
     timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    strategy: PollingStrategy | None = None,
 ) -> dict[str, Any]:
+    strategy = strategy or DEFAULT_POLLING
     start = anyio.current_time()
+    attempt = 0
     while True:
         result: dict[str, Any] = await call_tool(
             "checkOperationStatus", {"operationId": operation_id}
         )
-        status = result.get("status")
-
-        if status == "error":
-            error = result.get("error", "Unknown error")
-            raise OperationFailedError(operation_id, str(error))
-
-        if status == "cancelled":
-            raise OperationCancelledError(operation_id)
-
-        if (
-            status == "success"
-            or status == "no_data"
-            or "results" in result
-            or "downloadUrl" in result
-        ):
+        if is_finished(operation_id, result):
             return result
 
         elapsed = anyio.current_time() - start
         if elapsed >= timeout:
             raise OperationTimeoutError(operation_id, elapsed)
 
-        await anyio.sleep(POLL_INTERVAL_SECONDS)
+        attempt += 1
+        await anyio.sleep(strategy.next_delay(attempt, elapsed, timeout, result))
 
 
 def wait_for_result_sync(
     call_tool: Callable[[str, dict[str, Any]], dict[str, Any]],
     operation_id: str,
     timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    strategy: PollingStrategy | None = None,
 ) -> dict[str, Any]:
+    strategy = strategy or DEFAULT_POLLING
     start = time.monotonic()
+    attempt = 0
     while True:
         result: dict[str, Any] = call_tool(
             "checkOperationStatus", {"operationId": operation_id}
         )
-        status = result.get("status")
-
-        if status == "error":
-            error = result.get("error", "Unknown error")
-            raise OperationFailedError(operation_id, str(error))
-
-        if status == "cancelled":
-            raise OperationCancelledError(operation_id)
-
-        if (
-            status == "success"
-            or status == "no_data"
-            or "results" in result
-            or "downloadUrl" in result
-        ):
+        if is_finished(operation_id, result):
             return result
 
         elapsed = time.monotonic() - start
         if elapsed >= timeout:
             raise OperationTimeoutError(operation_id, elapsed)
 
-        time.sleep(POLL_INTERVAL_SECONDS)
+        attempt += 1
+        time.sleep(strategy.next_delay(attempt, elapsed, timeout, result))
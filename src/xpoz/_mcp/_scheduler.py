@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import anyio
+
+from xpoz._exceptions import OperationTimeoutError
+from xpoz._mcp._polling import DEFAULT_POLLING, PollingStrategy, is_finished
+from xpoz._tasks import OwnedTask
+
+DEFAULT_MAX_POLL_QPS = 20.0
+DEFAULT_POLL_CONCURRENCY = 8
+
+
+class _TokenBucket:
+    """Caps status checks per second across every tracked operation."""
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("max_poll_qps must be positive")
+        self._rate = rate
+        self._capacity = max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated: float | None = None
+
+    def take(self, now: float, wanted: int) -> int:
+        if self._updated is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        granted = min(wanted, int(self._tokens))
+        self._tokens -= granted
+        return granted
+
+    def wait_time(self) -> float:
+        return max(0.0, (1 - self._tokens) / self._rate)
+
+
+class _PendingOperation:
+    def __init__(self, operation_id: str, now: float, timeout: float):
+        self.operation_id = operation_id
+        self.started = now
+        self.timeout = timeout
+        self.due = now
+        self.attempt = 0
+        self.in_flight = False
+
+    def reschedule(self, strategy: PollingStrategy, now: float, status: dict[str, Any]) -> bool:
+        """Plan the next poll; False once the deadline has passed."""
+        elapsed = now - self.started
+        if elapsed >= self.timeout:
+            return False
+        self.attempt += 1
+        self.due = now + strategy.next_delay(self.attempt, elapsed, self.timeout, status)
+        self.in_flight = False
+        return True
+
+
+class PollScheduler:
+    """Tracks every pending operation of a sync client on one polling thread.
+
+    Instead of each caller sleeping in its own loop, operations are
+    registered here and checked on a shared schedule: whenever operations
+    come due they are polled together on a small worker pool, subject to a
+    client-wide ``max_qps`` cap. Each registration gets its own
+    ``concurrent.futures.Future``; an operation stops being polled once all
+    of its futures are resolved or cancelled. The polling thread exits when
+    nothing is pending and restarts on the next registration.
+    """
+
+    def __init__(
+        self,
+        call_tool: Callable[[str, dict[str, Any]], dict[str, Any]],
+        *,
+        strategy: PollingStrategy | None = None,
+        max_qps: float = DEFAULT_MAX_POLL_QPS,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+    ):
+        self._call_tool = call_tool
+        self._strategy = strategy or DEFAULT_POLLING
+        self._bucket = _TokenBucket(max_qps)
+        self._max_concurrency = max_concurrency
+        self._cond = threading.Condition()
+        self._pending: dict[str, tuple[_PendingOperation, list[Future[dict[str, Any]]]]] = {}
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def submit(self, operation_id: str, timeout: float) -> Future[dict[str, Any]]:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PollScheduler is closed")
+            future: Future[dict[str, Any]] = Future()
+            entry = self._pending.get(operation_id)
+            if entry is not None:
+                entry[1].append(future)
+                return future
+            op = _PendingOperation(operation_id, time.monotonic(), timeout)
+            self._pending[operation_id] = (op, [future])
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="xpoz-poll",
+                )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="xpoz-poll-scheduler"
+                )
+                self._thread.start()
+            self._cond.notify()
+            return future
+
+    def wait(self, operation_id: str, timeout: float) -> dict[str, Any]:
+        return self.submit(operation_id, timeout).result()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._cond.notify_all()
+        for _, futures in pending:
+            for future in futures:
+                future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed and self._pending:
+                now = time.monotonic()
+                for op_id, (_, futures) in list(self._pending.items()):
+                    if all(future.cancelled() for future in futures):
+                        del self._pending[op_id]
+                due = sorted(
+                    (op for op, _ in self._pending.values() if not op.in_flight and op.due <= now),
+                    key=lambda op: op.due,
+                )
+                granted = self._bucket.take(now, len(due))
+                for op in due[:granted]:
+                    op.in_flight = True
+                    assert self._executor is not None
+                    self._executor.submit(self._check, op)
+                self._cond.wait(self._next_wakeup(now, throttled=granted < len(due)))
+            self._thread = None
+
+    def _next_wakeup(self, now: float, throttled: bool) -> float | None:
+        if throttled:
+            return self._bucket.wait_time()
+        waiting = [op.due for op, _ in self._pending.values() if not op.in_flight]
+        if not waiting:
+            return None
+        return max(0.0, min(waiting) - now)
+
+    def _check(self, op: _PendingOperation) -> None:
+        try:
+            result = self._call_tool("checkOperationStatus", {"operationId": op.operation_id})
+            finished = is_finished(op.operation_id, result)
+        except Exception as exc:  # noqa: BLE001 - fails the operation
+            self._resolve(op.operation_id, error=exc)
+            return
+        if finished:
+            self._resolve(op.operation_id, result=result)
+            return
+        now = time.monotonic()
+        with self._cond:
+            if not op.reschedule(self._strategy, now, result):
+                error = OperationTimeoutError(op.operation_id, now - op.started)
+            else:
+                self._cond.notify()
+                return
+        self._resolve(op.operation_id, error=error)
+
+    def _resolve(
+        self,
+        operation_id: str,
+        *,
+        result: dict[str, Any] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._cond:
+            entry = self._pending.pop(operation_id, None)
+            self._cond.notify()
+        if entry is None:
+            return
+        for future in entry[1]:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result or {})
+
+
+class _AsyncPendingOperation(_PendingOperation):
+    def __init__(self, operation_id: str, now: float, timeout: float):
+        super().__init__(operation_id, now, timeout)
+        self.done = anyio.Event()
+        self.waiters = 0
+        self.pinned = False
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+class AsyncPollScheduler:
+    """Async counterpart of ``PollScheduler``, run as one background task.
+
+    ``start()`` must be awaited before use, which ``AsyncXpozClient.connect()``
+    takes care of. The polling runs in a task the scheduler owns, so
+    ``aclose()`` may be awaited from any task.
+    """
+
+    def __init__(
+        self,
+        call_tool: Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]],
+        *,
+        strategy: PollingStrategy | None = None,
+        max_qps: float = DEFAULT_MAX_POLL_QPS,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+    ):
+        self._call_tool = call_tool
+        self._strategy = strategy or DEFAULT_POLLING
+        self._bucket = _TokenBucket(max_qps)
+        self._max_concurrency = max_concurrency
+        self._pending: dict[str, _AsyncPendingOperation] = {}
+        # Created in start(): anyio primitives need a running event loop.
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._wakeup: anyio.Event | None = None
+        self._worker: OwnedTask | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._limiter = anyio.CapacityLimiter(self._max_concurrency)
+        self._wakeup = anyio.Event()
+        self._worker = OwnedTask(self._run, name="xpoz-poll-scheduler")
+
+    async def aclose(self) -> None:
+        if self._worker is None:
+            return
+        worker, self._worker = self._worker, None
+        await worker.cancel()
+        for op in self._pending.values():
+            op.error = RuntimeError("AsyncPollScheduler closed")
+            op.done.set()
+        self._pending.clear()
+
+    async def __aenter__(self) -> AsyncPollScheduler:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    def register(self, operation_id: str, timeout: float) -> _AsyncPendingOperation:
+        if self._worker is None:
+            raise RuntimeError("AsyncPollScheduler not started. Call start() first.")
+        op = self._pending.get(operation_id)
+        if op is None:
+            op = _AsyncPendingOperation(operation_id, anyio.current_time(), timeout)
+            self._pending[operation_id] = op
+            self._notify()
+        return op
+
+    async def wait(self, operation_id: str, timeout: float) -> dict[str, Any]:
+        return await self.wait_for(self.register(operation_id, timeout))
+
+    async def wait_for(self, op: _AsyncPendingOperation) -> dict[str, Any]:
+        op.waiters += 1
+        try:
+            await op.done.wait()
+        finally:
+            op.waiters -= 1
+            # A cancelled waiter stops the polling unless an operation handle
+            # still holds on to the operation.
+            if op.waiters == 0 and not op.pinned and not op.done.is_set():
+                self._pending.pop(op.operation_id, None)
+        if op.error is not None:
+            raise op.error
+        return op.result or {}
+
+    def forget(self, op: _AsyncPendingOperation, error: BaseException) -> None:
+        """Stop polling ``op`` and fail its waiters with ``error``."""
+        if not op.done.is_set():
+            self._resolve(op, error=error)
+
+    async def _run(self) -> None:
+        async with anyio.create_task_group() as task_group:
+            while True:
+                self._wakeup = anyio.Event()
+                now = anyio.current_time()
+                due = sorted(
+                    (op for op in self._pending.values() if not op.in_flight and op.due <= now),
+                    key=lambda op: op.due,
+                )
+                granted = self._bucket.take(now, len(due))
+                for op in due[:granted]:
+                    op.in_flight = True
+                    task_group.start_soon(self._check, op)
+
+                if granted < len(due):
+                    delay: float | None = self._bucket.wait_time()
+                else:
+                    waiting = [op.due for op in self._pending.values() if not op.in_flight]
+                    delay = max(0.0, min(waiting) - now) if waiting else None
+                with anyio.move_on_after(delay):
+                    await self._wakeup.wait()
+
+    async def _check(self, op: _AsyncPendingOperation) -> None:
+        assert self._limiter is not None
+        try:
+            async with self._limiter:
+                result = await self._call_tool(
+                    "checkOperationStatus", {"operationId": op.operation_id}
+                )
+            finished = is_finished(op.operation_id, result)
+        except Exception as exc:  # noqa: BLE001 - fails the operation
+            self._resolve(op, error=exc)
+            return
+        if finished:
+            self._resolve(op, result=result)
+            return
+        now = anyio.current_time()
+        if not op.reschedule(self._strategy, now, result):
+            self._resolve(op, error=OperationTimeoutError(op.operation_id, now - op.started))
+            return
+        self._notify()
+
+    def _resolve(
+        self,
+        op: _AsyncPendingOperation,
+        *,
+        result: dict[str, Any] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self._pending.pop(op.operation_id, None)
+        op.result = result
+        op.error = error
+        op.done.set()
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from contextlib import AsyncExitStack
 from typing import Any
 
 import anyio
@@ -9,11 +10,15 @@ from anyio.from_thread import BlockingPortal, start_blocking_portal
 from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
 
+from xpoz._retry import RetryPolicy, acall_with_retry, call_with_retry, is_idempotent
 from xpoz._transform._response_parser import parse_response_text
 from xpoz._version import __version__
 
 _DEFAULT_USER_AGENT = f"xpoz-python-sdk/{__version__}"
 
+DEFAULT_POOL_SIZE = 1
+_UNHEALTHY_AFTER_FAILURES = 3
+
 _SAFE_UA_RE = re.compile(r"\A[\x21-\x7e](?:[\x20-\x7e]*[\x21-\x7e])?\Z")
 
 
@@ -39,20 +44,25 @@ def _is_error_result(result: Any) -> bool:
     return bool(result.isError)
 
 
+def _structured_content(result: Any) -> Any:
+    if hasattr(result, "structured_content"):
+        return result.structured_content
+    return getattr(result, "structuredContent", None)
+
+
 def _parse_tool_result(tool_name: str, result: Any) -> dict[str, Any]:
     if _is_error_result(result):
-        error_text = ""
-        for block in result.content:
-            if hasattr(block, "text"):
-                error_text += block.text
+        error_text = "".join(block.text for block in result.content if hasattr(block, "text"))
         raise RuntimeError(f"MCP tool error ({tool_name}): {error_text}")
 
-    combined_text = ""
-    for block in result.content:
-        if hasattr(block, "text"):
-            combined_text += block.text
+    # Structured content has already been decoded along with the rest of the
+    # message; the text blocks are only needed when the server sends none.
+    structured = _structured_content(result)
+    if isinstance(structured, dict):
+        return structured
 
-    return parse_response_text(combined_text)
+    texts = [block.text for block in result.content if hasattr(block, "text")]
+    return parse_response_text(texts[0] if len(texts) == 1 else "".join(texts))
 
 
 class McpTransport:
@@ -61,11 +71,14 @@ class McpTransport:
         server_url: str,
         api_key: str | None = None,
         *,
+        retry: RetryPolicy | None = None,
         _user_agent: str | None = None,
     ):
         self._server_url = server_url
         self._api_key = api_key
         self._user_agent = _resolve_user_agent(_user_agent)
+        self._retry = retry or RetryPolicy()
+        self._breaker = self._retry.breaker(server_url)
         self._session: ClientSession | None = None
         self._context_stack: list[Any] = []
 
@@ -101,9 +114,40 @@ class McpTransport:
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         if self._session is None:
             raise RuntimeError("Transport not connected. Call connect() first.")
+        session = self._session
+
+        async def _call() -> dict[str, Any]:
+            result = await session.call_tool(tool_name, arguments)
+            return _parse_tool_result(tool_name, result)
+
+        return await acall_with_retry(
+            self._retry, self._breaker, _call, idempotent=is_idempotent(tool_name)
+        )
+
 
-        result = await self._session.call_tool(tool_name, arguments)
-        return _parse_tool_result(tool_name, result)
+class _PooledSession:
+    def __init__(self, index: int, session: ClientSession):
+        self.index = index
+        self.session = session
+        self.in_flight = 0
+        self.calls = 0
+        self.consecutive_failures = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.consecutive_failures < _UNHEALTHY_AFTER_FAILURES
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+
+
+def _pick_session(sessions: list[_PooledSession]) -> _PooledSession:
+    """Least-loaded dispatch: prefer healthy sessions, then the fewest calls in
+    flight, then the fewest calls overall so idle sessions are rotated through."""
+    return min(sessions, key=lambda s: (not s.healthy, s.in_flight, s.calls))
 
 
 class SyncTransport:
@@ -112,12 +156,19 @@ class SyncTransport:
         server_url: str,
         api_key: str | None = None,
         *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retry: RetryPolicy | None = None,
         _user_agent: str | None = None,
     ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
         self._server_url = server_url
         self._api_key = api_key
         self._user_agent = _resolve_user_agent(_user_agent)
-        self._session: ClientSession | None = None
+        self._pool_size = pool_size
+        self._retry = retry or RetryPolicy()
+        self._breaker = self._retry.breaker(server_url)
+        self._sessions: list[_PooledSession] = []
         self._portal_cm: Any = None
         self._portal: BlockingPortal | None = None
         self._shutdown_event: anyio.Event | None = None
@@ -141,27 +192,52 @@ class SyncTransport:
         shutdown: anyio.Event,
     ) -> None:
         try:
-            headers: dict[str, str] = {"User-Agent": self._user_agent}
-            if self._api_key:
-                headers["Authorization"] = f"Bearer {self._api_key}"
-
-            http_client = httpx.AsyncClient(
-                headers=headers,
-                timeout=httpx.Timeout(30, read=None),
-            )
-            async with streamable_http_client(self._server_url, http_client=http_client) as streams:
-                read_stream, write_stream = _unpack_streams(streams)
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    self._session = session
-                    ready.set()
-                    await shutdown.wait()
+            async with AsyncExitStack() as stack:
+                for index in range(self._pool_size):
+                    session = await self._open_session(stack)
+                    self._sessions.append(_PooledSession(index, session))
+                ready.set()
+                await shutdown.wait()
         except BaseException as exc:
             self._connect_error = exc
             ready.set()
             raise
         finally:
-            self._session = None
+            self._sessions = []
+
+    async def _open_session(self, stack: AsyncExitStack) -> ClientSession:
+        headers: dict[str, str] = {"User-Agent": self._user_agent}
+        if self._api_key:
+            headers["Authorization"] = f"Bearer {self._api_key}"
+
+        # One HTTP client per session so every pooled session gets its own
+        # connection instead of queueing behind the others.
+        http_client = await stack.enter_async_context(
+            httpx.AsyncClient(
+                headers=headers,
+                timeout=httpx.Timeout(30, read=None),
+            )
+        )
+        streams = await stack.enter_async_context(
+            streamable_http_client(self._server_url, http_client=http_client)
+        )
+        read_stream, write_stream = _unpack_streams(streams)
+        session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+        await session.initialize()
+        return session
+
+    def pool_status(self) -> list[dict[str, Any]]:
+        """Snapshot of per-session load and health, for diagnostics."""
+        return [
+            {
+                "index": slot.index,
+                "in_flight": slot.in_flight,
+                "calls": slot.calls,
+                "consecutive_failures": slot.consecutive_failures,
+                "healthy": slot.healthy,
+            }
+            for slot in self._sessions
+        ]
 
     def close(self) -> None:
         if self._portal and self._shutdown_event:
@@ -176,15 +252,34 @@ class SyncTransport:
                 pass
             self._portal_cm = None
             self._portal = None
-            self._session = None
+            self._sessions = []
 
     def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        if self._portal is None or self._session is None:
+        if self._portal is None or not self._sessions:
             raise RuntimeError("Transport not connected. Call connect() first.")
+        portal = self._portal
 
         async def _call() -> dict[str, Any]:
-            assert self._session is not None
-            result = await self._session.call_tool(tool_name, arguments)
+            # Runs on the portal's event loop thread, so slot bookkeeping
+            # needs no lock.
+            slot = _pick_session(self._sessions)
+            slot.in_flight += 1
+            slot.calls += 1
+            try:
+                result = await slot.session.call_tool(tool_name, arguments)
+            except Exception:
+                slot.record_failure()
+                raise
+            finally:
+                slot.in_flight -= 1
+            slot.record_success()
             return _parse_tool_result(tool_name, result)
 
-        return self._portal.call(_call)
+        # Backoff sleeps happen on the calling thread, never on the portal's
+        # event loop, so one retrying call does not stall the others.
+        return call_with_retry(
+            self._retry,
+            self._breaker,
+            lambda: portal.call(_call),
+            idempotent=is_idempotent(tool_name),
+        )
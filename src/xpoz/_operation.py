@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Generator, Sequence
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Generic, ParamSpec, Protocol, TypeVar
+
+import anyio
+
+from xpoz._exceptions import OperationCancelledError
+from xpoz._mcp._scheduler import AsyncPollScheduler, _AsyncPendingOperation
+
+R = TypeVar("R")
+P = ParamSpec("P")
+
+
+class OperationHandle(Generic[R]):
+    """A server-side operation submitted with ``method.submit(...)``.
+
+    The operation is polled by the client's shared scheduler, so holding a
+    handle costs no thread. ``result()`` blocks until it finishes and returns
+    exactly what the blocking method call would have returned. Handles are
+    also awaitable from asyncio code.
+    """
+
+    def __init__(
+        self,
+        future: Future[dict[str, Any]],
+        finalize: Callable[[dict[str, Any]], R],
+        *,
+        operation_id: str | None = None,
+        tool_name: str | None = None,
+    ):
+        self.operation_id = operation_id
+        self.tool_name = tool_name
+        self._future = future
+        self._finalize = finalize
+        self._lock = threading.Lock()
+        self._finalized = False
+        self._value: R | None = None
+
+    @classmethod
+    def completed(cls, value: R, *, tool_name: str | None = None) -> OperationHandle[R]:
+        """A handle for a call the server answered without an operation."""
+        future: Future[dict[str, Any]] = Future()
+        future.set_result({})
+        return cls(future, lambda _raw: value, tool_name=tool_name)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def cancel(self) -> bool:
+        """Stop tracking the operation. The server-side work is not aborted."""
+        return self._future.cancel()
+
+    def cancelled(self) -> bool:
+        return self._future.cancelled()
+
+    def result(self, timeout: float | None = None) -> R:
+        """Wait up to ``timeout`` seconds (forever if None) for the result.
+
+        Raises ``TimeoutError`` if it is not ready in time and
+        ``OperationCancelledError`` if the handle was cancelled.
+        """
+        try:
+            raw = self._future.result(timeout)
+        except CancelledError:
+            raise OperationCancelledError(self.operation_id or "") from None
+        with self._lock:
+            if not self._finalized:
+                self._value = self._finalize(raw)
+                self._finalized = True
+            return self._value  # type: ignore[return-value]
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        try:
+            self.result(timeout)
+        except FutureTimeoutError:
+            # Before Python 3.11 this is not the builtin TimeoutError.
+            raise
+        except Exception as exc:  # noqa: BLE001 - returned, as Future.exception() does
+            return exc
+        return None
+
+    def add_done_callback(self, fn: Callable[[OperationHandle[R]], Any]) -> None:
+        self._future.add_done_callback(lambda _future: fn(self))
+
+    def __await__(self) -> Generator[Any, None, R]:
+        return self._wait_async().__await__()
+
+    async def _wait_async(self) -> R:
+        try:
+            await asyncio.wrap_future(self._future)
+        except asyncio.CancelledError:
+            if not self._future.cancelled():
+                raise
+        return self.result()
+
+    def __repr__(self) -> str:
+        state = "done" if self.done() else "pending"
+        return f"OperationHandle(operation_id={self.operation_id!r}, {state})"
+
+
+class AsyncOperationHandle(Generic[R]):
+    """Async counterpart of ``OperationHandle``; ``await handle`` for the result.
+
+    A handle may track several operations, such as the chunks of a batch
+    lookup. ``finalize`` gets each one's payload or error in order;
+    ``on_done`` is told the outcome of each operation as it is collected.
+    """
+
+    def __init__(
+        self,
+        scheduler: AsyncPollScheduler | None,
+        ops: Sequence[_AsyncPendingOperation],
+        finalize: Callable[[list[dict[str, Any] | BaseException]], Awaitable[R]],
+        *,
+        operation_id: str | None = None,
+        tool_name: str | None = None,
+        on_done: Callable[[str, BaseException | None], Any] | None = None,
+    ):
+        self.operation_id = operation_id
+        self.tool_name = tool_name
+        self._scheduler = scheduler
+        self._ops = list(ops)
+        self._finalize = finalize
+        self._on_done = on_done
+        self._settled: set[str] = set()
+        self._finalized = False
+        self._value: R | None = None
+        for op in self._ops:
+            op.pinned = True
+
+    @classmethod
+    def completed(cls, value: R, *, tool_name: str | None = None) -> AsyncOperationHandle[R]:
+        async def finalize(_outcomes: list[dict[str, Any] | BaseException]) -> R:
+            return value
+
+        return cls(None, [], finalize, tool_name=tool_name)
+
+    def done(self) -> bool:
+        return all(op.done.is_set() for op in self._ops)
+
+    def cancel(self) -> bool:
+        """Stop tracking the operations. The server-side work is not aborted."""
+        if self._scheduler is None or self.done():
+            return False
+        for op in self._ops:
+            self._scheduler.forget(op, OperationCancelledError(op.operation_id))
+            self._settle(op, op.error)
+        return True
+
+    async def result(self, timeout: float | None = None) -> R:
+        """Wait up to ``timeout`` seconds (forever if None) for the result."""
+        if not self._finalized:
+            outcomes: list[dict[str, Any] | BaseException] = []
+            if self._scheduler is not None:
+                with anyio.fail_after(timeout):
+                    for op in self._ops:
+                        try:
+                            outcomes.append(await self._scheduler.wait_for(op))
+                        except OperationCancelledError as exc:
+                            self._settle(op, exc)
+                            raise
+                        except Exception as exc:  # noqa: BLE001 - handed to finalize
+                            self._settle(op, exc)
+                            outcomes.append(exc)
+                        else:
+                            self._settle(op, None)
+            self._value = await self._finalize(outcomes)
+            self._finalized = True
+        return self._value  # type: ignore[return-value]
+
+    def __await__(self) -> Generator[Any, None, R]:
+        return self.result().__await__()
+
+    def _settle(self, op: _AsyncPendingOperation, error: BaseException | None) -> None:
+        if self._on_done is not None and op.operation_id not in self._settled:
+            self._settled.add(op.operation_id)
+            self._on_done(op.operation_id, error)
+
+    def __repr__(self) -> str:
+        state = "done" if self.done() else "pending"
+        return f"AsyncOperationHandle(operation_id={self.operation_id!r}, {state})"
+
+
+class SubmittableMethod(Protocol[P, R]):
+    """A bound namespace method: call it to wait, ``.submit()`` it for a handle."""
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
+
+    def submit(self, *args: P.args, **kwargs: P.kwargs) -> OperationHandle[R]: ...
+
+
+class AsyncSubmittableMethod(Protocol[P, R]):
+    """A bound async namespace method: await it, or await ``.submit()`` for a handle."""
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Awaitable[R]: ...
+
+    def submit(
+        self, *args: P.args, **kwargs: P.kwargs
+    ) -> Awaitable[AsyncOperationHandle[R]]: ...
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Generic, TypeVar
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream
+
+T = TypeVar("T")
+
+
+class _Failure:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class PageStream(Generic[T]):
+    """The consumer side of ``page_stream``; raises the producer's error in order."""
+
+    def __init__(self, receive: MemoryObjectReceiveStream[Any]):
+        self._receive = receive
+
+    def __aiter__(self) -> PageStream[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            item = await self._receive.receive()
+        except anyio.EndOfStream:
+            raise StopAsyncIteration from None
+        if isinstance(item, _Failure):
+            raise item.error
+        result: T = item
+        return result
+
+
+@asynccontextmanager
+async def page_stream(
+    produce: Callable[[Callable[[T], Awaitable[None]]], Awaitable[None]],
+) -> AsyncGenerator[PageStream[T], None]:
+    """Run ``produce`` in a background task for the length of an ``async with`` block.
+
+    ``produce`` is handed an ``emit`` callable that returns once the consumer
+    has taken the value, so the producer can fetch ahead while a page is
+    being worked on. Its error is raised from the stream where the consumer
+    reaches it. Leaving the block cancels whatever is still running.
+
+    The task group is entered and exited by the ``async with`` statement, so
+    both happen in the caller's task even when the loop over the stream is
+    left early. An async generator that yields inside a task group cannot
+    promise that: if it is closed by the garbage collector, the close runs
+    in another task.
+    """
+    send, receive = anyio.create_memory_object_stream[Any](0)
+
+    async def run() -> None:
+        try:
+            await produce(send.send)
+        except Exception as exc:  # noqa: BLE001 - handed to the consumer
+            await send.send(_Failure(exc))
+        finally:
+            send.close()
+
+    # An error from the block is raised outside the task group so that it is
+    # not wrapped in an exception group.
+    error: Exception | None = None
+    with send, receive:
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(run)
+            try:
+                yield PageStream(receive)
+            except Exception as exc:  # noqa: BLE001 - re-raised below
+                error = exc
+            finally:
+                task_group.cancel_scope.cancel()
+    if error is not None:
+        raise error
@@ -1,23 +1,55 @@
 from __future__ import annotations
 
-from typing import TypeVar, Generic, Callable, Any, Awaitable
+import os
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, aclosing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import anyio
+
+from xpoz._arrow import to_pandas, to_polars
+from xpoz._download import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_PARTS,
+    adecode_chunks,
+    adownload_to,
+    aiter_download,
+    decode_chunks,
+    download_to,
+    iter_download,
+)
+from xpoz._export import aiter_csv_rows, iter_csv_rows
+from xpoz._page_stream import page_stream
+from xpoz._rows import RowBacked, Validation, parse_rows
 from xpoz.types.common import PaginationInfo
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 T = TypeVar("T")
 
+DEFAULT_PREFETCH_PAGES = 2
+DEFAULT_PAGE_CONCURRENCY = 8
+
 
-class PaginatedResult(Generic[T]):
+class PaginatedResult(RowBacked[T]):
     def __init__(
         self,
-        data: list[T],
+        data: list[T] | None,
         pagination: PaginationInfo,
         table_name: str | None,
         export_operation_id: str | None,
         fetch_page: Callable[[int, str | None], PaginatedResult[T]],
         fetch_export: Callable[[str], str] | None,
+        *,
+        model: type[Any] | None = None,
+        rows: list[dict[str, Any]] | None = None,
+        validation: Validation = "full",
     ):
-        self.data = data
+        self._init_rows(data, model, rows, validation)
         self.pagination = pagination
         self._table_name = table_name
         self._export_operation_id = export_operation_id
@@ -44,6 +76,107 @@ class PaginatedResult(Generic[T]):
             raise RuntimeError("CSV export not available for this result")
         return self._fetch_export(self._export_operation_id)
 
+    def export_rows(
+        self, *, raw: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Any]:
+        """Download the CSV export and yield its rows as they arrive.
+
+        Rows are parsed into this result's item model, or left as dicts
+        with ``raw=True``. The file is streamed ``chunk_size`` bytes at a
+        time and never held in memory; gzip and zstd files are decoded on
+        the fly, and a dropped connection resumes with a Range request.
+        """
+        chunks = iter_download(self.export_csv(), chunk_size=chunk_size)
+        rows = iter_csv_rows(decode_chunks(chunks))
+        if raw or self._model is None:
+            yield from rows
+        else:
+            for row in rows:
+                yield parse_rows(self._model, [row], self._validation)[0]
+
+    def export_to(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        parts: int = DEFAULT_DOWNLOAD_PARTS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        decompress: bool = True,
+    ) -> Path:
+        """Download the CSV export to ``path``, which only appears once complete.
+
+        Large files are fetched as ``parts`` parallel byte ranges. If the
+        download fails, calling this again resumes from the saved progress.
+        """
+        return download_to(
+            self.export_csv(), path, parts=parts, chunk_size=chunk_size, decompress=decompress
+        )
+
+    def iter_pages(self, *, prefetch: int = DEFAULT_PREFETCH_PAGES) -> Iterator[PaginatedResult[T]]:
+        """Yield this page and every following one.
+
+        Up to ``prefetch`` upcoming pages are fetched on background threads
+        while the current one is consumed; ``prefetch=0`` fetches each page
+        only when it is needed. Pages are not kept after they are yielded.
+        Leaving the loop early cancels the prefetches that have not started.
+        """
+        yield self
+        first, last = self.pagination.page_number + 1, self.pagination.total_pages
+        if first > last:
+            return
+        if prefetch <= 0:
+            for page_number in range(first, last + 1):
+                yield self._fetch_page_result(page_number)
+            return
+
+        pages = iter(range(first, last + 1))
+        pending: deque[Future[PaginatedResult[T]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="xpoz-prefetch")
+        try:
+            for page_number in pages:
+                pending.append(executor.submit(self._fetch_page_result, page_number))
+                if len(pending) == prefetch:
+                    break
+            while pending:
+                page = pending.popleft().result()
+                next_number = next(pages, None)
+                if next_number is not None:
+                    pending.append(executor.submit(self._fetch_page_result, next_number))
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_items(self, *, prefetch: int = DEFAULT_PREFETCH_PAGES) -> Iterator[T]:
+        """Yield every item of this page and the following ones, in order."""
+        for page in self.iter_pages(prefetch=prefetch):
+            yield from page.data
+
+    def iter_record_batches(
+        self,
+        *,
+        columns: list[str] | None = None,
+        prefetch: int = DEFAULT_PREFETCH_PAGES,
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield an Arrow record batch per page, from this page on.
+
+        Batches are built from the response rows without creating model
+        objects. Every batch has the item model's schema, or just
+        ``columns`` when given.
+        """
+        schema = self._arrow_schema(columns)
+        for page in self.iter_pages(prefetch=prefetch):
+            yield schema.record_batch(page._raw_rows())
+
+    def to_arrow(self, *, columns: list[str] | None = None) -> pa.Table:
+        """Every row from this page on as an Arrow table (requires ``pyarrow``)."""
+        schema = self._arrow_schema(columns)
+        return schema.table(self.iter_record_batches(columns=columns))
+
+    def to_pandas(self, *, columns: list[str] | None = None) -> Any:
+        return to_pandas(self.to_arrow(columns=columns))
+
+    def to_polars(self, *, columns: list[str] | None = None) -> Any:
+        return to_polars(self.to_arrow(columns=columns))
+
     def _fetch_page_result(self, page_number: int) -> PaginatedResult[T]:
         return self._fetch_page(page_number, self._table_name)
 
@@ -55,17 +188,21 @@ class PaginatedResult(Generic[T]):
         )
 
 
-class AsyncPaginatedResult(Generic[T]):
+class AsyncPaginatedResult(RowBacked[T]):
     def __init__(
         self,
-        data: list[T],
+        data: list[T] | None,
         pagination: PaginationInfo,
         table_name: str | None,
         export_operation_id: str | None,
         fetch_page: Callable[[int, str | None], Awaitable[AsyncPaginatedResult[T]]],
         fetch_export: Callable[[str], Awaitable[str]] | None,
+        *,
+        model: type[Any] | None = None,
+        rows: list[dict[str, Any]] | None = None,
+        validation: Validation = "full",
     ):
-        self.data = data
+        self._init_rows(data, model, rows, validation)
         self.pagination = pagination
         self._table_name = table_name
         self._export_operation_id = export_operation_id
@@ -92,6 +229,167 @@ class AsyncPaginatedResult(Generic[T]):
             raise RuntimeError("CSV export not available for this result")
         return await self._fetch_export(self._export_operation_id)
 
+    async def export_rows(
+        self, *, raw: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Any]:
+        """Download the CSV export and yield its rows as they arrive."""
+        url = await self.export_csv()
+        chunks = aiter_download(url, chunk_size=chunk_size)
+        async for row in aiter_csv_rows(adecode_chunks(chunks)):
+            if raw or self._model is None:
+                yield row
+            else:
+                yield parse_rows(self._model, [row], self._validation)[0]
+
+    async def export_to(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        parts: int = DEFAULT_DOWNLOAD_PARTS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        decompress: bool = True,
+    ) -> Path:
+        """Download the CSV export to ``path``, which only appears once complete."""
+        url = await self.export_csv()
+        return await adownload_to(
+            url, path, parts=parts, chunk_size=chunk_size, decompress=decompress
+        )
+
+    async def fetch_pages(
+        self,
+        pages: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[AsyncPaginatedResult[T]]:
+        """Fetch several pages of this result at once, returned in the given order.
+
+        At most ``concurrency`` requests run at a time. If any page fails the
+        others are cancelled and the first error is raised.
+        """
+        numbers = list(pages)
+        for page_number in numbers:
+            if page_number < 1 or page_number > self.pagination.total_pages:
+                raise ValueError(
+                    f"Page {page_number} out of range (1-{self.pagination.total_pages})"
+                )
+        results: list[Any] = [None] * len(numbers)
+        errors: list[Exception] = []
+        limiter = anyio.CapacityLimiter(concurrency)
+
+        async def fetch(index: int, task_group: Any) -> None:
+            try:
+                async with limiter:
+                    results[index] = await self._fetch_page_result(numbers[index])
+            except Exception as exc:  # noqa: BLE001 - re-raised after the task group
+                errors.append(exc)
+                task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for index in range(len(numbers)):
+                task_group.start_soon(fetch, index, task_group)
+        if errors:
+            raise errors[0]
+        return results
+
+    async def iter_pages(
+        self, *, concurrency: int = DEFAULT_PAGE_CONCURRENCY
+    ) -> AsyncGenerator[AsyncPaginatedResult[T], None]:
+        """Yield this page and every following one, in order.
+
+        The following pages are fetched ``concurrency`` at a time, and each
+        batch is fetched only when the loop reaches it. Nothing runs while the
+        consumer holds a page, so the loop can be left at any point. To keep
+        fetching while pages are being worked on, use ``stream_pages()``.
+        """
+        yield self
+        numbers = range(self.pagination.page_number + 1, self.pagination.total_pages + 1)
+        window = max(1, concurrency)
+        for start in range(0, len(numbers), window):
+            for page in await self.fetch_pages(numbers[start:start + window], concurrency=window):
+                yield page
+
+    def stream_pages(
+        self, *, concurrency: int = DEFAULT_PAGE_CONCURRENCY
+    ) -> AbstractAsyncContextManager[AsyncIterator[AsyncPaginatedResult[T]]]:
+        """Iterate this page and every following one through a sliding window.
+
+        Up to ``concurrency`` pages are in flight or waiting to be taken. Each
+        page the consumer takes starts the next fetch, and pages that arrive
+        out of order wait for the ones before them. Fetches keep running while
+        the consumer holds a page, so they belong to an ``async with`` block;
+        leaving it cancels them::
+
+            async with result.stream_pages(concurrency=8) as pages:
+                async for page in pages:
+                    ...
+        """
+        numbers = range(self.pagination.page_number + 1, self.pagination.total_pages + 1)
+        window = max(1, concurrency)
+
+        async def fetch(number: int, done: anyio.Event, outcome: list[Any]) -> None:
+            try:
+                outcome.append(await self._fetch_page_result(number))
+            except Exception as exc:  # noqa: BLE001 - raised by the producer
+                outcome.append(exc)
+            done.set()
+
+        async def produce(emit: Callable[[AsyncPaginatedResult[T]], Awaitable[None]]) -> None:
+            await emit(self)
+            pending: dict[int, tuple[anyio.Event, list[Any]]] = {}
+            error: Exception | None = None
+            async with anyio.create_task_group() as task_group:
+
+                def start(number: int) -> None:
+                    pending[number] = (anyio.Event(), [])
+                    task_group.start_soon(fetch, number, *pending[number])
+
+                for number in numbers[:window]:
+                    start(number)
+                for index, number in enumerate(numbers):
+                    done, outcome = pending.pop(number)
+                    await done.wait()
+                    if isinstance(outcome[0], Exception):
+                        error = outcome[0]
+                        task_group.cancel_scope.cancel()
+                        break
+                    await emit(outcome[0])
+                    if index + window < len(numbers):
+                        start(numbers[index + window])
+            if error is not None:
+                raise error
+
+        return page_stream(produce)
+
+    async def iter_items(self, *, concurrency: int = DEFAULT_PAGE_CONCURRENCY) -> AsyncIterator[T]:
+        """Yield every item of this page and the following ones, in order."""
+        async with aclosing(self.iter_pages(concurrency=concurrency)) as pages:
+            async for page in pages:
+                for item in page.data:
+                    yield item
+
+    async def iter_record_batches(
+        self,
+        *,
+        columns: list[str] | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Yield an Arrow record batch per page, from this page on."""
+        schema = self._arrow_schema(columns)
+        async with aclosing(self.iter_pages(concurrency=concurrency)) as pages:
+            async for page in pages:
+                yield schema.record_batch(page._raw_rows())
+
+    async def to_arrow(self, *, columns: list[str] | None = None) -> pa.Table:
+        schema = self._arrow_schema(columns)
+        async with self.stream_pages() as pages:
+            return schema.table([schema.record_batch(page._raw_rows()) async for page in pages])
+
+    async def to_pandas(self, *, columns: list[str] | None = None) -> Any:
+        return to_pandas(await self.to_arrow(columns=columns))
+
+    async def to_polars(self, *, columns: list[str] | None = None) -> Any:
+        return to_polars(await self.to_arrow(columns=columns))
+
     async def _fetch_page_result(self, page_number: int) -> AsyncPaginatedResult[T]:
         return await self._fetch_page(page_number, self._table_name)
 
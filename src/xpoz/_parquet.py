@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from contextlib import aclosing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+import anyio
+
+from xpoz._arrow import ArrowSchema, model_rows, require_pyarrow
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_ROW_GROUP_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_BUFFERED_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_OPEN_FILES = 64
+_ROWS_PER_BATCH = 10_000
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+class _Partition:
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.batches: list[pa.RecordBatch] = []
+        self.nbytes = 0
+
+
+class ParquetSink:
+    """Writes results to Parquet files partitioned Hive-style by column values.
+
+    Rows are buffered per partition and written as one row group once a
+    partition holds ``row_group_bytes``; when all buffers together exceed
+    ``max_buffered_bytes`` the largest is flushed early. Every file has the
+    same schema, the model's fields (or ``columns``) minus the partition
+    columns, whatever ``fields=`` projection each page was fetched with.
+
+    Files are written as hidden ``.part-N.parquet`` and renamed when they
+    are closed, so readers only ever see complete files. If the ``with``
+    block raises, the files still open are deleted rather than renamed::
+
+        with ParquetSink("posts", TwitterPost, partition_by="created_at_date",
+                         static_partitions={"platform": "twitter"}) as sink:
+            sink.write(client.twitter.search_posts("AI"))
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        model: type[Any],
+        *,
+        partition_by: str | Sequence[str] | None = None,
+        static_partitions: Mapping[str, str] | None = None,
+        columns: list[str] | None = None,
+        row_group_bytes: int = DEFAULT_ROW_GROUP_BYTES,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+        compression: str = "zstd",
+    ):
+        self._pa = require_pyarrow()
+        import pyarrow.compute
+        import pyarrow.parquet
+
+        self._pc = pyarrow.compute
+        self._pq = pyarrow.parquet
+        self.root = Path(root)
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        self._partition_by = list(partition_by or [])
+        self._static = dict(static_partitions or {})
+        self._arrow = ArrowSchema(model, columns)
+        missing = [name for name in self._partition_by if name not in self._arrow.names]
+        if missing:
+            raise ValueError(f"Partition columns not among the written columns: {missing}")
+        self._file_schema: pa.Schema = self._arrow.schema
+        for name in self._partition_by:
+            self._file_schema = self._file_schema.remove(self._file_schema.get_field_index(name))
+        self._row_group_bytes = row_group_bytes
+        self._max_buffered_bytes = max_buffered_bytes
+        self._max_open_files = max_open_files
+        self._compression = compression
+        self._partitions: dict[tuple[Any, ...], _Partition] = {}
+        self._writers: OrderedDict[tuple[Any, ...], tuple[Any, Path, Path]] = OrderedDict()
+        self._file_counters: dict[tuple[Any, ...], int] = {}
+        self._buffered = 0
+        self.rows_written = 0
+        self.files: list[Path] = []
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self._file_schema
+
+    def write(self, source: Any) -> int:
+        """Write a paginated or cursor result (all pages), rows or Arrow data.
+
+        ``source`` may be a ``PaginatedResult``/``CursorResult``, an Arrow
+        table or record batch, or any iterable of dicts or models, such as
+        ``result.export_rows(raw=True)``. Returns the number of rows taken.
+        """
+        if hasattr(source, "iter_pages"):
+            return sum(self.write_rows(page._raw_rows()) for page in source.iter_pages())
+        if isinstance(source, (self._pa.Table, self._pa.RecordBatch)):
+            return self.write_arrow(source)
+        written = 0
+        batch: list[Any] = []
+        for row in source:
+            batch.append(row)
+            if len(batch) >= _ROWS_PER_BATCH:
+                written += self.write_rows(batch)
+                batch = []
+        return written + self.write_rows(batch)
+
+    async def awrite(self, source: Any) -> int:
+        """Async counterpart of ``write`` for async results and async iterables.
+
+        Encoding and writing run in a worker thread, one batch at a time.
+        """
+        written = 0
+        if hasattr(source, "iter_pages"):
+            async with aclosing(source.iter_pages()) as pages:
+                async for page in pages:
+                    written += await anyio.to_thread.run_sync(self.write_rows, page._raw_rows())
+            return written
+        rows: AsyncIterable[Any] = source
+        batch: list[Any] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= _ROWS_PER_BATCH:
+                written += await anyio.to_thread.run_sync(self.write_rows, batch)
+                batch = []
+        return written + await anyio.to_thread.run_sync(self.write_rows, batch)
+
+    def write_rows(self, rows: Iterable[Any]) -> int:
+        rows = list(rows)
+        if not rows:
+            return 0
+        return self.write_arrow(self._arrow.record_batch(model_rows(rows)))
+
+    def write_arrow(self, data: pa.Table | pa.RecordBatch) -> int:
+        if not data.schema.equals(self._arrow.schema):
+            data = data.select(self._arrow.names).cast(self._arrow.schema)
+        batches = data.to_batches() if isinstance(data, self._pa.Table) else [data]
+        for batch in batches:
+            if batch.num_rows:
+                self._add(batch)
+        while self._buffered > self._max_buffered_bytes:
+            key = max(self._partitions, key=lambda k: self._partitions[k].nbytes)
+            self._flush(key)
+        return int(data.num_rows)
+
+    def flush(self) -> None:
+        for key in list(self._partitions):
+            self._flush(key)
+
+    def close(self) -> list[Path]:
+        self.flush()
+        while self._writers:
+            self._close_writer(next(iter(self._writers)))
+        return self.files
+
+    def __enter__(self) -> ParquetSink:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def _add(self, batch: pa.RecordBatch) -> None:
+        if not self._partition_by:
+            self._buffer((), batch)
+            return
+        keys = self._pa.Table.from_batches([batch]).select(self._partition_by)
+        groups = keys.group_by(self._partition_by, use_threads=False).aggregate([])
+        for group in groups.to_pylist():
+            mask = None
+            for name in self._partition_by:
+                value = group[name]
+                column = batch.column(name)
+                match = (
+                    self._pc.is_null(column) if value is None else self._pc.equal(column, value)
+                )
+                mask = match if mask is None else self._pc.and_(mask, match)
+            part = batch.filter(self._pc.fill_null(mask, False))
+            self._buffer(tuple(group[name] for name in self._partition_by), part)
+
+    def _buffer(self, key: tuple[Any, ...], batch: pa.RecordBatch) -> None:
+        for name in self._partition_by:
+            batch = batch.drop_columns([name])
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = _Partition(self._directory(key))
+        partition.batches.append(batch)
+        partition.nbytes += batch.nbytes
+        self._buffered += batch.nbytes
+        if partition.nbytes >= self._row_group_bytes:
+            self._flush(key)
+
+    def _directory(self, key: tuple[Any, ...]) -> Path:
+        directory = self.root
+        for name, value in [*self._static.items(), *zip(self._partition_by, key)]:
+            text = _NULL_PARTITION if value is None else quote(str(value), safe="")
+            directory = directory / f"{name}={text}"
+        return directory
+
+    def _flush(self, key: tuple[Any, ...]) -> None:
+        partition = self._partitions.pop(key, None)
+        if partition is None or not partition.batches:
+            return
+        self._buffered -= partition.nbytes
+        table = self._pa.Table.from_batches(partition.batches, schema=self._file_schema)
+        writer = self._writer(key, partition)
+        writer.write_table(table, row_group_size=table.num_rows)
+        self.rows_written += table.num_rows
+
+    def _writer(self, key: tuple[Any, ...], partition: _Partition) -> Any:
+        entry = self._writers.get(key)
+        if entry is not None:
+            self._writers.move_to_end(key)
+            return entry[0]
+        while len(self._writers) >= self._max_open_files:
+            self._close_writer(next(iter(self._writers)))
+        partition.directory.mkdir(parents=True, exist_ok=True)
+        number = self._file_counters.get(key, 0)
+        while (partition.directory / f"part-{number}.parquet").exists():
+            number += 1
+        self._file_counters[key] = number + 1
+        final = partition.directory / f"part-{number}.parquet"
+        hidden = partition.directory / f".part-{number}.parquet"
+        writer = self._pq.ParquetWriter(hidden, self._file_schema, compression=self._compression)
+        self._writers[key] = (writer, hidden, final)
+        return writer
+
+    def _close_writer(self, key: tuple[Any, ...]) -> None:
+        writer, hidden, final = self._writers.pop(key)
+        writer.close()
+        hidden.replace(final)
+        self.files.append(final)
+
+    def _discard(self) -> None:
+        self._partitions.clear()
+        self._buffered = 0
+        while self._writers:
+            writer, hidden, _ = self._writers.popitem(last=False)[1]
+            try:
+                writer.close()
+            finally:
+                hidden.unlink(missing_ok=True)
@@ -11,7 +11,9 @@ from xpoz._exceptions import (
     XpozConnectionError,
     XpozError,
 )
+from xpoz._json import loads
 from xpoz._mcp._transport import _resolve_user_agent
+from xpoz._retry import RetryPolicy, acall_with_retry, call_with_retry
 
 _HTTP_TIMEOUT_SECONDS = 120.0
 
@@ -28,7 +30,7 @@ def _raise_for_status(response: httpx.Response) -> None:
         return
 
     try:
-        payload = response.json()
+        payload = loads(response.content)
         message = payload.get("error") or payload.get("message") or response.text
     except ValueError:
         message = response.text
@@ -46,6 +48,12 @@ def _clean_params(params: dict[str, Any]) -> dict[str, Any]:
     return {key: value for key, value in params.items() if value is not None}
 
 
+def _raise_if_retryable(response: httpx.Response, policy: RetryPolicy) -> httpx.Response:
+    if response.status_code in policy.retry_statuses:
+        response.raise_for_status()
+    return response
+
+
 class RestTransport:
     def __init__(
         self,
@@ -53,6 +61,7 @@ class RestTransport:
         api_key: str | None = None,
         *,
         timeout: float = _HTTP_TIMEOUT_SECONDS,
+        retry: RetryPolicy | None = None,
         _user_agent: str | None = None,
     ):
         self._client = httpx.Client(
@@ -60,15 +69,25 @@ class RestTransport:
             headers=_build_headers(api_key, _user_agent),
             timeout=timeout,
         )
+        self._retry = retry or RetryPolicy()
+        self._breaker = self._retry.breaker(base_url)
 
     def get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        clean = _clean_params(params)
+
+        def _get() -> httpx.Response:
+            response = self._client.get(path, params=clean)
+            return _raise_if_retryable(response, self._retry)
+
         try:
-            response = self._client.get(path, params=_clean_params(params))
+            response = call_with_retry(self._retry, self._breaker, _get)
+        except httpx.HTTPStatusError as error:
+            response = error.response
         except httpx.HTTPError as error:
             raise XpozConnectionError(str(error)) from error
 
         _raise_for_status(response)
-        payload: dict[str, Any] = response.json()
+        payload: dict[str, Any] = loads(response.content)
         return payload
 
     def close(self) -> None:
@@ -82,6 +101,7 @@ class AsyncRestTransport:
         api_key: str | None = None,
         *,
         timeout: float = _HTTP_TIMEOUT_SECONDS,
+        retry: RetryPolicy | None = None,
         _user_agent: str | None = None,
     ):
         self._client = httpx.AsyncClient(
@@ -89,15 +109,25 @@ class AsyncRestTransport:
             headers=_build_headers(api_key, _user_agent),
             timeout=timeout,
         )
+        self._retry = retry or RetryPolicy()
+        self._breaker = self._retry.breaker(base_url)
 
     async def get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        clean = _clean_params(params)
+
+        async def _get() -> httpx.Response:
+            response = await self._client.get(path, params=clean)
+            return _raise_if_retryable(response, self._retry)
+
         try:
-            response = await self._client.get(path, params=_clean_params(params))
+            response = await acall_with_retry(self._retry, self._breaker, _get)
+        except httpx.HTTPStatusError as error:
+            response = error.response
         except httpx.HTTPError as error:
             raise XpozConnectionError(str(error)) from error
 
         _raise_for_status(response)
-        payload: dict[str, Any] = response.json()
+        payload: dict[str, Any] = loads(response.content)
         return payload
 
     async def close(self) -> None:
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+import anyio
+import httpx
+from mcp.types import CONNECTION_CLOSED, INTERNAL_ERROR
+
+from xpoz._config import _tools
+from xpoz._exceptions import CircuitOpenError
+
+R = TypeVar("R")
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_RETRY_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+# Tools that change server state. They are only retried when the failed
+# attempt provably never reached the server (connection refused, DNS, ...).
+_NON_IDEMPOTENT_TOOLS = frozenset({_tools.ADD_TRACKED_ITEMS, _tools.REMOVE_TRACKED_ITEMS})
+
+# JSON-RPC errors the MCP client synthesizes when the HTTP exchange itself
+# failed (non-2xx response, dropped stream) rather than the tool.
+_TRANSIENT_MCP_CODES = frozenset({CONNECTION_CLOSED, INTERNAL_ERROR})
+
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_STREAM_ERRORS = (
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+def is_idempotent(tool_name: str) -> bool:
+    return tool_name not in _NON_IDEMPOTENT_TOOLS
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter plus a per-endpoint circuit breaker.
+
+    Attempt ``n`` sleeps up to ``initial_backoff * multiplier ** (n - 1)``
+    seconds, capped at ``max_backoff``. A ``Retry-After`` header replaces the
+    computed delay; if it asks for longer than ``max_backoff`` the error is
+    raised instead. After ``failure_threshold`` consecutive transient failures
+    the endpoint's breaker opens and calls fail fast with ``CircuitOpenError``
+    for ``recovery_timeout`` seconds, after which a single probe is let through.
+
+    Pass ``RetryPolicy(max_attempts=1)`` to disable retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Delay before retrying after failed attempt number ``attempt``, or
+        None when the server asked for a longer wait than ``max_backoff``."""
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        return CircuitBreaker(endpoint, self.failure_threshold, self.recovery_timeout)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"initial_backoff={self.initial_backoff}, max_backoff={self.max_backoff})"
+        )
+
+
+class CircuitBreaker:
+    def __init__(self, endpoint: str, failure_threshold: int, recovery_timeout: float):
+        self.endpoint = endpoint
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self._recovery_timeout - time.monotonic()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(self.endpoint, max(remaining, 0.0))
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _classify(exc: BaseException, policy: RetryPolicy) -> tuple[bool, float | None] | None:
+    """Return ``(sent, retry_after)`` for transient failures, None otherwise.
+
+    ``sent`` is False only when the request cannot have reached the server.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        if exc.response.status_code not in policy.retry_statuses:
+            return None
+        return True, _parse_retry_after(exc.response.headers.get("Retry-After"))
+    if isinstance(exc, _UNSENT_ERRORS):
+        return False, None
+    if isinstance(exc, _STREAM_ERRORS):
+        return True, None
+    code = getattr(getattr(exc, "error", None), "code", None)
+    if code in _TRANSIENT_MCP_CODES:
+        return True, None
+    return None
+
+
+def _next_delay(
+    policy: RetryPolicy,
+    exc: BaseException,
+    attempt: int,
+    idempotent: bool,
+) -> float | None:
+    if attempt >= policy.max_attempts:
+        return None
+    failure = _classify(exc, policy)
+    if failure is None:
+        return None
+    sent, retry_after = failure
+    if sent and not idempotent:
+        return None
+    return policy.backoff(attempt, retry_after)
+
+
+def _is_transient(exc: BaseException, policy: RetryPolicy) -> bool:
+    return _classify(exc, policy) is not None
+
+
+def call_with_retry(
+    policy: RetryPolicy,
+    breaker: CircuitBreaker,
+    fn: Callable[[], R],
+    *,
+    idempotent: bool = True,
+) -> R:
+    attempt = 0
+    while True:
+        attempt += 1
+        breaker.before_call()
+        try:
+            result = fn()
+        except Exception as exc:
+            if not _is_transient(exc, policy):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            delay = _next_delay(policy, exc, attempt, idempotent)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            continue
+        breaker.record_success()
+        return result
+
+
+async def acall_with_retry(
+    policy: RetryPolicy,
+    breaker: CircuitBreaker,
+    fn: Callable[[], Awaitable[R]],
+    *,
+    idempotent: bool = True,
+) -> R:
+    attempt = 0
+    while True:
+        attempt += 1
+        breaker.before_call()
+        try:
+            result = await fn()
+        except Exception as exc:
+            if not _is_transient(exc, policy):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            delay = _next_delay(policy, exc, attempt, idempotent)
+            if delay is None:
+                raise
+            await anyio.sleep(delay)
+            continue
+        breaker.record_success()
+        return result
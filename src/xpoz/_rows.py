@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, Generic, Literal, TypeVar
+
+from pydantic import TypeAdapter
+
+from xpoz._arrow import ArrowSchema, model_rows
+
+T = TypeVar("T")
+
+Validation = Literal["full", "none"]
+VALIDATION_MODES: tuple[Validation, ...] = ("full", "none")
+
+
+def check_validation(validation: str) -> Validation:
+    if validation not in VALIDATION_MODES:
+        raise ValueError(
+            f"validation must be one of {', '.join(VALIDATION_MODES)}; got {validation!r}"
+        )
+    return validation
+
+
+_list_adapters: dict[type[Any], TypeAdapter[list[Any]]] = {}
+
+
+def _list_adapter(model: type[Any]) -> TypeAdapter[list[Any]]:
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def validate_rows(model: type[T], rows: list[dict[str, Any]]) -> list[T]:
+    """Validate a page of snake_case rows into ``model`` in a single call."""
+    return _list_adapter(model).validate_python(rows)
+
+
+def parse_rows(
+    model: type[T], rows: list[dict[str, Any]], validation: Validation = "full"
+) -> list[T]:
+    """Turn snake_case rows into items as ``validation`` says.
+
+    ``full`` validates every field and ``none`` returns the rows themselves.
+    """
+    if validation == "full":
+        return validate_rows(model, rows)
+    return rows  # type: ignore[return-value]
+
+
+class RowBacked(Generic[T]):
+    """Base for results whose items can be kept as rows until ``data`` is read.
+
+    Namespaces pass the response rows (snake_case dicts) and the item model;
+    models are only built on first access to ``data``, so paths that work on
+    rows directly, such as Arrow output, skip them entirely.
+    """
+
+    _data: list[T] | None
+    _rows: list[dict[str, Any]] | None
+    _model: type[Any] | None
+    _validation: Validation
+
+    def _init_rows(
+        self,
+        data: list[T] | None,
+        model: type[Any] | None,
+        rows: list[dict[str, Any]] | None,
+        validation: Validation = "full",
+    ) -> None:
+        if data is None and (rows is None or model is None):
+            data = []
+        self._data = data
+        self._model = model
+        self._rows = rows
+        self._validation = validation
+
+    @property
+    def data(self) -> list[T]:
+        if self._data is None:
+            assert self._model is not None and self._rows is not None
+            self._data = parse_rows(self._model, self._rows, self._validation)
+        return self._data
+
+    @data.setter
+    def data(self, value: list[T]) -> None:
+        self._data = value
+
+    def _raw_rows(self) -> list[dict[str, Any]]:
+        if self._rows is not None:
+            return self._rows
+        return model_rows(self.data)
+
+    def _arrow_schema(self, columns: list[str] | None) -> ArrowSchema:
+        model = self._model
+        if model is None and self.data:
+            model = type(self.data[0])
+        if model is None:
+            raise RuntimeError("Cannot build an Arrow schema: this result has no item model")
+        return ArrowSchema(model, columns)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any, Generic, TypeVar
+
+import anyio
+
+R = TypeVar("R")
+
+
+class SingleFlight(Generic[R]):
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight wait and receive the same result or exception. Nothing is kept
+    once the call finishes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[R]] = {}
+
+    def do(self, key: str, fn: Callable[[], R]) -> R:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class _AsyncCall:
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.cancelled = False
+
+
+class AsyncSingleFlight(Generic[R]):
+    """Async counterpart of ``SingleFlight``.
+
+    If the leading task is cancelled its followers are not: one of them
+    takes over and runs ``fn`` again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _AsyncCall] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[R]]) -> R:
+        while True:
+            call = self._calls.get(key)
+            if call is None:
+                break
+            await call.done.wait()
+            if call.cancelled:
+                continue
+            if call.error is not None:
+                raise call.error
+            result: R = call.result
+            return result
+
+        call = self._calls[key] = _AsyncCall()
+        try:
+            call.result = await fn()
+            return call.result  # type: ignore[no-any-return]
+        except anyio.get_cancelled_exc_class():
+            call.cancelled = True
+            raise
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+
+class OwnedTask:
+    """A background task owned by an object rather than by a task group.
+
+    A task group has to be exited by the task that entered it, which
+    ``start()``/``aclose()`` pairs cannot promise: ``asyncio.wait_for`` and
+    ``create_task`` run them in different tasks. This task is created on the
+    running asyncio loop and ``cancel()`` may be awaited from any task; a
+    task group the function needs is entered and exited inside it.
+    """
+
+    def __init__(self, fn: Callable[[], Coroutine[Any, Any, None]], *, name: str):
+        self._task = asyncio.get_running_loop().create_task(fn(), name=name)
+
+    async def cancel(self) -> None:
+        """Cancel the task and wait for it to finish; its errors are dropped."""
+        self._task.cancel()
+        await asyncio.wait({self._task})
+        if not self._task.cancelled():
+            self._task.exception()
@@ -1,8 +1,13 @@
 import re
+from typing import Any
 
 _CAMEL_TO_SNAKE_RE1 = re.compile(r"(.)([A-Z][a-z]+)")
 _CAMEL_TO_SNAKE_RE2 = re.compile(r"([a-z0-9])([A-Z])")
 
+# Keys beyond the known vocabulary that are remembered; any further unseen
+# keys are converted on every call rather than growing the tables forever.
+_MAX_LEARNED_KEYS = 4096
+
 
 def camel_to_snake(name: str) -> str:
     s = _CAMEL_TO_SNAKE_RE1.sub(r"\1_\2", name)
@@ -14,15 +19,78 @@ def snake_to_camel(name: str) -> str:
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
+def _vocabulary() -> set[str]:
+    """Snake_case names of every model field and every allowed ``fields=`` value."""
+    import xpoz.types
+    from xpoz._config import _allowed_fields
+
+    names: set[str] = set()
+    for model_name in xpoz.types.__all__:
+        names.update(getattr(xpoz.types, model_name).model_fields)
+    for value in vars(_allowed_fields).values():
+        if isinstance(value, frozenset):
+            names.update(value)
+    return names
+
+
+def _build_tables() -> tuple[dict[str, str], dict[str, str]]:
+    to_snake: dict[str, str] = {}
+    to_camel: dict[str, str] = {}
+    for snake in _vocabulary():
+        camel = snake_to_camel(snake)
+        to_camel[snake] = camel
+        to_snake[camel] = camel_to_snake(camel)
+        to_snake[snake] = camel_to_snake(snake)
+    return to_snake, to_camel
+
+
+_TO_SNAKE, _TO_CAMEL = _build_tables()
+_TABLE_SIZES = (len(_TO_SNAKE), len(_TO_CAMEL))
+
+
+def to_snake(name: str) -> str:
+    """``camel_to_snake`` through the key table, learning unseen keys up to a bound."""
+    snake = _TO_SNAKE.get(name)
+    if snake is None:
+        snake = camel_to_snake(name)
+        if len(_TO_SNAKE) < _TABLE_SIZES[0] + _MAX_LEARNED_KEYS:
+            _TO_SNAKE[name] = snake
+    return snake
+
+
+def to_camel(name: str) -> str:
+    camel = _TO_CAMEL.get(name)
+    if camel is None:
+        camel = snake_to_camel(name)
+        if len(_TO_CAMEL) < _TABLE_SIZES[1] + _MAX_LEARNED_KEYS:
+            _TO_CAMEL[name] = camel
+    return camel
+
+
 def map_fields_to_camel(fields: list[str] | None) -> list[str] | None:
     if fields is None:
         return None
-    return [snake_to_camel(f) for f in fields]
+    return [to_camel(f) for f in fields]
 
 
 def map_dict_keys_to_snake(data: dict[str, object]) -> dict[str, object]:
-    return {camel_to_snake(k): v for k, v in data.items()}
+    return {to_snake(k): v for k, v in data.items()}
+
 
+def map_list_of_dicts_to_snake(data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Map the keys of many rows, converting each distinct key layout once.
 
-def map_list_of_dicts_to_snake(data: list[dict[str, object]]) -> list[dict[str, object]]:
-    return [map_dict_keys_to_snake(item) for item in data]
+    Rows of one response nearly always share their keys in the same order
+    (every row of a TOON table has exactly the header's columns), so the
+    snake_case keys are worked out once and zipped onto each row's values.
+    """
+    mapped: list[dict[str, Any]] = []
+    keys: tuple[str, ...] = ()
+    snake_keys: list[str] = []
+    for item in data:
+        item_keys = tuple(item)
+        if item_keys != keys:
+            keys = item_keys
+            snake_keys = [to_snake(k) for k in keys]
+        mapped.append(dict(zip(snake_keys, item.values())))
+    return mapped
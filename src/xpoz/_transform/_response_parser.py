@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+import functools
 import re
-from typing import Any
+import types
+from collections.abc import Callable
+from typing import Any, Literal, Union, get_args, get_origin
+
+from xpoz._json import loads
+
+# Every parser below takes the line index to start at and returns the index
+# of the first line it did not consume, so each line is looked at once.
+_KV_RE = re.compile(r"^(\S+?):\s*(.*)")
+_DATA_TABLE_RE = re.compile(r"^data\[(\d+)\]\{(.+)\}:")
+_DATA_LIST_RE = re.compile(r"^data\[(\d+)\]:")
+_TABLE_RE = re.compile(r"^(\w+)\[(\d+)\]\{(.+)\}:")
+_LIST_RE = re.compile(r"^(\w+)\[(\d+)\]:")
+
+_MAX_SAFE_INT = 9007199254740991
 
 
 def parse_response_text(text: str) -> dict[str, Any]:
@@ -9,10 +24,10 @@ def parse_response_text(text: str) -> dict[str, Any]:
         return {}
 
     if text.lstrip().startswith("{"):
-        import json
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            parsed: dict[str, Any] = loads(text)
+            return parsed
+        except ValueError:
             pass
 
     lines = text.split("\n")
@@ -22,42 +37,36 @@ def parse_response_text(text: str) -> dict[str, Any]:
 
     result: dict[str, Any] = {}
     i = 0
-    while i < len(lines):
+    n = len(lines)
+    while i < n:
         line = lines[i]
 
         if not line.strip():
             i += 1
             continue
 
-        array_match = re.match(r"^data\[(\d+)\]\{(.+)\}:", line)
-        if array_match:
-            fields = [f.strip() for f in array_match.group(2).split(",")]
-            i += 1
-            rows = _parse_csv_rows(lines, i, indent=2, fields=fields)
-            result["results"] = rows
-            i += _count_indented(lines, i, 2)
-            continue
+        if line.startswith("data"):
+            table_match = _DATA_TABLE_RE.match(line)
+            if table_match:
+                fields = _fields(table_match.group(2))
+                expected = int(table_match.group(1))
+                result["results"], i = _parse_csv_rows(lines, i + 1, 2, fields, expected)
+                continue
 
-        yaml_list_match = re.match(r"^data\[(\d+)\]:", line)
-        if yaml_list_match:
-            i += 1
-            rows = _parse_yaml_list(lines, i, indent=2)
-            result["results"] = rows
-            i += _count_indented(lines, i, 2)
-            continue
+            if _DATA_LIST_RE.match(line):
+                result["results"], i = _parse_yaml_list(lines, i + 1, 2)
+                continue
 
-        if line == "data:":
-            i += 1
-            data, consumed = _parse_data_block(lines, i)
-            result.update(data)
-            i += consumed
-            continue
+            if line == "data:":
+                data, i = _parse_block(lines, i + 1, 2)
+                result.update(data)
+                continue
 
         if line.startswith("success:"):
             i += 1
             continue
 
-        kv_match = re.match(r"^(\S+?):\s*(.*)", line)
+        kv_match = _KV_RE.match(line)
         if kv_match:
             result[kv_match.group(1)] = _coerce(kv_match.group(2))
 
@@ -68,84 +77,91 @@ def parse_response_text(text: str) -> dict[str, Any]:
 
 def _parse_flat_kv(lines: list[str]) -> dict[str, Any]:
     result: dict[str, Any] = {}
+    match = _KV_RE.match
     for line in lines:
-        m = re.match(r"^(\S+?):\s*(.*)", line)
+        m = match(line)
         if m:
             result[m.group(1)] = _coerce(m.group(2))
     return result
 
 
-def _parse_data_block(lines: list[str], start: int) -> tuple[dict[str, Any], int]:
-    return _parse_block(lines, start, indent=2)
+def _fields(header: str) -> list[str]:
+    return [f.strip() for f in header.split(",")]
 
 
-def _parse_block(
-    lines: list[str], start: int, indent: int
-) -> tuple[dict[str, Any], int]:
+def _skip_indented(lines: list[str], i: int, prefix: str) -> int:
+    """Skip the rest of a section: lines under ``prefix`` and blank lines."""
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        if not line.startswith(prefix) and line.strip():
+            break
+        i += 1
+    return i
+
+
+def _parse_block(lines: list[str], start: int, indent: int) -> tuple[dict[str, Any], int]:
     result: dict[str, Any] = {}
     prefix = " " * indent
+    child_prefix = prefix + "  "
+    n = len(lines)
     i = start
-    while i < len(lines):
+    while i < n:
         line = lines[i]
 
         if not line.startswith(prefix):
             break
-        if len(line) > len(prefix) and line[len(prefix)] == " ":
+        if len(line) > indent and line[indent] == " ":
             break
 
         stripped = line[indent:]
 
-        array_match = re.match(r"^(\w+)\[(\d+)\]\{(.+)\}:", stripped)
-        if array_match:
-            key = array_match.group(1)
-            fields = [f.strip() for f in array_match.group(3).split(",")]
-            i += 1
-            rows = _parse_csv_rows(lines, i, indent=indent + 2, fields=fields)
-            result[key] = rows
-            i += _count_indented(lines, i, indent + 2)
-            continue
-
-        yaml_list_match = re.match(r"^(\w+)\[(\d+)\]:", stripped)
-        if yaml_list_match:
-            key = yaml_list_match.group(1)
-            i += 1
-            rows = _parse_yaml_list(lines, i, indent=indent + 2)
-            result[key] = rows
-            i += _count_indented(lines, i, indent + 2)
-            continue
-
-        kv_match = re.match(r"^(\S+?):\s*(.*)", stripped)
+        if "[" in stripped:
+            table_match = _TABLE_RE.match(stripped)
+            if table_match:
+                fields = _fields(table_match.group(3))
+                expected = int(table_match.group(2))
+                result[table_match.group(1)], i = _parse_csv_rows(
+                    lines, i + 1, indent + 2, fields, expected
+                )
+                continue
+
+            list_match = _LIST_RE.match(stripped)
+            if list_match:
+                result[list_match.group(1)], i = _parse_yaml_list(lines, i + 1, indent + 2)
+                continue
+
+        kv_match = _KV_RE.match(stripped)
         if kv_match:
             key, val = kv_match.group(1), kv_match.group(2)
             if val:
                 result[key] = _coerce(val)
                 i += 1
+            elif i + 1 < n and lines[i + 1].startswith(child_prefix):
+                result[key], i = _parse_block(lines, i + 1, indent + 2)
             else:
-                child_prefix = " " * (indent + 2)
-                if i + 1 < len(lines) and lines[i + 1].startswith(child_prefix):
-                    i += 1
-                    nested, consumed = _parse_block(lines, i, indent + 2)
-                    result[key] = nested
-                    i += consumed
-                else:
-                    result[key] = None
-                    i += 1
+                result[key] = None
+                i += 1
             continue
 
         i += 1
 
-    return result, i - start
+    return result, i
 
 
 def _parse_yaml_list(
     lines: list[str], start: int, indent: int
-) -> list[dict[str, Any]]:
+) -> tuple[list[dict[str, Any]], int]:
     rows: list[dict[str, Any]] = []
     prefix = " " * indent
     item_prefix = prefix + "- "
     continuation_prefix = prefix + "  "
+    item_len = len(item_prefix)
+    continuation_len = len(continuation_prefix)
+    match = _KV_RE.match
+    n = len(lines)
     i = start
-    while i < len(lines):
+    while i < n:
         line = lines[i]
         if not line.startswith(prefix):
             break
@@ -154,92 +170,104 @@ def _parse_yaml_list(
             continue
         if line.startswith(item_prefix):
             row: dict[str, Any] = {}
-            first_kv = line[len(item_prefix):]
-            m = re.match(r"^(\S+?):\s*(.*)", first_kv)
+            m = match(line[item_len:])
             if m:
                 row[m.group(1)] = _coerce(m.group(2))
             i += 1
-            while i < len(lines):
+            while i < n:
                 cline = lines[i]
                 if not cline.startswith(continuation_prefix):
                     break
-                if cline.startswith(item_prefix):
-                    break
-                stripped = cline[len(continuation_prefix):]
-                cm = re.match(r"^(\S+?):\s*(.*)", stripped)
+                cm = match(cline[continuation_len:])
                 if cm:
                     row[cm.group(1)] = _coerce(cm.group(2))
                 i += 1
             rows.append(row)
         else:
             i += 1
-    return rows
+    return rows, _skip_indented(lines, i, prefix)
 
 
 def _parse_csv_rows(
-    lines: list[str], start: int, indent: int, fields: list[str]
-) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+    lines: list[str], start: int, indent: int, fields: list[str], expected: int = 0
+) -> tuple[list[dict[str, Any]], int]:
+    # The header announces the row count; fill a list of that size in place
+    # and trim it if the body turns out shorter. The count comes from the
+    # server, so never reserve more slots than there are lines left.
+    n = len(lines)
+    capacity = min(expected, n - start)
+    rows: list[Any] = [None] * capacity
+    count = 0
     prefix = " " * indent
+    width = len(fields)
+    coercers = _column_plan(tuple(fields))
     i = start
-    while i < len(lines):
+    while i < n:
         line = lines[i]
         if not line.startswith(prefix):
             break
+        i += 1
         raw_row = line[indent:]
         if not raw_row.strip():
-            i += 1
             continue
         values = _split_toon_row(raw_row)
-        row: dict[str, Any] = {}
-        for j, field in enumerate(fields):
-            if j < len(values):
-                row[field] = _coerce(values[j])
-            else:
+        if coercers is None:
+            row = dict(zip(fields, map(_coerce, values)))
+        else:
+            row = {field: coerce(value) for field, coerce, value in zip(fields, coercers, values)}
+        if len(values) < width:
+            for field in fields[len(values):]:
                 row[field] = None
-        rows.append(row)
-        i += 1
-    return rows
+        if count < capacity:
+            rows[count] = row
+        else:
+            rows.append(row)
+        count += 1
+    del rows[count:]
+    return rows, _skip_indented(lines, i, prefix)
 
 
 def _split_toon_row(line: str) -> list[str]:
+    parts = line.split(",")
+    if '"' not in line:
+        return [part.strip() for part in parts]
+    # Quoted cells keep their quotes and escapes; rejoin the pieces of a cell
+    # that were split on commas inside quotes.
     values: list[str] = []
-    buf = ""
+    pending: str | None = None
     in_quotes = False
+    for part in parts:
+        if '"' in part:
+            in_quotes = _quotes_after(part, in_quotes)
+        if pending is not None:
+            pending = f"{pending},{part}"
+        elif in_quotes:
+            pending = part
+        else:
+            values.append(part.strip())
+            continue
+        if not in_quotes:
+            values.append(pending.strip())
+            pending = None
+    if pending is not None:
+        values.append(pending.strip())
+    return values
+
+
+def _quotes_after(part: str, in_quotes: bool) -> bool:
+    if "\\" not in part:
+        return in_quotes ^ bool(part.count('"') & 1)
     i = 0
-    while i < len(line):
-        ch = line[i]
-        if ch == "\\" and in_quotes and i + 1 < len(line):
-            buf += ch + line[i + 1]
+    n = len(part)
+    while i < n:
+        ch = part[i]
+        if ch == "\\" and in_quotes:
             i += 2
             continue
         if ch == '"':
             in_quotes = not in_quotes
-            buf += ch
-            i += 1
-            continue
-        if ch == "," and not in_quotes:
-            values.append(buf.strip())
-            buf = ""
-            i += 1
-            continue
-        buf += ch
-        i += 1
-    if buf or values:
-        values.append(buf.strip())
-    return values
-
-
-def _count_indented(lines: list[str], start: int, indent: int) -> int:
-    prefix = " " * indent
-    count = 0
-    i = start
-    while i < len(lines):
-        if not lines[i].startswith(prefix) and lines[i].strip():
-            break
-        count += 1
         i += 1
-    return count
+    return in_quotes
 
 
 def _coerce(value: str) -> Any:
@@ -258,7 +286,7 @@ def _coerce(value: str) -> Any:
 
     try:
         n = int(value)
-        if -9007199254740991 <= n <= 9007199254740991:
+        if -_MAX_SAFE_INT <= n <= _MAX_SAFE_INT:
             return n
         return value
     except ValueError:
@@ -269,3 +297,84 @@ def _coerce(value: str) -> Any:
         pass
 
     return value
+
+
+# Table columns are coerced by the type the models in ``xpoz.types`` declare
+# for them, so text and id columns skip the numeric attempts and ids such as
+# "123" stay strings. Columns the models disagree on, or do not declare, get
+# the generic ``_coerce``.
+
+_BOOLS = {"true": True, "false": False}
+
+
+def _coerce_str(value: str) -> Any:
+    if not value or value == "null" or value == "None":
+        return None
+    if value[0] == '"' and value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _coerce_int(value: str) -> Any:
+    if not value:
+        return None
+    try:
+        n = int(value)
+    except ValueError:
+        return _coerce(value)
+    if -_MAX_SAFE_INT <= n <= _MAX_SAFE_INT:
+        return n
+    return value
+
+
+def _coerce_float(value: str) -> Any:
+    try:
+        return float(value)
+    except ValueError:
+        return _coerce(value)
+
+
+def _coerce_bool(value: str) -> Any:
+    flag = _BOOLS.get(value)
+    return _coerce(value) if flag is None else flag
+
+
+def _scalar_coercer(annotation: Any) -> Callable[[str], Any]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+    if annotation is str or get_origin(annotation) is Literal:
+        return _coerce_str
+    if annotation is bool:
+        return _coerce_bool
+    if annotation is int:
+        return _coerce_int
+    if annotation is float:
+        return _coerce_float
+    return _coerce
+
+
+@functools.cache
+def _column_types() -> dict[str, Callable[[str], Any]]:
+    import xpoz.types
+    from xpoz._transform._field_mapping import snake_to_camel
+
+    found: dict[str, set[Callable[[str], Any]]] = {}
+    for name in xpoz.types.__all__:
+        model = getattr(xpoz.types, name)
+        for field, info in model.model_fields.items():
+            coercer = _scalar_coercer(info.annotation)
+            found.setdefault(field, set()).add(coercer)
+            found.setdefault(snake_to_camel(field), set()).add(coercer)
+    return {
+        column: coercers.pop() if len(coercers) == 1 else _coerce
+        for column, coercers in found.items()
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _column_plan(fields: tuple[str, ...]) -> tuple[Callable[[str], Any], ...] | None:
+    """Coercer per column of a table header; None when every column is generic."""
+    known = _column_types()
+    plan = tuple(known.get(field, _coerce) for field in fields)
+    return None if all(coerce is _coerce for coerce in plan) else plan
@@ -1,24 +1,56 @@
 from __future__ import annotations
 
-from typing import TypeVar, Any, Callable, Awaitable, Type
-
+import functools
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Concatenate,
+    Generic,
+    ParamSpec,
+    TypeVar,
+    overload,
+)
+
+import anyio
 from pydantic import BaseModel
 
+from xpoz._batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_MAX_BATCH_SIZE,
+    BatchResult,
+    assemble,
+    chunked,
+)
+from xpoz._cache import ResponseCache, cache_key
 from xpoz._exceptions import OperationFailedError
-from xpoz._transform._field_mapping import map_fields_to_camel, map_dict_keys_to_snake
-from xpoz._mcp._polling import wait_for_result, wait_for_result_sync
-from xpoz._pagination import PaginatedResult, AsyncPaginatedResult
+from xpoz._mcp._journal import OperationJournal
+from xpoz._mcp._polling import PollingStrategy, wait_for_result, wait_for_result_sync
+from xpoz._mcp._scheduler import AsyncPollScheduler, PollScheduler
+from xpoz._operation import (
+    AsyncOperationHandle,
+    AsyncSubmittableMethod,
+    OperationHandle,
+    SubmittableMethod,
+)
+from xpoz._pagination import AsyncPaginatedResult, PaginatedResult
+from xpoz._retry import is_idempotent
+from xpoz._rows import Validation, parse_rows
+from xpoz._singleflight import AsyncSingleFlight, SingleFlight
+from xpoz._transform._field_mapping import (
+    map_dict_keys_to_snake,
+    map_fields_to_camel,
+    map_list_of_dicts_to_snake,
+)
 from xpoz.types.common import PaginationInfo
 
 T = TypeVar("T", bound=BaseModel)
-
-
-def _parse_item(model: Type[T], raw: dict[str, Any]) -> T:
-    return model.model_validate(map_dict_keys_to_snake(raw))
-
-
-def _parse_items(model: Type[T], raw_list: list[dict[str, Any]]) -> list[T]:
-    return [_parse_item(model, item) for item in raw_list]
+S = TypeVar("S")
+P = ParamSpec("P")
+R = TypeVar("R")
 
 
 def _extract_pagination(raw: dict[str, Any]) -> PaginationInfo:
@@ -61,30 +93,367 @@ def _attach_allowed_fields(
         method.allowed_fields = meta
 
 
+# While a method runs under ``.submit()``, the first operation it starts is
+# handed back as a handle instead of being waited on; a call made in chunks
+# starts every chunk first. Once the operations have finished the method runs
+# again with each call's outcome replayed in order, so the handle's result is
+# exactly what the blocking call returns.
+_SUBMITTING: ContextVar[bool] = ContextVar("xpoz_submitting", default=False)
+_REPLAY: ContextVar[list[dict[str, Any] | BaseException] | None] = ContextVar(
+    "xpoz_replay", default=None
+)
+
+
+class _Submitted(BaseException):
+    def __init__(self, tool_name: str, operation_id: str):
+        super().__init__(operation_id)
+        self.tool_name = tool_name
+        self.operation_id = operation_id
+
+
+class _SubmittedChunks(BaseException):
+    """Chunks started under ``.submit()``: payloads, errors and running operations."""
+
+    def __init__(self, calls: list[dict[str, Any] | BaseException]):
+        super().__init__()
+        self.calls = calls
+
+
+def _submitted_calls(
+    submitted: _Submitted | _SubmittedChunks,
+) -> tuple[list[dict[str, Any] | BaseException], list[_Submitted]]:
+    calls: list[dict[str, Any] | BaseException] = (
+        submitted.calls if isinstance(submitted, _SubmittedChunks) else [submitted]
+    )
+    return calls, [call for call in calls if isinstance(call, _Submitted)]
+
+
+def _replay_of(
+    calls: list[dict[str, Any] | BaseException],
+    outcomes: list[dict[str, Any] | BaseException],
+) -> list[dict[str, Any] | BaseException]:
+    """``calls`` with each started operation replaced by its outcome."""
+    finished = iter(outcomes)
+    return [next(finished) if isinstance(call, _Submitted) else call for call in calls]
+
+
+def _take_replay() -> dict[str, Any] | BaseException | None:
+    replay = _REPLAY.get()
+    return replay.pop(0) if replay else None
+
+
+def _chunk_outcomes(
+    calls: list[dict[str, Any] | BaseException],
+) -> list[list[dict[str, Any]] | BaseException]:
+    """Results of chunks called under ``.submit()``, unless one started an operation."""
+    if any(isinstance(call, _Submitted) for call in calls):
+        raise _SubmittedChunks(calls)
+    return [call if isinstance(call, BaseException) else _extract_results(call) for call in calls]
+
+
+def _outcome(future: Future[dict[str, Any]]) -> dict[str, Any] | BaseException:
+    return future.exception() or future.result()
+
+
+def _gather(futures: list[Future[dict[str, Any]]]) -> Future[dict[str, Any]]:
+    """A future that finishes once all of ``futures`` have, cancelled with any of them."""
+    if len(futures) == 1:
+        return futures[0]
+    gathered: Future[dict[str, Any]] = Future()
+    remaining = len(futures)
+    lock = threading.Lock()
+
+    def settle(future: Future[dict[str, Any]]) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            finished = remaining == 0
+        if future.cancelled():
+            gathered.cancel()
+        elif finished and gathered.set_running_or_notify_cancel():
+            gathered.set_result({})
+
+    def cancel_all(future: Future[dict[str, Any]]) -> None:
+        if future.cancelled():
+            for child in futures:
+                child.cancel()
+
+    gathered.add_done_callback(cancel_all)
+    for future in futures:
+        future.add_done_callback(settle)
+    return gathered
+
+
+class _BoundMethod:
+    """A namespace method bound to its instance, plus ``.submit()``."""
+
+    def __init__(self, func: Callable[..., Any], instance: Any):
+        self._func = func
+        self._instance = instance
+        functools.update_wrapper(self, func)
+        self.__wrapped__ = func.__get__(instance, type(instance))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._func(self._instance, *args, **kwargs)
+
+    def submit(self, *args: Any, **kwargs: Any) -> Any:
+        """Start the call and return an operation handle without waiting."""
+        return self._instance._submit(self.__wrapped__, args, kwargs)
+
+    def __repr__(self) -> str:
+        return f"<bound method {self._func.__qualname__} of {self._instance!r}>"
+
+
+class _SubmittableDescriptor:
+    def __init__(self, func: Callable[..., Any]):
+        self._func = func
+        self.__doc__ = func.__doc__
+        self.__wrapped__ = func
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            # Class access keeps the plain function so metadata such as
+            # ``allowed_fields`` and signature introspection keep working.
+            return self._func
+        # Like ``functools.cached_property``: the instance attribute shadows
+        # this non-data descriptor, so the wrapper is built once per instance.
+        bound = _BoundMethod(self._func, instance)
+        instance.__dict__[self._name] = bound
+        return bound
+
+
+class _SubmittableMethod(_SubmittableDescriptor, Generic[S, P, R]):
+    if TYPE_CHECKING:
+
+        def __init__(self, func: Callable[Concatenate[S, P], R]) -> None: ...
+
+        @overload
+        def __get__(
+            self, instance: None, owner: type | None = None
+        ) -> Callable[Concatenate[S, P], R]: ...
+
+        @overload
+        def __get__(self, instance: S, owner: type | None = None) -> SubmittableMethod[P, R]: ...
+
+        def __get__(self, instance: Any, owner: type | None = None) -> Any: ...
+
+
+class _AsyncSubmittableMethod(_SubmittableDescriptor, Generic[S, P, R]):
+    if TYPE_CHECKING:
+
+        def __init__(self, func: Callable[Concatenate[S, P], Coroutine[Any, Any, R]]) -> None: ...
+
+        @overload
+        def __get__(
+            self, instance: None, owner: type | None = None
+        ) -> Callable[Concatenate[S, P], Coroutine[Any, Any, R]]: ...
+
+        @overload
+        def __get__(
+            self, instance: S, owner: type | None = None
+        ) -> AsyncSubmittableMethod[P, R]: ...
+
+        def __get__(self, instance: Any, owner: type | None = None) -> Any: ...
+
+
+def submittable(func: Callable[Concatenate[S, P], R]) -> _SubmittableMethod[S, P, R]:
+    """Give a namespace method a typed ``.submit()`` form returning an ``OperationHandle``."""
+    return _SubmittableMethod(func)
+
+
+def async_submittable(
+    func: Callable[Concatenate[S, P], Coroutine[Any, Any, R]],
+) -> _AsyncSubmittableMethod[S, P, R]:
+    """Async counterpart of ``submittable``; ``.submit()`` returns an ``AsyncOperationHandle``."""
+    return _AsyncSubmittableMethod(func)
+
+
 class BaseNamespace:
-    def __init__(self, call_tool: Callable[[str, dict[str, Any]], dict[str, Any]], timeout: float):
+    def __init__(
+        self,
+        call_tool: Callable[[str, dict[str, Any]], dict[str, Any]],
+        timeout: float,
+        *,
+        polling: PollingStrategy | None = None,
+        poller: PollScheduler | None = None,
+        journal: OperationJournal | None = None,
+        cache: ResponseCache | None = None,
+        singleflight: SingleFlight[dict[str, Any]] | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        validation: Validation = "full",
+    ):
         self._call_tool = call_tool
         self._timeout = timeout
+        self._polling = polling
+        self._poller = poller
+        self._journal = journal
+        self._cache = cache
+        self._singleflight = singleflight
+        self._max_batch_size = max_batch_size
+        self._batch_concurrency = batch_concurrency
+        self._validation = validation
+
+    def _parse_item(self, model: type[T], raw: dict[str, Any]) -> T:
+        return parse_rows(model, [map_dict_keys_to_snake(raw)], self._validation)[0]
+
+    def _parse_items(self, model: type[T], raw_list: list[dict[str, Any]]) -> list[T]:
+        return parse_rows(model, map_list_of_dicts_to_snake(raw_list), self._validation)
+
+    def _wait_for_operation(self, operation_id: str) -> dict[str, Any]:
+        try:
+            if self._poller is not None:
+                result = self._poller.wait(operation_id, self._timeout)
+            else:
+                result = wait_for_result_sync(
+                    self._call_tool, operation_id, self._timeout, self._polling
+                )
+        except Exception as exc:
+            if self._journal is not None:
+                self._journal.finish(operation_id, exc)
+            raise
+        if self._journal is not None:
+            self._journal.finish(operation_id)
+        return result
 
     def _call_and_maybe_poll(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        result = self._call_tool(tool_name, arguments)
-        if result.get("status") == "error":
-            raise OperationFailedError("", str(result.get("error") or "Unknown error"))
-        if result.get("status") == "success" or result.get("status") == "no_data" or "results" in result:
-            return result
-        operation_id = result.get("operationId")
-        if operation_id:
-            return wait_for_result_sync(self._call_tool, operation_id, self._timeout)
+        cache = self._cache if self._cache is not None and is_idempotent(tool_name) else None
+        replayed = _take_replay()
+        if isinstance(replayed, BaseException):
+            raise replayed
+        if replayed is None and cache is not None:
+            cached = cache.get(tool_name, arguments)
+            if cached is not None:
+                return cached
+        if replayed is not None:
+            result = replayed
+        elif self._singleflight is not None and is_idempotent(tool_name) and not _SUBMITTING.get():
+            # Identical calls already in flight share one request and poll loop.
+            result = self._singleflight.do(
+                cache_key(tool_name, arguments),
+                lambda: self._call_and_wait(tool_name, arguments),
+            )
+        else:
+            result = self._call_and_wait(tool_name, arguments)
+        if cache is not None:
+            cache.set(tool_name, arguments, result)
         return result
 
+    def _call_and_wait(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        operation_id = self._journal.find(tool_name, arguments) if self._journal else None
+        if operation_id is None:
+            result = self._call_tool(tool_name, arguments)
+            if result.get("status") == "error":
+                raise OperationFailedError("", str(result.get("error") or "Unknown error"))
+            if result.get("status") == "success" or result.get("status") == "no_data" or "results" in result:
+                return result
+            operation_id = result.get("operationId")
+            if not operation_id:
+                return result
+            if self._journal is not None:
+                self._journal.record(operation_id, tool_name, arguments)
+        if _SUBMITTING.get():
+            raise _Submitted(tool_name, operation_id)
+        return self._wait_for_operation(operation_id)
+
+    def _submit(
+        self,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> OperationHandle[Any]:
+        token = _SUBMITTING.set(True)
+        try:
+            value = method(*args, **kwargs)
+        except (_Submitted, _SubmittedChunks) as submitted:
+            if self._poller is None:
+                raise RuntimeError("submit() needs a connected client") from None
+            calls, started = _submitted_calls(submitted)
+            futures = [self._poller.submit(call.operation_id, self._timeout) for call in started]
+            if self._journal is not None:
+                for call, future in zip(started, futures):
+                    self._journal.finish_when_done(call.operation_id, future)
+
+            def finalize(_raw: dict[str, Any]) -> Any:
+                replay = _replay_of(calls, [_outcome(future) for future in futures])
+                replay_token = _REPLAY.set(replay)
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    _REPLAY.reset(replay_token)
+
+            return OperationHandle(
+                _gather(futures),
+                finalize,
+                operation_id=started[0].operation_id,
+                tool_name=started[0].tool_name,
+            )
+        finally:
+            _SUBMITTING.reset(token)
+        return OperationHandle.completed(value)
+
+    def _fetch_by_ids(
+        self,
+        tool_name: str,
+        id_param: str,
+        ids: list[str],
+        args: dict[str, Any],
+        model: type[T],
+        key_field: str,
+        *,
+        case_insensitive: bool = False,
+        allow_partial: bool = False,
+    ) -> BatchResult[T]:
+        """Fetch ``ids`` in chunks of ``max_batch_size``, several at a time."""
+        chunks = chunked(ids, self._max_batch_size)
+
+        def call(chunk: list[str]) -> dict[str, Any]:
+            return self._call_and_maybe_poll(tool_name, {**args, id_param: chunk})
+
+        def fetch(chunk: list[str]) -> list[dict[str, Any]] | BaseException:
+            try:
+                raw = call(chunk)
+            except Exception as exc:  # noqa: BLE001 - reported per id by assemble()
+                return exc
+            return _extract_results(raw)
+
+        # submit() and its replay rely on context variables that worker
+        # threads do not inherit, so those run the chunks in this thread.
+        if len(chunks) > 1 and _SUBMITTING.get():
+            calls: list[dict[str, Any] | BaseException] = []
+            for chunk in chunks:
+                try:
+                    calls.append(call(chunk))
+                except (_Submitted, Exception) as exc:  # noqa: BLE001 - replayed to the chunk
+                    calls.append(exc)
+            outcomes = _chunk_outcomes(calls)
+        elif len(chunks) == 1 or _REPLAY.get():
+            outcomes = [fetch(chunk) for chunk in chunks]
+        else:
+            workers = min(self._batch_concurrency, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xpoz-batch") as pool:
+                outcomes = list(pool.map(fetch, chunks))
+        rows, missing, failed = assemble(
+            ids,
+            chunks,
+            outcomes,
+            key_field,
+            case_insensitive=case_insensitive,
+            allow_partial=allow_partial,
+        )
+        return BatchResult(self._parse_items(model, rows), missing=missing, failed=failed)
+
     def _build_paginated_result(
         self,
         raw: dict[str, Any],
-        model: Type[T],
+        model: type[T],
         tool_name: str,
         base_args: dict[str, Any],
     ) -> PaginatedResult[T]:
-        items = _parse_items(model, _extract_results(raw))
+        rows = map_list_of_dicts_to_snake(_extract_results(raw))
         pagination = _extract_pagination(raw)
         table_name = pagination.table_name
         export_op_id = _extract_export_op_id(raw)
@@ -97,17 +466,20 @@ class BaseNamespace:
             return self._build_paginated_result(page_raw, model, tool_name, base_args)
 
         def fetch_export(op_id: str) -> str:
-            poll_result = wait_for_result_sync(self._call_tool, op_id, self._timeout)
+            poll_result = self._wait_for_operation(op_id)
             url: str = poll_result.get("downloadUrl", "")
             return url
 
         return PaginatedResult(
-            data=items,
+            data=None,
             pagination=pagination,
             table_name=table_name,
             export_operation_id=export_op_id,
             fetch_page=fetch_page,
             fetch_export=fetch_export,
+            model=model,
+            rows=rows,
+            validation=self._validation,
         )
 
     def _build_args(self, **kwargs: Any) -> dict[str, Any]:
@@ -126,29 +498,186 @@ class AsyncBaseNamespace:
         self,
         call_tool: Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]],
         timeout: float,
+        *,
+        polling: PollingStrategy | None = None,
+        poller: AsyncPollScheduler | None = None,
+        journal: OperationJournal | None = None,
+        cache: ResponseCache | None = None,
+        singleflight: AsyncSingleFlight[dict[str, Any]] | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        validation: Validation = "full",
     ):
         self._call_tool = call_tool
         self._timeout = timeout
+        self._polling = polling
+        self._poller = poller
+        self._journal = journal
+        self._cache = cache
+        self._singleflight = singleflight
+        self._max_batch_size = max_batch_size
+        self._batch_concurrency = batch_concurrency
+        self._validation = validation
+
+    def _parse_item(self, model: type[T], raw: dict[str, Any]) -> T:
+        return parse_rows(model, [map_dict_keys_to_snake(raw)], self._validation)[0]
+
+    def _parse_items(self, model: type[T], raw_list: list[dict[str, Any]]) -> list[T]:
+        return parse_rows(model, map_list_of_dicts_to_snake(raw_list), self._validation)
+
+    async def _wait_for_operation(self, operation_id: str) -> dict[str, Any]:
+        try:
+            if self._poller is not None:
+                result = await self._poller.wait(operation_id, self._timeout)
+            else:
+                result = await wait_for_result(
+                    self._call_tool, operation_id, self._timeout, self._polling
+                )
+        except Exception as exc:
+            if self._journal is not None:
+                self._journal.finish(operation_id, exc)
+            raise
+        if self._journal is not None:
+            self._journal.finish(operation_id)
+        return result
 
     async def _call_and_maybe_poll(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        result = await self._call_tool(tool_name, arguments)
-        if result.get("status") == "error":
-            raise OperationFailedError("", str(result.get("error") or "Unknown error"))
-        if result.get("status") == "success" or result.get("status") == "no_data" or "results" in result:
-            return result
-        operation_id = result.get("operationId")
-        if operation_id:
-            return await wait_for_result(self._call_tool, operation_id, self._timeout)
+        cache = self._cache if self._cache is not None and is_idempotent(tool_name) else None
+        replayed = _take_replay()
+        if isinstance(replayed, BaseException):
+            raise replayed
+        if replayed is None and cache is not None:
+            cached = cache.get(tool_name, arguments)
+            if cached is not None:
+                return cached
+        if replayed is not None:
+            result = replayed
+        elif self._singleflight is not None and is_idempotent(tool_name) and not _SUBMITTING.get():
+            # Identical calls already in flight share one request and poll loop.
+            result = await self._singleflight.do(
+                cache_key(tool_name, arguments),
+                lambda: self._call_and_wait(tool_name, arguments),
+            )
+        else:
+            result = await self._call_and_wait(tool_name, arguments)
+        if cache is not None:
+            cache.set(tool_name, arguments, result)
         return result
 
+    async def _call_and_wait(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        operation_id = self._journal.find(tool_name, arguments) if self._journal else None
+        if operation_id is None:
+            result = await self._call_tool(tool_name, arguments)
+            if result.get("status") == "error":
+                raise OperationFailedError("", str(result.get("error") or "Unknown error"))
+            if result.get("status") == "success" or result.get("status") == "no_data" or "results" in result:
+                return result
+            operation_id = result.get("operationId")
+            if not operation_id:
+                return result
+            if self._journal is not None:
+                self._journal.record(operation_id, tool_name, arguments)
+        if _SUBMITTING.get():
+            raise _Submitted(tool_name, operation_id)
+        return await self._wait_for_operation(operation_id)
+
+    async def _submit(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> AsyncOperationHandle[Any]:
+        token = _SUBMITTING.set(True)
+        try:
+            value = await method(*args, **kwargs)
+        except (_Submitted, _SubmittedChunks) as submitted:
+            if self._poller is None:
+                raise RuntimeError("submit() needs a connected client") from None
+            calls, started = _submitted_calls(submitted)
+            ops = [self._poller.register(call.operation_id, self._timeout) for call in started]
+
+            async def finalize(outcomes: list[dict[str, Any] | BaseException]) -> Any:
+                replay_token = _REPLAY.set(_replay_of(calls, outcomes))
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    _REPLAY.reset(replay_token)
+
+            return AsyncOperationHandle(
+                self._poller,
+                ops,
+                finalize,
+                operation_id=started[0].operation_id,
+                tool_name=started[0].tool_name,
+                on_done=self._journal.finish if self._journal is not None else None,
+            )
+        finally:
+            _SUBMITTING.reset(token)
+        return AsyncOperationHandle.completed(value)
+
+    async def _fetch_by_ids(
+        self,
+        tool_name: str,
+        id_param: str,
+        ids: list[str],
+        args: dict[str, Any],
+        model: type[T],
+        key_field: str,
+        *,
+        case_insensitive: bool = False,
+        allow_partial: bool = False,
+    ) -> BatchResult[T]:
+        """Fetch ``ids`` in chunks of ``max_batch_size``, several at a time."""
+        chunks = chunked(ids, self._max_batch_size)
+        outcomes: list[list[dict[str, Any]] | BaseException] = [[] for _ in chunks]
+
+        limiter = anyio.CapacityLimiter(self._batch_concurrency)
+
+        async def call(index: int) -> dict[str, Any]:
+            async with limiter:
+                return await self._call_and_maybe_poll(tool_name, {**args, id_param: chunks[index]})
+
+        async def fetch(index: int) -> None:
+            try:
+                outcomes[index] = _extract_results(await call(index))
+            except Exception as exc:  # noqa: BLE001 - reported per id by assemble()
+                outcomes[index] = exc
+
+        # submit() must see the operations from this task, so it and its
+        # replay run the chunks one after another.
+        if len(chunks) > 1 and _SUBMITTING.get():
+            calls: list[dict[str, Any] | BaseException] = []
+            for index in range(len(chunks)):
+                try:
+                    calls.append(await call(index))
+                except (_Submitted, Exception) as exc:  # noqa: BLE001 - replayed to the chunk
+                    calls.append(exc)
+            outcomes = _chunk_outcomes(calls)
+        elif len(chunks) == 1 or _REPLAY.get():
+            for index in range(len(chunks)):
+                await fetch(index)
+        else:
+            async with anyio.create_task_group() as task_group:
+                for index in range(len(chunks)):
+                    task_group.start_soon(fetch, index)
+        rows, missing, failed = assemble(
+            ids,
+            chunks,
+            outcomes,
+            key_field,
+            case_insensitive=case_insensitive,
+            allow_partial=allow_partial,
+        )
+        return BatchResult(self._parse_items(model, rows), missing=missing, failed=failed)
+
     async def _build_paginated_result(
         self,
         raw: dict[str, Any],
-        model: Type[T],
+        model: type[T],
         tool_name: str,
         base_args: dict[str, Any],
     ) -> AsyncPaginatedResult[T]:
-        items = _parse_items(model, _extract_results(raw))
+        rows = map_list_of_dicts_to_snake(_extract_results(raw))
         pagination = _extract_pagination(raw)
         table_name = pagination.table_name
         export_op_id = _extract_export_op_id(raw)
@@ -161,17 +690,20 @@ class AsyncBaseNamespace:
             return await self._build_paginated_result(page_raw, model, tool_name, base_args)
 
         async def fetch_export(op_id: str) -> str:
-            poll_result = await wait_for_result(self._call_tool, op_id, self._timeout)
+            poll_result = await self._wait_for_operation(op_id)
             url: str = poll_result.get("downloadUrl", "")
             return url
 
         return AsyncPaginatedResult(
-            data=items,
+            data=None,
             pagination=pagination,
             table_name=table_name,
             export_operation_id=export_op_id,
             fetch_page=fetch_page,
             fetch_export=fetch_export,
+            model=model,
+            rows=rows,
+            validation=self._validation,
         )
 
     def _build_args(self, **kwargs: Any) -> dict[str, Any]:
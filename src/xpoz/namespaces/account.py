@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from xpoz.namespaces._base import BaseNamespace, AsyncBaseNamespace
+from xpoz.namespaces._base import (
+    AsyncBaseNamespace,
+    BaseNamespace,
+    async_submittable,
+    submittable,
+)
 from xpoz._transform._field_mapping import map_dict_keys_to_snake
 from xpoz.types.account import (
     AccountDetails,
@@ -70,10 +75,12 @@ def _parse_account_details(raw: dict[str, Any]) -> AccountDetails:
 
 
 class AccountNamespace(BaseNamespace):
+    @submittable
     def get_account_details(self) -> AccountDetails:
         result = self._call_and_maybe_poll(_tools.GET_ACCOUNT_DETAILS, {})
         return _parse_account_details(result)
 
+    @submittable
     def get_credits_usage_history(
         self,
         *,
@@ -86,10 +93,12 @@ class AccountNamespace(BaseNamespace):
 
 
 class AsyncAccountNamespace(AsyncBaseNamespace):
+    @async_submittable
     async def get_account_details(self) -> AccountDetails:
         result = await self._call_and_maybe_poll(_tools.GET_ACCOUNT_DETAILS, {})
         return _parse_account_details(result)
 
+    @async_submittable
     async def get_credits_usage_history(
         self,
         *,
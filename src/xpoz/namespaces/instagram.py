@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from xpoz.namespaces._base import BaseNamespace, AsyncBaseNamespace, _parse_item, _parse_items
+from xpoz.namespaces._base import (
+    AsyncBaseNamespace,
+    BaseNamespace,
+    async_submittable,
+    submittable,
+)
+from xpoz._batch import BatchResult
 from xpoz._pagination import PaginatedResult, AsyncPaginatedResult
 from xpoz.types.instagram import InstagramPost, InstagramUser, InstagramComment
 from xpoz._config import _tools
@@ -10,21 +16,30 @@ from xpoz._config._constants import ResponseType
 
 
 class InstagramNamespace(BaseNamespace):
+    @submittable
     def get_posts_by_ids(
         self,
         post_ids: list[str],
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[InstagramPost]:
+        allow_partial: bool = False,
+    ) -> BatchResult[InstagramPost]:
         args = self._build_args(
-            postIds=post_ids,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = self._call_and_maybe_poll(_tools.GET_INSTAGRAM_POSTS_BY_IDS, args)
-        return _parse_items(InstagramPost, result.get("results", []))
+        return self._fetch_by_ids(
+            _tools.GET_INSTAGRAM_POSTS_BY_IDS,
+            "postIds",
+            post_ids,
+            args,
+            InstagramPost,
+            "id",
+            allow_partial=allow_partial,
+        )
 
+    @submittable
     def get_posts_by_user(
         self,
         identifier: str,
@@ -52,6 +67,7 @@ class InstagramNamespace(BaseNamespace):
             result, InstagramPost, _tools.GET_INSTAGRAM_POSTS_BY_USER, args
         )
 
+    @submittable
     def search_posts(
         self,
         query: str,
@@ -77,6 +93,7 @@ class InstagramNamespace(BaseNamespace):
             result, InstagramPost, _tools.SEARCH_INSTAGRAM_POSTS, args
         )
 
+    @submittable
     def get_comments(
         self,
         post_id: str,
@@ -98,6 +115,7 @@ class InstagramNamespace(BaseNamespace):
             result, InstagramComment, _tools.GET_INSTAGRAM_COMMENTS, args
         )
 
+    @submittable
     def get_user(
         self,
         identifier: str,
@@ -115,9 +133,10 @@ class InstagramNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_INSTAGRAM_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(InstagramUser, results[0])
-        return _parse_item(InstagramUser, result)
+            return self._parse_item(InstagramUser, results[0])
+        return self._parse_item(InstagramUser, result)
 
+    @submittable
     def search_users(
         self,
         name: str,
@@ -131,8 +150,9 @@ class InstagramNamespace(BaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = self._call_and_maybe_poll(_tools.SEARCH_INSTAGRAM_USERS, args)
-        return _parse_items(InstagramUser, result.get("results", []))
+        return self._parse_items(InstagramUser, result.get("results", []))
 
+    @submittable
     def get_user_connections(
         self,
         username: str,
@@ -152,6 +172,7 @@ class InstagramNamespace(BaseNamespace):
             result, InstagramUser, _tools.GET_INSTAGRAM_USER_CONNECTIONS, args
         )
 
+    @submittable
     def get_post_interacting_users(
         self,
         post_id: str,
@@ -171,6 +192,7 @@ class InstagramNamespace(BaseNamespace):
             result, InstagramUser, _tools.GET_INSTAGRAM_POST_INTERACTING_USERS, args
         )
 
+    @submittable
     def get_users_by_keywords(
         self,
         query: str,
@@ -198,21 +220,30 @@ class InstagramNamespace(BaseNamespace):
 
 
 class AsyncInstagramNamespace(AsyncBaseNamespace):
+    @async_submittable
     async def get_posts_by_ids(
         self,
         post_ids: list[str],
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[InstagramPost]:
+        allow_partial: bool = False,
+    ) -> BatchResult[InstagramPost]:
         args = self._build_args(
-            postIds=post_ids,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = await self._call_and_maybe_poll(_tools.GET_INSTAGRAM_POSTS_BY_IDS, args)
-        return _parse_items(InstagramPost, result.get("results", []))
+        return await self._fetch_by_ids(
+            _tools.GET_INSTAGRAM_POSTS_BY_IDS,
+            "postIds",
+            post_ids,
+            args,
+            InstagramPost,
+            "id",
+            allow_partial=allow_partial,
+        )
 
+    @async_submittable
     async def get_posts_by_user(
         self,
         identifier: str,
@@ -240,6 +271,7 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
             result, InstagramPost, _tools.GET_INSTAGRAM_POSTS_BY_USER, args
         )
 
+    @async_submittable
     async def search_posts(
         self,
         query: str,
@@ -265,6 +297,7 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
             result, InstagramPost, _tools.SEARCH_INSTAGRAM_POSTS, args
         )
 
+    @async_submittable
     async def get_comments(
         self,
         post_id: str,
@@ -286,6 +319,7 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
             result, InstagramComment, _tools.GET_INSTAGRAM_COMMENTS, args
         )
 
+    @async_submittable
     async def get_user(
         self,
         identifier: str,
@@ -303,9 +337,10 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_INSTAGRAM_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(InstagramUser, results[0])
-        return _parse_item(InstagramUser, result)
+            return self._parse_item(InstagramUser, results[0])
+        return self._parse_item(InstagramUser, result)
 
+    @async_submittable
     async def search_users(
         self,
         name: str,
@@ -319,8 +354,9 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = await self._call_and_maybe_poll(_tools.SEARCH_INSTAGRAM_USERS, args)
-        return _parse_items(InstagramUser, result.get("results", []))
+        return self._parse_items(InstagramUser, result.get("results", []))
 
+    @async_submittable
     async def get_user_connections(
         self,
         username: str,
@@ -340,6 +376,7 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
             result, InstagramUser, _tools.GET_INSTAGRAM_USER_CONNECTIONS, args
         )
 
+    @async_submittable
     async def get_post_interacting_users(
         self,
         post_id: str,
@@ -359,6 +396,7 @@ class AsyncInstagramNamespace(AsyncBaseNamespace):
             result, InstagramUser, _tools.GET_INSTAGRAM_POST_INTERACTING_USERS, args
         )
 
+    @async_submittable
     async def get_users_by_keywords(
         self,
         query: str,
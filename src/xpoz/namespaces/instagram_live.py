@@ -7,7 +7,8 @@ from pydantic import BaseModel
 from xpoz._config import _routes
 from xpoz._cursor import AsyncCursorResult, CursorResult
 from xpoz._rest import AsyncRestTransport, RestTransport
-from xpoz._transform._field_mapping import map_dict_keys_to_snake, map_fields_to_camel
+from xpoz._rows import Validation
+from xpoz._transform._field_mapping import map_fields_to_camel, map_list_of_dicts_to_snake
 from xpoz.types.instagram import InstagramComment, InstagramPost, InstagramUser
 
 T = TypeVar("T", bound=BaseModel)
@@ -36,16 +37,14 @@ def _coerce_string_ids(item: dict[str, Any]) -> dict[str, Any]:
     return item
 
 
-def _parse_items(model: Type[T], raw_list: list[dict[str, Any]]) -> list[T]:
-    return [
-        model.model_validate(_coerce_string_ids(map_dict_keys_to_snake(item)))
-        for item in raw_list
-    ]
+def _parse_rows(raw_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [_coerce_string_ids(item) for item in map_list_of_dicts_to_snake(raw_list)]
 
 
 class InstagramLiveNamespace:
-    def __init__(self, transport: RestTransport):
+    def __init__(self, transport: RestTransport, *, validation: Validation = "full"):
         self._transport = transport
+        self._validation = validation
 
     def _page(
         self,
@@ -59,10 +58,13 @@ class InstagramLiveNamespace:
             return self._page(model, path, {**params, "cursor": cursor})
 
         return CursorResult(
-            data=_parse_items(model, payload.get("results", [])),
+            data=None,
             has_more=bool(payload.get("has_more")),
             next_page_cursor=payload.get("next_page_cursor"),
             fetch_page=fetch_page,
+            model=model,
+            rows=_parse_rows(payload.get("results", [])),
+            validation=self._validation,
         )
 
     def search_posts(
@@ -181,8 +183,9 @@ class InstagramLiveNamespace:
 
 
 class AsyncInstagramLiveNamespace:
-    def __init__(self, transport: AsyncRestTransport):
+    def __init__(self, transport: AsyncRestTransport, *, validation: Validation = "full"):
         self._transport = transport
+        self._validation = validation
 
     async def _page(
         self,
@@ -196,10 +199,13 @@ class AsyncInstagramLiveNamespace:
             return await self._page(model, path, {**params, "cursor": cursor})
 
         return AsyncCursorResult(
-            data=_parse_items(model, payload.get("results", [])),
+            data=None,
             has_more=bool(payload.get("has_more")),
             next_page_cursor=payload.get("next_page_cursor"),
             fetch_page=fetch_page,
+            model=model,
+            rows=_parse_rows(payload.get("results", [])),
+            validation=self._validation,
         )
 
     async def search_posts(
@@ -5,10 +5,10 @@ from typing import Any
 from xpoz.namespaces._base import (
     BaseNamespace,
     AsyncBaseNamespace,
-    _parse_item,
-    _parse_items,
     _extract_pagination,
     _extract_results,
+    async_submittable,
+    submittable,
 )
 from xpoz._pagination import PaginatedResult, AsyncPaginatedResult
 from xpoz._mcp._polling import wait_for_result_sync, wait_for_result
@@ -26,6 +26,7 @@ from xpoz._config._constants import ResponseType
 
 
 class RedditNamespace(BaseNamespace):
+    @submittable
     def search_posts(
         self,
         query: str,
@@ -57,6 +58,7 @@ class RedditNamespace(BaseNamespace):
             result, RedditPost, _tools.SEARCH_REDDIT_POSTS, args
         )
 
+    @submittable
     def get_post_with_comments(
         self,
         post_id: str,
@@ -74,6 +76,7 @@ class RedditNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_REDDIT_POST_WITH_COMMENTS, args)
         return self._parse_post_with_comments(result)
 
+    @submittable
     def search_comments(
         self,
         query: str,
@@ -95,6 +98,7 @@ class RedditNamespace(BaseNamespace):
             result, RedditComment, _tools.SEARCH_REDDIT_COMMENTS, args
         )
 
+    @submittable
     def get_comment_by_id(
         self,
         comment_id: str,
@@ -110,9 +114,10 @@ class RedditNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_REDDIT_COMMENT_BY_ID, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(RedditComment, results[0])
-        return _parse_item(RedditComment, result)
+            return self._parse_item(RedditComment, results[0])
+        return self._parse_item(RedditComment, result)
 
+    @submittable
     def get_user(
         self,
         username: str,
@@ -128,9 +133,10 @@ class RedditNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_REDDIT_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(RedditUser, results[0])
-        return _parse_item(RedditUser, result)
+            return self._parse_item(RedditUser, results[0])
+        return self._parse_item(RedditUser, result)
 
+    @submittable
     def search_users(
         self,
         name: str,
@@ -144,8 +150,9 @@ class RedditNamespace(BaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = self._call_and_maybe_poll(_tools.SEARCH_REDDIT_USERS, args)
-        return _parse_items(RedditUser, result.get("results", []))
+        return self._parse_items(RedditUser, result.get("results", []))
 
+    @submittable
     def get_users_by_keywords(
         self,
         query: str,
@@ -169,6 +176,7 @@ class RedditNamespace(BaseNamespace):
             result, RedditUser, _tools.GET_REDDIT_USERS_BY_KEYWORDS, args
         )
 
+    @submittable
     def search_subreddits(
         self,
         query: str,
@@ -182,8 +190,9 @@ class RedditNamespace(BaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = self._call_and_maybe_poll(_tools.SEARCH_REDDIT_SUBREDDITS, args)
-        return _parse_items(RedditSubreddit, result.get("results", []))
+        return self._parse_items(RedditSubreddit, result.get("results", []))
 
+    @submittable
     def get_subreddit_with_posts(
         self,
         subreddit_name: str,
@@ -201,6 +210,7 @@ class RedditNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_REDDIT_SUBREDDIT_WITH_POSTS, args)
         return self._parse_subreddit_with_posts(result)
 
+    @submittable
     def get_subreddits_by_keywords(
         self,
         query: str,
@@ -232,8 +242,8 @@ class RedditNamespace(BaseNamespace):
         pagination = _extract_pagination(raw)
 
         return RedditPostWithComments(
-            post=_parse_item(RedditPost, post_data),
-            comments=_parse_items(RedditComment, comments_data),
+            post=self._parse_item(RedditPost, post_data),
+            comments=self._parse_items(RedditComment, comments_data),
             comments_pagination=pagination if pagination.total_pages > 0 else None,
             comments_table_name=pagination.table_name,
         )
@@ -248,14 +258,15 @@ class RedditNamespace(BaseNamespace):
         pagination = _extract_pagination(raw)
 
         return SubredditWithPosts(
-            subreddit=_parse_item(RedditSubreddit, subreddit_data),
-            posts=_parse_items(RedditPost, posts_data),
+            subreddit=self._parse_item(RedditSubreddit, subreddit_data),
+            posts=self._parse_items(RedditPost, posts_data),
             posts_pagination=pagination if pagination.total_pages > 0 else None,
             posts_table_name=pagination.table_name,
         )
 
 
 class AsyncRedditNamespace(AsyncBaseNamespace):
+    @async_submittable
     async def search_posts(
         self,
         query: str,
@@ -287,6 +298,7 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
             result, RedditPost, _tools.SEARCH_REDDIT_POSTS, args
         )
 
+    @async_submittable
     async def get_post_with_comments(
         self,
         post_id: str,
@@ -304,6 +316,7 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_REDDIT_POST_WITH_COMMENTS, args)
         return self._parse_post_with_comments(result)
 
+    @async_submittable
     async def search_comments(
         self,
         query: str,
@@ -325,6 +338,7 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
             result, RedditComment, _tools.SEARCH_REDDIT_COMMENTS, args
         )
 
+    @async_submittable
     async def get_comment_by_id(
         self,
         comment_id: str,
@@ -340,9 +354,10 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_REDDIT_COMMENT_BY_ID, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(RedditComment, results[0])
-        return _parse_item(RedditComment, result)
+            return self._parse_item(RedditComment, results[0])
+        return self._parse_item(RedditComment, result)
 
+    @async_submittable
     async def get_user(
         self,
         username: str,
@@ -358,9 +373,10 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_REDDIT_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(RedditUser, results[0])
-        return _parse_item(RedditUser, result)
+            return self._parse_item(RedditUser, results[0])
+        return self._parse_item(RedditUser, result)
 
+    @async_submittable
     async def search_users(
         self,
         name: str,
@@ -374,8 +390,9 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = await self._call_and_maybe_poll(_tools.SEARCH_REDDIT_USERS, args)
-        return _parse_items(RedditUser, result.get("results", []))
+        return self._parse_items(RedditUser, result.get("results", []))
 
+    @async_submittable
     async def get_users_by_keywords(
         self,
         query: str,
@@ -399,6 +416,7 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
             result, RedditUser, _tools.GET_REDDIT_USERS_BY_KEYWORDS, args
         )
 
+    @async_submittable
     async def search_subreddits(
         self,
         query: str,
@@ -412,8 +430,9 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = await self._call_and_maybe_poll(_tools.SEARCH_REDDIT_SUBREDDITS, args)
-        return _parse_items(RedditSubreddit, result.get("results", []))
+        return self._parse_items(RedditSubreddit, result.get("results", []))
 
+    @async_submittable
     async def get_subreddit_with_posts(
         self,
         subreddit_name: str,
@@ -431,6 +450,7 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_REDDIT_SUBREDDIT_WITH_POSTS, args)
         return self._parse_subreddit_with_posts(result)
 
+    @async_submittable
     async def get_subreddits_by_keywords(
         self,
         query: str,
@@ -462,8 +482,8 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
         pagination = _extract_pagination(raw)
 
         return RedditPostWithComments(
-            post=_parse_item(RedditPost, post_data),
-            comments=_parse_items(RedditComment, comments_data),
+            post=self._parse_item(RedditPost, post_data),
+            comments=self._parse_items(RedditComment, comments_data),
             comments_pagination=pagination if pagination.total_pages > 0 else None,
             comments_table_name=pagination.table_name,
         )
@@ -478,8 +498,8 @@ class AsyncRedditNamespace(AsyncBaseNamespace):
         pagination = _extract_pagination(raw)
 
         return SubredditWithPosts(
-            subreddit=_parse_item(RedditSubreddit, subreddit_data),
-            posts=_parse_items(RedditPost, posts_data),
+            subreddit=self._parse_item(RedditSubreddit, subreddit_data),
+            posts=self._parse_items(RedditPost, posts_data),
             posts_pagination=pagination if pagination.total_pages > 0 else None,
             posts_table_name=pagination.table_name,
         )
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from xpoz.namespaces._base import BaseNamespace, AsyncBaseNamespace, _parse_item, _parse_items
+from xpoz.namespaces._base import (
+    AsyncBaseNamespace,
+    BaseNamespace,
+    async_submittable,
+    submittable,
+)
+from xpoz._batch import BatchResult
 from xpoz._pagination import PaginatedResult, AsyncPaginatedResult
 from xpoz.types.tiktok import TiktokPost, TiktokUser, TiktokComment, TiktokSound
 from xpoz._config import _tools
@@ -10,21 +16,30 @@ from xpoz._config._constants import ResponseType
 
 
 class TiktokNamespace(BaseNamespace):
+    @submittable
     def get_posts_by_ids(
         self,
         post_ids: list[str],
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[TiktokPost]:
+        allow_partial: bool = False,
+    ) -> BatchResult[TiktokPost]:
         args = self._build_args(
-            postIds=post_ids,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = self._call_and_maybe_poll(_tools.GET_TIKTOK_POSTS_BY_IDS, args)
-        return _parse_items(TiktokPost, result.get("results", []))
+        return self._fetch_by_ids(
+            _tools.GET_TIKTOK_POSTS_BY_IDS,
+            "postIds",
+            post_ids,
+            args,
+            TiktokPost,
+            "id",
+            allow_partial=allow_partial,
+        )
 
+    @submittable
     def get_posts_by_user(
         self,
         identifier: str,
@@ -52,6 +67,7 @@ class TiktokNamespace(BaseNamespace):
             result, TiktokPost, _tools.GET_TIKTOK_POSTS_BY_USER, args
         )
 
+    @submittable
     def search_posts(
         self,
         query: str,
@@ -77,6 +93,7 @@ class TiktokNamespace(BaseNamespace):
             result, TiktokPost, _tools.SEARCH_TIKTOK_POSTS, args
         )
 
+    @submittable
     def get_comments(
         self,
         post_id: str,
@@ -98,6 +115,7 @@ class TiktokNamespace(BaseNamespace):
             result, TiktokComment, _tools.GET_TIKTOK_COMMENTS, args
         )
 
+    @submittable
     def get_user(
         self,
         identifier: str,
@@ -115,9 +133,10 @@ class TiktokNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TIKTOK_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(TiktokUser, results[0])
-        return _parse_item(TiktokUser, result)
+            return self._parse_item(TiktokUser, results[0])
+        return self._parse_item(TiktokUser, result)
 
+    @submittable
     def search_users(
         self,
         name: str,
@@ -131,8 +150,9 @@ class TiktokNamespace(BaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = self._call_and_maybe_poll(_tools.SEARCH_TIKTOK_USERS, args)
-        return _parse_items(TiktokUser, result.get("results", []))
+        return self._parse_items(TiktokUser, result.get("results", []))
 
+    @submittable
     def get_users_by_keywords(
         self,
         query: str,
@@ -158,6 +178,7 @@ class TiktokNamespace(BaseNamespace):
             result, TiktokUser, _tools.GET_TIKTOK_USERS_BY_KEYWORDS, args
         )
 
+    @submittable
     def get_posts_by_hashtags(
         self,
         hashtags: list[str],
@@ -183,6 +204,7 @@ class TiktokNamespace(BaseNamespace):
             result, TiktokPost, _tools.GET_TIKTOK_POSTS_BY_HASHTAGS, args
         )
 
+    @submittable
     def get_users_by_hashtags(
         self,
         hashtags: list[str],
@@ -208,6 +230,7 @@ class TiktokNamespace(BaseNamespace):
             result, TiktokUser, _tools.GET_TIKTOK_USERS_BY_HASHTAGS, args
         )
 
+    @submittable
     def search_sounds(
         self,
         keyword: str,
@@ -221,8 +244,9 @@ class TiktokNamespace(BaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = self._call_and_maybe_poll(_tools.SEARCH_TIKTOK_SOUNDS, args)
-        return _parse_items(TiktokSound, result.get("results", []))
+        return self._parse_items(TiktokSound, result.get("results", []))
 
+    @submittable
     def get_posts_by_sound(
         self,
         sound_id: str,
@@ -250,21 +274,30 @@ class TiktokNamespace(BaseNamespace):
 
 
 class AsyncTiktokNamespace(AsyncBaseNamespace):
+    @async_submittable
     async def get_posts_by_ids(
         self,
         post_ids: list[str],
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[TiktokPost]:
+        allow_partial: bool = False,
+    ) -> BatchResult[TiktokPost]:
         args = self._build_args(
-            postIds=post_ids,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = await self._call_and_maybe_poll(_tools.GET_TIKTOK_POSTS_BY_IDS, args)
-        return _parse_items(TiktokPost, result.get("results", []))
+        return await self._fetch_by_ids(
+            _tools.GET_TIKTOK_POSTS_BY_IDS,
+            "postIds",
+            post_ids,
+            args,
+            TiktokPost,
+            "id",
+            allow_partial=allow_partial,
+        )
 
+    @async_submittable
     async def get_posts_by_user(
         self,
         identifier: str,
@@ -292,6 +325,7 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             result, TiktokPost, _tools.GET_TIKTOK_POSTS_BY_USER, args
         )
 
+    @async_submittable
     async def search_posts(
         self,
         query: str,
@@ -317,6 +351,7 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             result, TiktokPost, _tools.SEARCH_TIKTOK_POSTS, args
         )
 
+    @async_submittable
     async def get_comments(
         self,
         post_id: str,
@@ -338,6 +373,7 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             result, TiktokComment, _tools.GET_TIKTOK_COMMENTS, args
         )
 
+    @async_submittable
     async def get_user(
         self,
         identifier: str,
@@ -355,9 +391,10 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TIKTOK_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(TiktokUser, results[0])
-        return _parse_item(TiktokUser, result)
+            return self._parse_item(TiktokUser, results[0])
+        return self._parse_item(TiktokUser, result)
 
+    @async_submittable
     async def search_users(
         self,
         name: str,
@@ -371,8 +408,9 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = await self._call_and_maybe_poll(_tools.SEARCH_TIKTOK_USERS, args)
-        return _parse_items(TiktokUser, result.get("results", []))
+        return self._parse_items(TiktokUser, result.get("results", []))
 
+    @async_submittable
     async def get_users_by_keywords(
         self,
         query: str,
@@ -398,6 +436,7 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             result, TiktokUser, _tools.GET_TIKTOK_USERS_BY_KEYWORDS, args
         )
 
+    @async_submittable
     async def get_posts_by_hashtags(
         self,
         hashtags: list[str],
@@ -423,6 +462,7 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             result, TiktokPost, _tools.GET_TIKTOK_POSTS_BY_HASHTAGS, args
         )
 
+    @async_submittable
     async def get_users_by_hashtags(
         self,
         hashtags: list[str],
@@ -448,6 +488,7 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             result, TiktokUser, _tools.GET_TIKTOK_USERS_BY_HASHTAGS, args
         )
 
+    @async_submittable
     async def search_sounds(
         self,
         keyword: str,
@@ -461,8 +502,9 @@ class AsyncTiktokNamespace(AsyncBaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = await self._call_and_maybe_poll(_tools.SEARCH_TIKTOK_SOUNDS, args)
-        return _parse_items(TiktokSound, result.get("results", []))
+        return self._parse_items(TiktokSound, result.get("results", []))
 
+    @async_submittable
     async def get_posts_by_sound(
         self,
         sound_id: str,
@@ -2,17 +2,24 @@ from __future__ import annotations
 
 from typing import Any
 
-from xpoz.namespaces._base import BaseNamespace, AsyncBaseNamespace, _parse_item, _parse_items
+from xpoz.namespaces._base import (
+    AsyncBaseNamespace,
+    BaseNamespace,
+    async_submittable,
+    submittable,
+)
 from xpoz._transform._field_mapping import map_dict_keys_to_snake
 from xpoz.types.tracking import TrackedItem, AddTrackedItemsResult, RemoveTrackedItemsResult
 from xpoz._config import _tools
 
 
 class TrackingNamespace(BaseNamespace):
+    @submittable
     def get_tracked_items(self) -> list[TrackedItem]:
         result = self._call_tool(_tools.GET_TRACKED_ITEMS, {})
-        return _parse_items(TrackedItem, result.get("results", []))
+        return self._parse_items(TrackedItem, result.get("results", []))
 
+    @submittable
     def add_tracked_items(
         self,
         items: list[TrackedItem],
@@ -21,8 +28,9 @@ class TrackingNamespace(BaseNamespace):
             items=[item.model_dump(exclude_none=True) for item in items],
         )
         result = self._call_tool(_tools.ADD_TRACKED_ITEMS, args)
-        return _parse_item(AddTrackedItemsResult, result)
+        return self._parse_item(AddTrackedItemsResult, result)
 
+    @submittable
     def remove_tracked_items(
         self,
         items: list[TrackedItem],
@@ -31,14 +39,16 @@ class TrackingNamespace(BaseNamespace):
             items=[item.model_dump(exclude_none=True) for item in items],
         )
         result = self._call_tool(_tools.REMOVE_TRACKED_ITEMS, args)
-        return _parse_item(RemoveTrackedItemsResult, result)
+        return self._parse_item(RemoveTrackedItemsResult, result)
 
 
 class AsyncTrackingNamespace(AsyncBaseNamespace):
+    @async_submittable
     async def get_tracked_items(self) -> list[TrackedItem]:
         result = await self._call_tool(_tools.GET_TRACKED_ITEMS, {})
-        return _parse_items(TrackedItem, result.get("results", []))
+        return self._parse_items(TrackedItem, result.get("results", []))
 
+    @async_submittable
     async def add_tracked_items(
         self,
         items: list[TrackedItem],
@@ -47,8 +57,9 @@ class AsyncTrackingNamespace(AsyncBaseNamespace):
             items=[item.model_dump(exclude_none=True) for item in items],
         )
         result = await self._call_tool(_tools.ADD_TRACKED_ITEMS, args)
-        return _parse_item(AddTrackedItemsResult, result)
+        return self._parse_item(AddTrackedItemsResult, result)
 
+    @async_submittable
     async def remove_tracked_items(
         self,
         items: list[TrackedItem],
@@ -57,4 +68,4 @@ class AsyncTrackingNamespace(AsyncBaseNamespace):
             items=[item.model_dump(exclude_none=True) for item in items],
         )
         result = await self._call_tool(_tools.REMOVE_TRACKED_ITEMS, args)
-        return _parse_item(RemoveTrackedItemsResult, result)
+        return self._parse_item(RemoveTrackedItemsResult, result)
@@ -2,29 +2,53 @@ from __future__ import annotations
 
 from typing import Any
 
-from xpoz.namespaces._base import BaseNamespace, AsyncBaseNamespace, _parse_item, _parse_items
+from xpoz.namespaces._base import (
+    AsyncBaseNamespace,
+    BaseNamespace,
+    async_submittable,
+    submittable,
+)
+from xpoz._batch import BatchResult
+from xpoz._loader import DEFAULT_LOADER_WINDOW, AsyncBatchLoader, BatchLoader
 from xpoz._pagination import PaginatedResult, AsyncPaginatedResult
 from xpoz.types.twitter import TwitterPost, TwitterUser
 from xpoz._config import _tools
 from xpoz._config._constants import ResponseType
 
 
+def _loader_key(identifier_type: str, fields: list[str] | None) -> tuple[str, list[str] | None]:
+    """The attribute users are matched on, and ``fields`` extended to include it."""
+    key_field = "username" if identifier_type == "username" else "id"
+    if fields is not None and key_field not in fields:
+        fields = [*fields, key_field]
+    return key_field, fields
+
+
 class TwitterNamespace(BaseNamespace):
+    @submittable
     def get_posts_by_ids(
         self,
         post_ids: list[str],
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[TwitterPost]:
+        allow_partial: bool = False,
+    ) -> BatchResult[TwitterPost]:
         args = self._build_args(
-            postIds=post_ids,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = self._call_and_maybe_poll(_tools.GET_TWITTER_POSTS_BY_IDS, args)
-        return _parse_items(TwitterPost, result.get("results", []))
+        return self._fetch_by_ids(
+            _tools.GET_TWITTER_POSTS_BY_IDS,
+            "postIds",
+            post_ids,
+            args,
+            TwitterPost,
+            "id",
+            allow_partial=allow_partial,
+        )
 
+    @submittable
     def get_posts_by_author(
         self,
         identifier: str,
@@ -48,6 +72,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_POSTS_BY_AUTHOR, args)
         return self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_POSTS_BY_AUTHOR, args)
 
+    @submittable
     def search_posts(
         self,
         query: str,
@@ -87,6 +112,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.SEARCH_TWITTER_POSTS, args)
         return self._build_paginated_result(result, TwitterPost, _tools.SEARCH_TWITTER_POSTS, args)
 
+    @submittable
     def get_retweets(
         self,
         post_id: str,
@@ -102,6 +128,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_RETWEETS, args)
         return self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_RETWEETS, args)
 
+    @submittable
     def get_quotes(
         self,
         post_id: str,
@@ -119,6 +146,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_QUOTES, args)
         return self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_QUOTES, args)
 
+    @submittable
     def get_comments(
         self,
         post_id: str,
@@ -136,6 +164,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_COMMENTS, args)
         return self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_COMMENTS, args)
 
+    @submittable
     def get_post_interacting_users(
         self,
         post_id: str,
@@ -153,6 +182,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_POST_INTERACTING_USERS, args)
         return self._build_paginated_result(result, TwitterUser, _tools.GET_TWITTER_POST_INTERACTING_USERS, args)
 
+    @submittable
     def count_posts(
         self,
         phrase: str,
@@ -176,6 +206,7 @@ class TwitterNamespace(BaseNamespace):
             return int(first)
         return int(count)
 
+    @submittable
     def get_users(
         self,
         identifiers: list[str],
@@ -183,16 +214,56 @@ class TwitterNamespace(BaseNamespace):
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[TwitterUser]:
+        allow_partial: bool = False,
+    ) -> BatchResult[TwitterUser]:
         args = self._build_args(
-            identifiers=identifiers,
             identifierType=identifier_type,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = self._call_and_maybe_poll(_tools.GET_TWITTER_USERS, args)
-        return _parse_items(TwitterUser, result.get("results", []))
+        by_username = identifier_type == "username"
+        return self._fetch_by_ids(
+            _tools.GET_TWITTER_USERS,
+            "identifiers",
+            identifiers,
+            args,
+            TwitterUser,
+            "username" if by_username else "id",
+            case_insensitive=by_username,
+            allow_partial=allow_partial,
+        )
+
+    def user_loader(
+        self,
+        identifier_type: str = "username",
+        *,
+        fields: list[str] | None = None,
+        force_latest: bool | None = None,
+        window: float = DEFAULT_LOADER_WINDOW,
+        max_batch_size: int | None = None,
+    ) -> BatchLoader[TwitterUser]:
+        """Merge single-user lookups into ``get_users`` calls.
+
+        ``loader.get(name)`` blocks for one user; lookups from any thread
+        that arrive within ``window`` seconds share one request.
+        """
+        key_field, fields = _loader_key(identifier_type, fields)
+        return BatchLoader(
+            lambda identifiers: self.get_users(
+                identifiers,
+                identifier_type,
+                fields=fields,
+                force_latest=force_latest,
+                allow_partial=True,
+            ),
+            lambda user: str(getattr(user, key_field)),
+            normalize=str.lower if key_field == "username" else str,
+            window=window,
+            max_batch_size=max_batch_size or self._max_batch_size,
+            concurrency=self._batch_concurrency,
+        )
 
+    @submittable
     def get_user(
         self,
         identifier: str,
@@ -210,9 +281,10 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(TwitterUser, results[0])
-        return _parse_item(TwitterUser, result)
+            return self._parse_item(TwitterUser, results[0])
+        return self._parse_item(TwitterUser, result)
 
+    @submittable
     def search_users(
         self,
         name: str,
@@ -226,8 +298,9 @@ class TwitterNamespace(BaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = self._call_and_maybe_poll(_tools.SEARCH_TWITTER_USERS, args)
-        return _parse_items(TwitterUser, result.get("results", []))
+        return self._parse_items(TwitterUser, result.get("results", []))
 
+    @submittable
     def get_user_connections(
         self,
         username: str,
@@ -245,6 +318,7 @@ class TwitterNamespace(BaseNamespace):
         result = self._call_and_maybe_poll(_tools.GET_TWITTER_USER_CONNECTIONS, args)
         return self._build_paginated_result(result, TwitterUser, _tools.GET_TWITTER_USER_CONNECTIONS, args)
 
+    @submittable
     def get_users_by_keywords(
         self,
         query: str,
@@ -272,21 +346,30 @@ class TwitterNamespace(BaseNamespace):
 
 
 class AsyncTwitterNamespace(AsyncBaseNamespace):
+    @async_submittable
     async def get_posts_by_ids(
         self,
         post_ids: list[str],
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[TwitterPost]:
+        allow_partial: bool = False,
+    ) -> BatchResult[TwitterPost]:
         args = self._build_args(
-            postIds=post_ids,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = await self._call_and_maybe_poll(_tools.GET_TWITTER_POSTS_BY_IDS, args)
-        return _parse_items(TwitterPost, result.get("results", []))
+        return await self._fetch_by_ids(
+            _tools.GET_TWITTER_POSTS_BY_IDS,
+            "postIds",
+            post_ids,
+            args,
+            TwitterPost,
+            "id",
+            allow_partial=allow_partial,
+        )
 
+    @async_submittable
     async def get_posts_by_author(
         self,
         identifier: str,
@@ -310,6 +393,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_POSTS_BY_AUTHOR, args)
         return await self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_POSTS_BY_AUTHOR, args)
 
+    @async_submittable
     async def search_posts(
         self,
         query: str,
@@ -349,6 +433,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.SEARCH_TWITTER_POSTS, args)
         return await self._build_paginated_result(result, TwitterPost, _tools.SEARCH_TWITTER_POSTS, args)
 
+    @async_submittable
     async def get_retweets(
         self,
         post_id: str,
@@ -364,6 +449,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_RETWEETS, args)
         return await self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_RETWEETS, args)
 
+    @async_submittable
     async def get_quotes(
         self,
         post_id: str,
@@ -381,6 +467,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_QUOTES, args)
         return await self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_QUOTES, args)
 
+    @async_submittable
     async def get_comments(
         self,
         post_id: str,
@@ -398,6 +485,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_COMMENTS, args)
         return await self._build_paginated_result(result, TwitterPost, _tools.GET_TWITTER_COMMENTS, args)
 
+    @async_submittable
     async def get_post_interacting_users(
         self,
         post_id: str,
@@ -415,6 +503,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_POST_INTERACTING_USERS, args)
         return await self._build_paginated_result(result, TwitterUser, _tools.GET_TWITTER_POST_INTERACTING_USERS, args)
 
+    @async_submittable
     async def count_posts(
         self,
         phrase: str,
@@ -438,6 +527,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
             return int(first)
         return int(count)
 
+    @async_submittable
     async def get_users(
         self,
         identifiers: list[str],
@@ -445,16 +535,57 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         *,
         fields: list[str] | None = None,
         force_latest: bool | None = None,
-    ) -> list[TwitterUser]:
+        allow_partial: bool = False,
+    ) -> BatchResult[TwitterUser]:
         args = self._build_args(
-            identifiers=identifiers,
             identifierType=identifier_type,
             fields=self._convert_fields(fields),
             forceLatest=force_latest,
         )
-        result = await self._call_and_maybe_poll(_tools.GET_TWITTER_USERS, args)
-        return _parse_items(TwitterUser, result.get("results", []))
+        by_username = identifier_type == "username"
+        return await self._fetch_by_ids(
+            _tools.GET_TWITTER_USERS,
+            "identifiers",
+            identifiers,
+            args,
+            TwitterUser,
+            "username" if by_username else "id",
+            case_insensitive=by_username,
+            allow_partial=allow_partial,
+        )
+
+    def user_loader(
+        self,
+        identifier_type: str = "username",
+        *,
+        fields: list[str] | None = None,
+        force_latest: bool | None = None,
+        window: float = DEFAULT_LOADER_WINDOW,
+        max_batch_size: int | None = None,
+    ) -> AsyncBatchLoader[TwitterUser]:
+        """Merge single-user lookups into ``get_users`` calls.
+
+        Use as ``async with client.twitter.user_loader() as loader`` and
+        ``await loader.load(name)``; lookups that arrive within ``window``
+        seconds share one request.
+        """
+        key_field, fields = _loader_key(identifier_type, fields)
+        return AsyncBatchLoader(
+            lambda identifiers: self.get_users(
+                identifiers,
+                identifier_type,
+                fields=fields,
+                force_latest=force_latest,
+                allow_partial=True,
+            ),
+            lambda user: str(getattr(user, key_field)),
+            normalize=str.lower if key_field == "username" else str,
+            window=window,
+            max_batch_size=max_batch_size or self._max_batch_size,
+            concurrency=self._batch_concurrency,
+        )
 
+    @async_submittable
     async def get_user(
         self,
         identifier: str,
@@ -472,9 +603,10 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_USER, args)
         results = result.get("results", [])
         if isinstance(results, list) and len(results) > 0:
-            return _parse_item(TwitterUser, results[0])
-        return _parse_item(TwitterUser, result)
+            return self._parse_item(TwitterUser, results[0])
+        return self._parse_item(TwitterUser, result)
 
+    @async_submittable
     async def search_users(
         self,
         name: str,
@@ -488,8 +620,9 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
             fields=self._convert_fields(fields),
         )
         result = await self._call_and_maybe_poll(_tools.SEARCH_TWITTER_USERS, args)
-        return _parse_items(TwitterUser, result.get("results", []))
+        return self._parse_items(TwitterUser, result.get("results", []))
 
+    @async_submittable
     async def get_user_connections(
         self,
         username: str,
@@ -507,6 +640,7 @@ class AsyncTwitterNamespace(AsyncBaseNamespace):
         result = await self._call_and_maybe_poll(_tools.GET_TWITTER_USER_CONNECTIONS, args)
         return await self._build_paginated_result(result, TwitterUser, _tools.GET_TWITTER_USER_CONNECTIONS, args)
 
+    @async_submittable
     async def get_users_by_keywords(
         self,
         query: str,
@@ -539,6 +673,7 @@ from xpoz.namespaces._base import _attach_allowed_fields
 _TWITTER_FIELD_METADATA: dict[str, dict[str, frozenset[str]]] = {
     "get_user":                   {"fields": _af.GET_TWITTER_USER_FIELDS},
     "get_users":                  {"fields": _af.GET_TWITTER_USERS_FIELDS},
+    "user_loader":                {"fields": _af.GET_TWITTER_USERS_FIELDS},
     "search_users":               {"fields": _af.SEARCH_TWITTER_USERS_FIELDS},
     "get_users_by_keywords":      {"fields": _af.GET_TWITTER_USERS_BY_KEYWORDS_FIELDS},
     "get_user_connections":       {"fields": _af.GET_TWITTER_USER_CONNECTIONS_FIELDS},
@@ -0,0 +1,97 @@
+"""A scripted stand-in for the MCP tool server, shared by the unit tests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+CHECK_STATUS = "checkOperationStatus"
+
+Answer = Callable[[str, dict[str, Any]], dict[str, Any]]
+Status = Callable[[str], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Call:
+    name: str
+    args: dict[str, Any]
+    at: float
+
+
+def finished(operation_id: str) -> dict[str, Any]:
+    return {"status": "success", "results": [{"id": operation_id}]}
+
+
+def found(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"status": "success", "results": rows}
+
+
+class FakeServer:
+    """Answers tool calls with ``answer`` and status checks with ``status``.
+
+    Both handlers run under the server's lock, so they may keep plain state.
+    Every call is recorded with the time it arrived. ``latency`` delays each
+    answer, without blocking the event loop for ``acall``, and ``peak`` is
+    the largest number of calls that were in flight at once.
+    """
+
+    def __init__(
+        self,
+        answer: Answer | None = None,
+        *,
+        status: Status = finished,
+        latency: float = 0.0,
+    ):
+        self.answer = answer or (lambda _name, _args: found([]))
+        self.status = status
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.calls: list[Call] = []
+        self.active = 0
+        self.peak = 0
+
+    @property
+    def tool_calls(self) -> list[Call]:
+        return [call for call in self.calls if call.name != CHECK_STATUS]
+
+    @property
+    def status_checks(self) -> list[Call]:
+        return [call for call in self.calls if call.name == CHECK_STATUS]
+
+    def call(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
+        self._enter(name, args)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self._respond(name, args)
+        finally:
+            self._leave()
+
+    async def acall(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
+        self._enter(name, args)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self._respond(name, args)
+        finally:
+            self._leave()
+
+    def _enter(self, name: str, args: dict[str, Any]) -> None:
+        with self.lock:
+            self.calls.append(Call(name, args, time.monotonic()))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _leave(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+    def _respond(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            if name == CHECK_STATUS:
+                return self.status(args["operationId"])
+            return self.answer(name, args)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from xpoz._cursor import AsyncCursorResult, CursorResult
+from xpoz._pagination import AsyncPaginatedResult, PaginatedResult
+from xpoz.types.common import PaginationInfo
+from xpoz.types.twitter import TwitterPost
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _rows(page: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": page * 10 + i,  # ids sometimes arrive as numbers
+            "text": f"post {page}.{i}",
+            "like_count": str(i),
+            "deleted": "false",
+            "hashtags": ["ai", page],
+            "place_centroid": {"lat": 1.5, "lon": 2.5},
+        }
+        for i in range(2)
+    ]
+
+
+def _paginated(page: int, total: int = 3) -> PaginatedResult[TwitterPost]:
+    return PaginatedResult(
+        data=None,
+        pagination=PaginationInfo(
+            table_name="t", total_rows=total * 2, total_pages=total, page_number=page,
+            page_size=2, results_count=2,
+        ),
+        table_name="t",
+        export_operation_id=None,
+        fetch_page=lambda n, t: _paginated(n, total),
+        fetch_export=None,
+        model=TwitterPost,
+        rows=_rows(page),
+    )
+
+
+def test_schema_follows_the_model() -> None:
+    schema = _paginated(1, total=1).to_arrow().schema
+    assert schema.names == list(TwitterPost.model_fields)
+    assert schema.field("like_count").type == pa.int64()
+    assert schema.field("deleted").type == pa.bool_()
+    assert schema.field("hashtags").type == pa.list_(pa.string())
+    assert schema.field("place_centroid").type == pa.string()
+
+
+def test_to_arrow_walks_every_page_without_building_models() -> None:
+    first = _paginated(1)
+    table = first.to_arrow(columns=["id", "like_count", "deleted", "hashtags", "place_centroid"])
+    assert table.num_rows == 6
+    assert table.column("id").to_pylist() == ["10", "11", "20", "21", "30", "31"]
+    assert table.column("like_count").to_pylist() == [0, 1] * 3
+    assert table.column("deleted").to_pylist() == [False] * 6
+    assert table.column("hashtags").to_pylist()[2] == ["ai", "2"]
+    assert table.column("place_centroid").to_pylist()[0] == '{"lat": 1.5, "lon": 2.5}'
+    assert first._data is None
+
+
+def test_iter_record_batches_yields_one_batch_per_page() -> None:
+    batches = list(_paginated(2).iter_record_batches(columns=["text"]))
+    assert [batch.num_rows for batch in batches] == [2, 2]
+    assert all(batch.schema == batches[0].schema for batch in batches)
+
+
+def test_missing_fields_are_null_and_unknown_columns_rejected() -> None:
+    table = _paginated(1, total=1).to_arrow(columns=["id", "author_username"])
+    assert table.column("author_username").null_count == 2
+    with pytest.raises(ValueError, match="nope"):
+        _paginated(1).to_arrow(columns=["nope"])
+
+
+def test_data_is_still_parsed_lazily_into_models() -> None:
+    page = _paginated(1)
+    page._rows = [{"id": "10", "like_count": "0"}]
+    assert page.data[0].id == "10" and page.data[0].like_count == 0
+
+
+def test_results_built_from_models_convert_too() -> None:
+    page = PaginatedResult(
+        data=[TwitterPost(id="1", like_count=3)],
+        pagination=PaginationInfo(
+            table_name=None, total_rows=1, total_pages=1, page_number=1, page_size=1,
+            results_count=1,
+        ),
+        table_name=None,
+        export_operation_id=None,
+        fetch_page=lambda n, t: pytest.fail("single page"),
+        fetch_export=None,
+    )
+    assert page.to_arrow(columns=["id", "like_count"]).to_pylist() == [{"id": "1", "like_count": 3}]
+
+
+def test_cursor_result_to_arrow() -> None:
+    def page(n: int) -> CursorResult[TwitterPost]:
+        more = n < 2
+        return CursorResult(
+            None, more, str(n + 1) if more else None, lambda c: page(int(c)),
+            model=TwitterPost, rows=_rows(n),
+        )
+
+    assert page(1).to_arrow(columns=["id"]).column("id").to_pylist() == ["10", "11", "20", "21"]
+
+
+def test_async_results_to_arrow() -> None:
+    async def fetch_page(n: int, t: str | None) -> AsyncPaginatedResult[TwitterPost]:
+        return paginated(n)
+
+    def paginated(n: int) -> AsyncPaginatedResult[TwitterPost]:
+        return AsyncPaginatedResult(
+            data=None,
+            pagination=PaginationInfo(
+                table_name="t", total_rows=4, total_pages=2, page_number=n, page_size=2,
+                results_count=2,
+            ),
+            table_name="t",
+            export_operation_id=None,
+            fetch_page=fetch_page,
+            fetch_export=None,
+            model=TwitterPost,
+            rows=_rows(n),
+        )
+
+    async def fetch_cursor(cursor: str) -> AsyncCursorResult[TwitterPost]:
+        return AsyncCursorResult(None, False, None, fetch_cursor, model=TwitterPost, rows=_rows(2))
+
+    async def run() -> tuple[Any, Any]:
+        first_cursor = AsyncCursorResult(
+            None, True, "2", fetch_cursor, model=TwitterPost, rows=_rows(1)
+        )
+        return (
+            await paginated(1).to_arrow(columns=["id"]),
+            await first_cursor.to_arrow(columns=["id"]),
+        )
+
+    table, cursor_table = asyncio.run(run())
+    assert table.num_rows == 4
+    assert cursor_table.column("id").to_pylist() == ["10", "11", "20", "21"]
+
+
+def test_pandas_and_polars_adapters() -> None:
+    pytest.importorskip("pandas")
+    frame = _paginated(1).to_pandas(columns=["id", "like_count"])
+    assert list(frame["like_count"]) == [0, 1] * 3
+    pytest.importorskip("polars")
+    assert _paginated(1).to_polars(columns=["id"]).height == 6
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from xpoz import BatchResult
+from xpoz._batch import chunked
+from xpoz._config import _tools
+from xpoz._exceptions import OperationFailedError
+from xpoz.namespaces.tiktok import TiktokNamespace
+from xpoz.namespaces.twitter import AsyncTwitterNamespace, TwitterNamespace
+
+from .fakes import FakeServer, found
+
+
+def _ids(args: dict[str, Any]) -> list[str]:
+    ids: list[str] = args.get("postIds") or args.get("identifiers")
+    return ids
+
+
+def _server(unknown: set[str] = frozenset(), broken: set[str] = frozenset()) -> FakeServer:
+    """Returns posts for every id except those in ``unknown``, in reverse order."""
+
+    def answer(name: str, args: dict[str, Any]) -> dict[str, Any]:
+        ids = _ids(args)
+        if broken & set(ids):
+            return {"status": "error", "error": "batch too large"}
+        if name == _tools.GET_TWITTER_USERS:
+            rows = [{"id": f"u{i}", "username": i.upper()} for i in ids if i not in unknown]
+        else:
+            rows = [{"id": i} for i in ids if i not in unknown]
+        return found(rows[::-1])
+
+    return FakeServer(answer, latency=0.02)
+
+
+def _batches(server: FakeServer) -> list[list[str]]:
+    return [_ids(call.args) for call in server.tool_calls]
+
+
+def test_chunked_drops_duplicates() -> None:
+    assert chunked(["a", "b", "a", "c"], 2) == [["a", "b"], ["c"]]
+    assert chunked([], 10) == [[]]
+
+
+def test_large_id_lists_are_chunked_and_reordered() -> None:
+    ids = [str(i) for i in range(250)]
+    server = _server(unknown={"7", "240"})
+    ns = TwitterNamespace(server.call, 10, max_batch_size=100, batch_concurrency=3)
+
+    posts = ns.get_posts_by_ids(ids)
+
+    assert isinstance(posts, BatchResult)
+    assert sorted(len(b) for b in _batches(server)) == [50, 100, 100]
+    assert server.peak == 3
+    assert [p.id for p in posts] == [i for i in ids if i not in {"7", "240"}]
+    assert posts.missing == ["7", "240"]
+    assert not posts.complete
+
+
+def test_partial_failures_are_reported_per_id() -> None:
+    ids = [str(i) for i in range(30)]
+    server = _server(broken={"15"})
+    ns = TiktokNamespace(server.call, 10, max_batch_size=10)
+
+    posts = ns.get_posts_by_ids(ids, allow_partial=True)
+
+    assert [p.id for p in posts] == ids[:10] + ids[20:]
+    assert set(posts.failed) == set(ids[10:20])
+    assert isinstance(posts.failed["15"], OperationFailedError)
+    assert posts.missing == []
+
+
+def test_chunk_failures_raise_unless_partial_results_are_allowed() -> None:
+    server = _server(broken={"15"})
+    ns = TiktokNamespace(server.call, 10, max_batch_size=10)
+    with pytest.raises(OperationFailedError):
+        ns.get_posts_by_ids([str(i) for i in range(30)])
+
+
+def test_first_error_is_raised_when_every_chunk_fails() -> None:
+    server = _server(broken={"1", "11"})
+    ns = TiktokNamespace(server.call, 10, max_batch_size=10)
+    with pytest.raises(OperationFailedError):
+        ns.get_posts_by_ids([str(i) for i in range(20)])
+
+
+def test_users_match_usernames_case_insensitively() -> None:
+    server = _server(unknown={"ghost"})
+    ns = TwitterNamespace(server.call, 10, max_batch_size=2)
+    users = ns.get_users(["alice", "ghost", "Bob"])
+    assert [u.username for u in users] == ["ALICE", "BOB"]
+    assert users.missing == ["ghost"]
+
+
+def test_async_chunks_run_concurrently() -> None:
+    ids = [str(i) for i in range(80)]
+    server = _server()
+
+    async def run() -> BatchResult[Any]:
+        ns = AsyncTwitterNamespace(server.acall, 10, max_batch_size=10, batch_concurrency=4)
+        return await ns.get_posts_by_ids(ids)
+
+    posts = asyncio.run(run())
+    assert [p.id for p in posts] == ids
+    assert len(_batches(server)) == 8
+    assert server.peak == 4
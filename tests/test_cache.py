@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from xpoz import DiskCache, MemoryCache
+from xpoz._cache import ResponseCache, cache_key
+from xpoz._config import _tools
+from xpoz.namespaces.account import AccountNamespace
+from xpoz.namespaces.twitter import AsyncTwitterNamespace, TwitterNamespace
+
+from .fakes import FakeServer
+
+
+def _answer(name: str, args: dict[str, Any]) -> dict[str, Any]:
+    if name == _tools.GET_TWITTER_USER:
+        return {"status": "success", "id": "44196397", "username": args["identifier"]}
+    if name == _tools.COUNT_TWEETS:
+        return {"status": "success", "count": 1234}
+    return {"status": "success", "plan": {"name": "pro"}}
+
+
+def test_key_ignores_argument_order() -> None:
+    assert cache_key("t", {"a": 1, "b": [1, 2]}) == cache_key("t", {"b": [1, 2], "a": 1})
+    assert cache_key("t", {"a": 1}) != cache_key("u", {"a": 1})
+
+
+def test_incomplete_cache_subclass_cannot_be_created() -> None:
+    class NoUsage(ResponseCache):
+        def clear(self) -> None: ...
+
+        def _load(self, key: str) -> bytes | None:
+            return None
+
+        def _save(self, key: str, data: bytes, ttl: float) -> None: ...
+
+    with pytest.raises(TypeError, match="_usage"):
+        NoUsage()
+
+
+def test_lru_eviction_by_entries_and_bytes() -> None:
+    cache = MemoryCache(max_entries=2)
+    for i in range(3):
+        cache.set("tool", {"i": i}, {"v": i})
+    assert cache.get("tool", {"i": 0}) is None
+    assert cache.get("tool", {"i": 2}) == {"v": 2}
+    assert cache.stats().evictions == 1
+
+    small = MemoryCache(max_bytes=30)
+    small.set("tool", {"i": 0}, {"v": "x" * 10})
+    small.set("tool", {"i": 1}, {"v": "y" * 10})
+    assert small.stats().entries == 1
+    small.set("tool", {"i": 2}, {"v": "z" * 100})  # larger than the whole cache
+    assert small.get("tool", {"i": 1}) == {"v": "y" * 10}
+
+
+def test_ttl_and_per_tool_overrides() -> None:
+    cache = MemoryCache(ttl=0.05, ttls={"never": 0, "long": 60})
+    cache.set("short", {}, {"v": 1})
+    cache.set("long", {}, {"v": 2})
+    cache.set("never", {}, {"v": 3})
+    time.sleep(0.06)
+    assert cache.get("short", {}) is None
+    assert cache.get("long", {}) == {"v": 2}
+    assert cache.get("never", {}) is None
+    assert cache.stats().bypasses == 1
+
+
+def test_namespace_serves_repeat_calls_from_cache() -> None:
+    server = FakeServer(_answer)
+    cache = MemoryCache()
+    ns = TwitterNamespace(server.call, 10, cache=cache)
+
+    first = ns.get_user("elonmusk")
+    second = ns.get_user("elonmusk")
+    assert first == second
+    assert ns.count_posts("ai") == ns.count_posts("ai") == 1234
+    assert [call.name for call in server.calls] == [_tools.GET_TWITTER_USER, _tools.COUNT_TWEETS]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert stats.hit_rate == 0.5
+
+
+def test_force_latest_skips_the_cache() -> None:
+    server = FakeServer(_answer)
+    ns = TwitterNamespace(server.call, 10, cache=MemoryCache())
+    ns.get_user("elonmusk")
+    ns.get_user("elonmusk", force_latest=True)
+    assert len(server.calls) == 2
+
+
+def test_account_tools_are_not_cached_by_default() -> None:
+    server = FakeServer(_answer)
+    ns = AccountNamespace(server.call, 10, cache=MemoryCache())
+    ns.get_account_details()
+    ns.get_account_details()
+    assert len(server.calls) == 2
+
+
+def test_sync_and_async_clients_share_a_cache() -> None:
+    server = FakeServer(_answer)
+    cache = MemoryCache()
+    TwitterNamespace(server.call, 10, cache=cache).get_user("elonmusk")
+
+    async def run() -> Any:
+        return await AsyncTwitterNamespace(server.acall, 10, cache=cache).get_user("elonmusk")
+
+    assert asyncio.run(run()).username == "elonmusk"
+    assert len(server.calls) == 1
+
+
+def test_disk_cache_round_trip_and_ttl(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path / "cache.db", ttl=60, ttls={"short": 0.05})
+    payload = {"results": [{"id": str(i), "text": "hello " * 20} for i in range(50)]}
+    cache.set("long", {"q": 1}, payload)
+    cache.set("short", {"q": 1}, payload)
+    time.sleep(0.06)
+    assert cache.get("long", {"q": 1}) == payload
+    assert cache.get("short", {"q": 1}) is None
+
+    stats = cache.stats()
+    assert stats.entries == 1
+    assert stats.bytes < len(json.dumps(payload)) / 4  # stored compressed
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path / "cache.db", max_bytes=200, compress_level=0)
+    for i in range(4):
+        cache.set("tool", {"i": i}, {"v": str(i) * 40})
+    assert cache.get("tool", {"i": 0}) is None
+    assert cache.get("tool", {"i": 3}) is not None
+    assert cache.stats().bytes <= 200
+    assert cache.stats().evictions >= 1
+
+
+def test_disk_cache_keeps_a_running_size_total(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(path) as conn:  # a cache file from before the total was kept
+        conn.execute(
+            "CREATE TABLE responses (key TEXT PRIMARY KEY, data BLOB NOT NULL,"
+            " size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO responses VALUES ('old', x'00', 1, 1e12, 0)")
+    conn.close()
+    cache = DiskCache(path, max_bytes=10_000, compress_level=0, ttls={"short": 0.01})
+
+    def totals() -> tuple[int, int]:
+        (kept,) = cache._conn.execute("SELECT total_size FROM cache_meta").fetchone()
+        (actual,) = cache._conn.execute("SELECT SUM(size) FROM responses").fetchone()
+        return kept, actual or 0
+
+    cache.set("tool", {"i": 0}, {"v": "a"})
+    cache.set("tool", {"i": 0}, {"v": "a" * 100})  # replaced with a bigger payload
+    cache.set("short", {"i": 1}, {"v": "b" * 50})
+    time.sleep(0.02)
+    cache.set("tool", {"i": 2}, {"v": "c"})  # sweeps the expired entry
+    kept, actual = totals()
+    assert kept == actual and cache.stats().entries == 3
+    cache.clear()
+    assert totals() == (0, 0)
+
+
+def test_disk_cache_is_shared_between_processes(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    writer = (
+        "import sys\n"
+        "from xpoz import DiskCache\n"
+        "args = {'identifier': 'x', 'identifierType': 'username'}\n"
+        "DiskCache(sys.argv[1]).set('getTwitterUser', args, {'id': '1'})\n"
+    )
+    subprocess.run([sys.executable, "-c", writer, str(path)], check=True)
+
+    server = FakeServer(_answer)
+    ns = TwitterNamespace(server.call, 10, cache=DiskCache(path))
+    assert ns.get_user("x").id == "1"
+    assert server.calls == []
+
+
+def test_disk_cache_concurrent_writers(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    caches = [DiskCache(path) for _ in range(4)]
+
+    def work(n: int) -> None:
+        cache = caches[n % 4]
+        for i in range(50):
+            cache.set("tool", {"i": i, "n": n}, {"v": i})
+            assert cache.get("tool", {"i": i, "n": n}) == {"v": i}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+    assert caches[0].stats().entries == 400
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import itertools
+import json
+import socket
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from xpoz import _download
+from xpoz._download import (
+    adownload_to,
+    aiter_download,
+    decode_chunks,
+    download_to,
+    iter_download,
+)
+from xpoz._exceptions import XpozConnectionError
+from xpoz._export import iter_csv_rows
+
+BLOB = b"".join(b"%06d,row number %d\n" % (i, i) for i in range(5000))
+
+
+class _Server:
+    """Serves ``blob`` with Range support; the first ``drops`` responses are cut short."""
+
+    def __init__(self) -> None:
+        self.blob = BLOB
+        self.ranges = True
+        self.drops = 0
+        self.drop_after = 1000
+        self.truncate: int | None = None
+        self.requests: list[str | None] = []
+        self.lock = threading.Lock()
+
+
+SERVER = _Server()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path == "/loop":
+            self.send_response(302)
+            self.send_header("Location", "/loop")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        blob = SERVER.blob
+        header = self.headers.get("Range")
+        with SERVER.lock:
+            SERVER.requests.append(header)
+        if header and SERVER.ranges:
+            first, _, last = header.removeprefix("bytes=").partition("-")
+            start, end = int(first), int(last) if last else len(blob) - 1
+            body = blob[start : end + 1]
+            if SERVER.truncate is not None and header != "bytes=0-0":
+                # A short body with a matching Content-Length: the response
+                # ends cleanly, without a transport error.
+                body = body[: SERVER.truncate]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(blob)}")
+            self.send_header("ETag", '"v1"')
+        else:
+            body = blob
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        with SERVER.lock:
+            drop = SERVER.drops > 0 and len(body) > SERVER.drop_after
+            if drop:
+                SERVER.drops -= 1
+        if drop:
+            # Half-close after the partial body: the client reads every byte
+            # sent and then a clean EOF, never a reset that could discard them.
+            self.wfile.write(body[: SERVER.drop_after])
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_WR)
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/export.csv"
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    SERVER.__init__()  # type: ignore[misc]
+    monkeypatch.setattr(_download, "_MIN_PART_BYTES", 1024)
+
+
+def _ranged(requests: list[str | None]) -> list[tuple[int, int]]:
+    spans = []
+    for header in requests:
+        if header and header != "bytes=0-0":
+            first, _, last = header.removeprefix("bytes=").partition("-")
+            spans.append((int(first), int(last)))
+    return spans
+
+
+def test_download_fetches_ranges_in_parallel(url: str, tmp_path: Path) -> None:
+    target = download_to(url, tmp_path / "out.csv", parts=4)
+    assert target.read_bytes() == BLOB
+    spans = sorted(_ranged(SERVER.requests))
+    assert len(spans) == 4
+    assert spans[0][0] == 0 and spans[-1][1] == len(BLOB) - 1
+    assert all(a[1] + 1 == b[0] for a, b in itertools.pairwise(spans))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.csv"]
+
+
+def test_dropped_ranges_are_retried_from_where_they_stopped(url: str, tmp_path: Path) -> None:
+    SERVER.drops = 2
+    assert download_to(url, tmp_path / "out.csv", parts=2).read_bytes() == BLOB
+    spans = _ranged(SERVER.requests)
+    assert len(spans) == 4
+    # Both ranges were cut short and picked up again past their start. The
+    # two ranges run on separate threads, so a retry may be logged before
+    # the other range's first request; pair requests by the range end.
+    by_end: dict[int, list[int]] = {}
+    for start, end in spans:
+        by_end.setdefault(end, []).append(start)
+    assert len(by_end) == 2
+    for original, resumed in (sorted(starts) for starts in by_end.values()):
+        assert original < resumed <= original + 1000
+
+
+def test_truncated_range_responses_are_resumed(url: str, tmp_path: Path) -> None:
+    SERVER.truncate = 3000
+    assert download_to(url, tmp_path / "out.csv", parts=2).read_bytes() == BLOB
+    assert asyncio.run(adownload_to(url, tmp_path / "async.csv", parts=2)).read_bytes() == BLOB
+
+
+def test_empty_range_responses_exhaust_the_retries(
+    url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_download, "_MAX_RESUMES", 2)
+    SERVER.truncate = 0
+    with pytest.raises(XpozConnectionError, match="stopped sending"):
+        download_to(url, tmp_path / "out.csv", parts=2)
+    # The first range to give up stops the other, which may not be done yet.
+    assert max(Counter(_ranged(SERVER.requests)).values()) == 3
+
+    SERVER.requests.clear()
+    with pytest.raises(XpozConnectionError, match="stopped sending"):
+        asyncio.run(adownload_to(url, tmp_path / "async.csv", parts=1))
+    assert len(_ranged(SERVER.requests)) == 3
+
+
+def test_failed_download_resumes_on_the_next_call(
+    url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_download, "_MAX_RESUMES", 0)
+    SERVER.drops = 100
+    with pytest.raises(XpozConnectionError):
+        download_to(url, tmp_path / "out.csv", parts=4)
+    state = json.loads((tmp_path / "out.csv.part.json").read_text())
+    assert state["size"] == len(BLOB)
+    assert 0 < sum(done for _, _, done in state["ranges"]) < len(BLOB)
+
+    SERVER.drops = 0
+    SERVER.requests.clear()
+    assert download_to(url, tmp_path / "out.csv", parts=4).read_bytes() == BLOB
+    fetched = sum(end - start + 1 for start, end in _ranged(SERVER.requests))
+    assert fetched == len(BLOB) - sum(done for _, _, done in state["ranges"])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.csv"]
+
+
+def test_changed_remote_file_restarts_the_download(
+    url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_download, "_MAX_RESUMES", 0)
+    SERVER.drops = 100
+    with pytest.raises(XpozConnectionError):
+        download_to(url, tmp_path / "out.csv", parts=4)
+    SERVER.drops = 0
+    SERVER.blob = BLOB + b"999999,appended\n"
+    assert download_to(url, tmp_path / "out.csv", parts=4).read_bytes() == SERVER.blob
+
+
+def test_without_range_support_the_file_is_streamed(url: str, tmp_path: Path) -> None:
+    SERVER.ranges = False
+    assert download_to(url, tmp_path / "out.csv", parts=4).read_bytes() == BLOB
+    assert SERVER.requests == ["bytes=0-0", None]
+
+
+def test_stream_resumes_after_a_dropped_connection(url: str) -> None:
+    SERVER.drops = 1
+    assert b"".join(iter_download(url, chunk_size=512)) == BLOB
+    assert SERVER.requests == [None, "bytes=1000-"]
+
+
+def test_http_errors_are_raised_as_connection_errors(url: str) -> None:
+    loop = url.replace("/export.csv", "/loop")  # TooManyRedirects is not a TransportError
+    with pytest.raises(XpozConnectionError):
+        list(iter_download(loop))
+
+    async def consume() -> None:
+        async for _ in aiter_download(loop):
+            pass
+
+    with pytest.raises(XpozConnectionError):
+        asyncio.run(consume())
+
+
+def test_gzip_exports_are_decoded(url: str, tmp_path: Path) -> None:
+    SERVER.blob = gzip.compress(b"id,text\n" + BLOB[:200]) + gzip.compress(BLOB[200:400])
+    rows = list(iter_csv_rows(decode_chunks(iter_download(url, chunk_size=7))))
+    assert rows[0] == {"id": "000000", "text": "row number 0"}
+    target = download_to(url, tmp_path / "out.csv", parts=2)
+    assert target.read_bytes() == b"id,text\n" + BLOB[:400]
+    raw = download_to(url, tmp_path / "raw.csv.gz", parts=2, decompress=False)
+    assert raw.read_bytes() == SERVER.blob
+
+
+def test_zstd_exports_are_decoded(url: str) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    SERVER.blob = zstandard.ZstdCompressor().compress(BLOB)
+    assert b"".join(decode_chunks(iter_download(url, chunk_size=100))) == BLOB
+
+
+def test_async_download_fetches_ranges_and_resumes(url: str, tmp_path: Path) -> None:
+    SERVER.drops = 1
+    target = asyncio.run(adownload_to(url, tmp_path / "out.csv", parts=3))
+    assert target.read_bytes() == BLOB
+    assert len(_ranged(SERVER.requests)) == 4
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.csv"]
+
+    SERVER.ranges = False
+    SERVER.requests.clear()
+    streamed = asyncio.run(adownload_to(url, tmp_path / "streamed.csv", parts=3))
+    assert streamed.read_bytes() == BLOB
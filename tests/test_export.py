@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+
+from xpoz._exceptions import NotFoundError
+from xpoz._export import CsvRowParser, iter_csv_rows
+from xpoz._pagination import AsyncPaginatedResult, PaginatedResult
+from xpoz.types.common import PaginationInfo
+from xpoz.types.twitter import TwitterPost
+
+CSV = (
+    "id,text,likeCount,hashtags,authorUsername\r\n"
+    '1,"hello, world",5,"[""ai"",""ml""]",alice\r\n'
+    '2,"multi\nline ""quoted""",,[],bob\r\n'
+    "3,héllo ✓,7,,\r\n"
+)
+
+# The server sends the first chunk, then waits for the test to have seen a row.
+RELEASE = threading.Event()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path == "/missing.csv":
+            self.send_error(404)
+            return
+        body = CSV.encode()
+        split = body.index(b"\n2,") + 1  # after the header and first row
+        first, rest = body[:split], body[split:]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(first)
+        self.wfile.flush()
+        if self.path == "/slow.csv":
+            RELEASE.wait(5)
+        self.wfile.write(rest)
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def _pagination() -> PaginationInfo:
+    return PaginationInfo(
+        table_name=None, total_rows=0, total_pages=0, page_number=1, page_size=100,
+        results_count=0,
+    )
+
+
+def _result(url: str) -> PaginatedResult[TwitterPost]:
+    return PaginatedResult(
+        data=[],
+        pagination=_pagination(),
+        table_name=None,
+        export_operation_id="op-1",
+        fetch_page=lambda n, t: pytest.fail("no pages"),
+        fetch_export=lambda op_id: url,
+        model=TwitterPost,
+    )
+
+
+def _async_result(url: str) -> AsyncPaginatedResult[TwitterPost]:
+    async def fetch_export(op_id: str) -> str:
+        return url
+
+    async def fetch_page(n: int, t: str | None) -> AsyncPaginatedResult[TwitterPost]:
+        raise AssertionError("no pages")
+
+    return AsyncPaginatedResult(
+        data=[],
+        pagination=_pagination(),
+        table_name=None,
+        export_operation_id="op-1",
+        fetch_page=fetch_page,
+        fetch_export=fetch_export,
+        model=TwitterPost,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_parser_is_independent_of_chunk_boundaries(chunk_size: int) -> None:
+    data = CSV.encode()
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    rows = list(iter_csv_rows(chunks))
+    assert rows == [
+        {"id": "1", "text": "hello, world", "like_count": "5", "hashtags": ["ai", "ml"],
+         "author_username": "alice"},
+        {"id": "2", "text": 'multi\nline "quoted"', "like_count": None, "hashtags": [],
+         "author_username": "bob"},
+        {"id": "3", "text": "héllo ✓", "like_count": "7", "hashtags": None,
+         "author_username": None},
+    ]
+
+
+def test_parser_only_buffers_the_partial_record() -> None:
+    parser = CsvRowParser()
+    assert parser.feed(b"id,text\n1,a\n2,b") == [{"id": "1", "text": "a"}]
+    assert parser.feed(b"\n") == [{"id": "2", "text": "b"}]
+    assert parser.feed(b'3,"open') == []
+    assert parser.feed(b' quote"\n4,x') == [{"id": "3", "text": "open quote"}]
+    assert parser.close() == [{"id": "4", "text": "x"}]
+
+
+def test_export_rows_yields_models_while_streaming(base_url: str) -> None:
+    RELEASE.clear()
+    rows = _result(f"{base_url}/slow.csv").export_rows(chunk_size=16)
+    first = next(rows)  # arrives before the server sends the rest
+    RELEASE.set()
+    posts = [first, *rows]
+    assert all(isinstance(post, TwitterPost) for post in posts)
+    assert [post.like_count for post in posts] == [5, None, 7]
+    assert posts[0].hashtags == ["ai", "ml"]
+
+
+def test_export_rows_raw_returns_dicts(base_url: str) -> None:
+    rows = list(_result(f"{base_url}/data.csv").export_rows(raw=True))
+    assert rows[0]["author_username"] == "alice"
+
+
+def test_export_to_writes_the_file(base_url: str, tmp_path: Path) -> None:
+    target = _result(f"{base_url}/data.csv").export_to(tmp_path / "out.csv", chunk_size=8)
+    assert target.read_bytes() == CSV.encode()
+    assert not (tmp_path / "out.csv.part").exists()
+
+
+def test_failed_download_leaves_no_file(base_url: str, tmp_path: Path) -> None:
+    with pytest.raises(NotFoundError):
+        _result(f"{base_url}/missing.csv").export_to(tmp_path / "out.csv")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_async_export_rows_and_export_to(base_url: str, tmp_path: Path) -> None:
+    result = _async_result(f"{base_url}/data.csv")
+
+    async def run() -> list[TwitterPost]:
+        await result.export_to(tmp_path / "out.csv")
+        return [post async for post in result.export_rows(chunk_size=5)]
+
+    posts = asyncio.run(run())
+    assert [post.id for post in posts] == ["1", "2", "3"]
+    assert (tmp_path / "out.csv").read_bytes() == CSV.encode()
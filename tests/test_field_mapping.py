@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from xpoz._transform import _field_mapping
+from xpoz._transform._field_mapping import (
+    camel_to_snake,
+    map_dict_keys_to_snake,
+    map_fields_to_camel,
+    map_list_of_dicts_to_snake,
+    snake_to_camel,
+    to_snake,
+)
+
+
+def test_tables_agree_with_the_regex_conversion() -> None:
+    for name, snake in _field_mapping._TO_SNAKE.items():
+        assert snake == camel_to_snake(name)
+    for name, camel in _field_mapping._TO_CAMEL.items():
+        assert camel == snake_to_camel(name)
+    assert to_snake("likeCount") == "like_count"
+    assert to_snake("created_at_date") == "created_at_date"
+    assert map_fields_to_camel(["retweet_count", "id"]) == ["retweetCount", "id"]
+
+
+def test_unseen_keys_are_learned_up_to_a_bound(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_field_mapping, "_TO_SNAKE", dict(_field_mapping._TO_SNAKE))
+    monkeypatch.setattr(_field_mapping, "_MAX_LEARNED_KEYS", 2)
+    keys = ["brandNewKey", "anotherNewKey", "yetAnotherKey"]
+    assert [to_snake(key) for key in keys] == [
+        "brand_new_key",
+        "another_new_key",
+        "yet_another_key",
+    ]
+    assert "anotherNewKey" in _field_mapping._TO_SNAKE
+    assert "yetAnotherKey" not in _field_mapping._TO_SNAKE
+
+
+def test_rows_with_different_key_layouts() -> None:
+    rows = [
+        {"id": "1", "likeCount": 1},
+        {"id": "2", "likeCount": 2},
+        {"likeCount": 3, "id": "3", "authorUsername": "a"},
+        {},
+    ]
+    assert map_list_of_dicts_to_snake(rows) == [map_dict_keys_to_snake(row) for row in rows]
+    assert list(map_list_of_dicts_to_snake(rows)[2]) == ["like_count", "id", "author_username"]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from xpoz import OperationJournal, OperationTimeoutError
+from xpoz._exceptions import OperationFailedError
+from xpoz._mcp._polling import PollingStrategy
+from xpoz._mcp._scheduler import PollScheduler
+from xpoz.namespaces.twitter import TwitterNamespace
+
+from .fakes import FakeServer, finished
+
+FAST = PollingStrategy(initial_interval=0.01, multiplier=1)
+
+
+def _server() -> tuple[FakeServer, threading.Event]:
+    """Submits ``op-<query>``; ``op-bad`` fails and the rest run until ``done`` is set."""
+    done = threading.Event()
+
+    def status(operation_id: str) -> dict[str, Any]:
+        if operation_id == "op-bad":
+            return {"status": "error", "error": "boom"}
+        return finished(operation_id) if done.is_set() else {"status": "running"}
+
+    def submit(_name: str, args: dict[str, Any]) -> dict[str, Any]:
+        return {"operationId": f"op-{args['query']}"}
+
+    return FakeServer(submit, status=status), done
+
+
+def test_journal_round_trip(tmp_path: Path) -> None:
+    journal = OperationJournal(tmp_path / "ops.db")
+    journal.record("op-1", "searchTwitterPosts", {"query": "ai", "tableName": "t_1"})
+    assert journal.find("searchTwitterPosts", {"tableName": "t_1", "query": "ai"}) == "op-1"
+    assert journal.find("searchTwitterPosts", {"query": "other"}) is None
+
+    [entry] = journal.pending()
+    assert entry.table_name == "t_1"
+    assert entry.arguments == {"query": "ai", "tableName": "t_1"}
+
+    journal.finish("op-1", OperationTimeoutError("op-1", 5))
+    assert journal.find("searchTwitterPosts", {"query": "ai", "tableName": "t_1"}) == "op-1"
+    journal.finish("op-1")
+    assert journal.pending() == []
+
+
+def test_expired_entries_are_dropped(tmp_path: Path) -> None:
+    journal = OperationJournal(tmp_path / "ops.db", max_age=0.01)
+    journal.record("op-1", "searchTwitterPosts", {"query": "ai"})
+    time.sleep(0.02)
+    assert journal.find("searchTwitterPosts", {"query": "ai"}) is None
+    assert journal.pending() == []
+
+
+def test_restart_reattaches_instead_of_resubmitting(tmp_path: Path) -> None:
+    path = tmp_path / "ops.db"
+    server, done = _server()
+
+    first = TwitterNamespace(server.call, 0.05, polling=FAST, journal=OperationJournal(path))
+    with pytest.raises(OperationTimeoutError):
+        first.search_posts("ai")
+    assert len(server.tool_calls) == 1
+
+    # A new process opens the same journal file.
+    done.set()
+    journal = OperationJournal(path)
+    second = TwitterNamespace(server.call, 10, polling=FAST, journal=journal)
+    result = second.search_posts("ai")
+
+    assert len(server.tool_calls) == 1
+    assert result.data[0].id == "op-ai"
+    assert journal.pending() == []
+
+
+def test_failed_operations_leave_the_journal(tmp_path: Path) -> None:
+    journal = OperationJournal(tmp_path / "ops.db")
+    ns = TwitterNamespace(_server()[0].call, 10, polling=FAST, journal=journal)
+    with pytest.raises(OperationFailedError):
+        ns.search_posts("bad")
+    assert journal.pending() == []
+
+
+def test_submitted_operations_are_journaled(tmp_path: Path) -> None:
+    journal = OperationJournal(tmp_path / "ops.db")
+    server, done = _server()
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    ns = TwitterNamespace(server.call, 10, poller=scheduler, journal=journal)
+    handle = ns.search_posts.submit("ai")
+    assert [e.operation_id for e in journal.pending()] == ["op-ai"]
+    done.set()
+    handle.result(timeout=10)
+    deadline = time.monotonic() + 5
+    while journal.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)  # the journal is updated from the future's callback
+    assert journal.pending() == []
+    scheduler.close()
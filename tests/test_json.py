@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from xpoz import _json, json_backend, set_json_backend
+from xpoz._exceptions import ValidationError
+from xpoz._rest import RestTransport
+
+DOC = b'{"results": [{"id": "1", "likeCount": 3, "score": 1.5, "tags": ["a"], "ok": true}]}'
+EXPECTED = {"results": [{"id": "1", "likeCount": 3, "score": 1.5, "tags": ["a"], "ok": True}]}
+
+
+@pytest.fixture(autouse=True)
+def restore_backend() -> Iterator[None]:
+    previous = json_backend()
+    yield
+    set_json_backend(previous)
+
+
+@pytest.mark.parametrize("backend", _json.JSON_BACKENDS)
+def test_every_backend_decodes_the_same(backend: str) -> None:
+    pytest.importorskip(backend)
+    assert set_json_backend(backend) == backend
+    assert _json.loads(DOC) == EXPECTED
+    assert _json.loads(DOC.decode()) == EXPECTED
+    # NaN is not standard JSON; the fast backends hand it to the stdlib.
+    assert _json.loads(b"[NaN]")[0] != _json.loads(b"[NaN]")[0]
+    with pytest.raises(ValueError):
+        _json.loads(b"{not json")
+
+
+@pytest.mark.parametrize("backend", _json.JSON_BACKENDS)
+def test_every_backend_encodes_what_it_decodes(backend: str) -> None:
+    pytest.importorskip(backend)
+    set_json_backend(backend)
+    assert _json.loads(_json.dumps(EXPECTED)) == EXPECTED
+    # Wider than 64 bits: the fast backends hand it to the stdlib.
+    assert _json.loads(_json.dumps({"n": 2**70})) == {"n": 2**70}
+    # Keys compared across runs do not depend on the backend.
+    assert _json.canonical_dumps({"b": 1, "a": "é"}) == '{"a":"\\u00e9","b":1}'
+
+
+def test_default_prefers_an_installed_fast_backend() -> None:
+    expected = "json"
+    for candidate in ("msgspec", "orjson"):
+        try:
+            __import__(candidate)
+            expected = candidate
+        except ImportError:
+            pass
+    assert set_json_backend() == expected
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="ujson"):
+        set_json_backend("ujson")
+
+
+def test_rest_transport_decodes_bodies_and_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/bad":
+            return httpx.Response(400, content=b'{"error": "bad cursor"}')
+        return httpx.Response(200, content=DOC)
+
+    transport = RestTransport("http://api.test")
+    transport._client = httpx.Client(
+        base_url="http://api.test", transport=httpx.MockTransport(handler)
+    )
+    try:
+        assert transport.get("/posts", {}) == EXPECTED
+        with pytest.raises(ValidationError, match="bad cursor"):
+            transport.get("/bad", {})
+    finally:
+        transport.close()
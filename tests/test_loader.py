@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from xpoz import NotFoundError
+from xpoz._config import _tools
+from xpoz.namespaces.twitter import AsyncTwitterNamespace, TwitterNamespace
+
+from .fakes import FakeServer, found
+
+
+def _server(unknown: set[str] = frozenset()) -> FakeServer:
+    def answer(name: str, args: dict[str, Any]) -> dict[str, Any]:
+        assert name == _tools.GET_TWITTER_USERS
+        ids = args["identifiers"]
+        return found([{"id": f"id-{i}", "username": i.upper()} for i in ids if i not in unknown])
+
+    return FakeServer(answer)
+
+
+def _batches(server: FakeServer) -> list[list[str]]:
+    return [call.args["identifiers"] for call in server.tool_calls]
+
+
+def test_sync_loader_merges_lookups_from_many_threads() -> None:
+    server = _server(unknown={"ghost"})
+    ns = TwitterNamespace(server.call, 10)
+    names = [f"user{i}" for i in range(40)]
+
+    with ns.user_loader(window=0.2) as loader:
+        with ThreadPoolExecutor(max_workers=40) as pool:
+            users = list(pool.map(loader.get, names))
+        with pytest.raises(NotFoundError):
+            loader.get("ghost")
+
+    assert [u.username for u in users] == [n.upper() for n in names]
+    assert len(_batches(server)) == 2  # 40 users in one batch, then the ghost
+
+
+def test_sync_loader_respects_max_batch_size() -> None:
+    server = _server()
+    ns = TwitterNamespace(server.call, 10)
+    with ns.user_loader(window=1.0, max_batch_size=10) as loader:
+        users = loader.get_many([f"u{i}" for i in range(25)], timeout=5)
+    assert len(users) == 25
+    assert sorted(len(b) for b in _batches(server)) == [5, 10, 10]
+
+
+def test_loader_keys_by_id_and_adds_key_field() -> None:
+    server = FakeServer(lambda _name, args: found([{"id": i} for i in args["identifiers"]]))
+    ns = TwitterNamespace(server.call, 10)
+    with ns.user_loader("id", fields=["name"]) as loader:
+        assert loader.get("42").id == "42"
+    assert server.tool_calls[0].args["fields"] == ["name", "id"]
+
+
+def test_async_loader_merges_concurrent_lookups() -> None:
+    server = _server(unknown={"ghost"})
+
+    async def run() -> list[Any]:
+        ns = AsyncTwitterNamespace(server.acall, 10)
+        async with ns.user_loader(max_batch_size=50) as loader:
+            results = await asyncio.gather(
+                *(loader.load(f"user{i}") for i in range(120)),
+                loader.load("ghost"),
+                return_exceptions=True,
+            )
+        return results
+
+    results = asyncio.run(run())
+    assert [r.username for r in results[:120]] == [f"USER{i}" for i in range(120)]
+    assert isinstance(results[120], NotFoundError)
+    assert sorted(len(b) for b in _batches(server)) == [21, 50, 50]
+
+
+def test_user_loader_has_no_submit_form() -> None:
+    ns = TwitterNamespace(_server().call, 10)
+    assert not hasattr(ns.user_loader, "submit")
+
+
+def test_sync_leftover_keys_keep_their_deadline() -> None:
+    server = _server()
+    ns = TwitterNamespace(server.call, 10)
+    with ns.user_loader(window=0.3, max_batch_size=2) as loader:
+        started = time.monotonic()
+        first = loader.load("a")
+        time.sleep(0.2)
+        rest = [loader.load("b"), loader.load("c")]
+        assert [f.result(5).username for f in (first, *rest)] == ["A", "B", "C"]
+        # "c" is due when the first key's window closes, not a window after "b".
+        assert time.monotonic() - started < 0.45
+    assert _batches(server) == [["a", "b"], ["c"]]
+
+
+def test_async_loader_leftover_keys_do_not_wait_another_window() -> None:
+    server = _server()
+
+    async def run() -> float:
+        ns = AsyncTwitterNamespace(server.acall, 10)
+        async with ns.user_loader(window=0.3, max_batch_size=2) as loader:
+            started = time.monotonic()
+            first = asyncio.ensure_future(loader.load("a"))
+            await asyncio.sleep(0.2)
+            await asyncio.gather(first, loader.load("b"), loader.load("c"))
+            return time.monotonic() - started
+
+    assert asyncio.run(run()) < 0.45
+    assert _batches(server) == [["a", "b"], ["c"]]
+
+
+def test_async_loader_closes_from_another_task() -> None:
+    server = _server()
+
+    async def run() -> None:
+        ns = AsyncTwitterNamespace(server.acall, 10)
+        loader = ns.user_loader()
+        await asyncio.wait_for(loader.start(), timeout=1)
+        assert (await loader.load("a")).username == "A"
+        await asyncio.create_task(loader.aclose())
+        await asyncio.sleep(0.02)  # the caller was not cancelled
+
+    asyncio.run(run())
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from xpoz import AsyncOperationHandle, OperationCancelledError, OperationHandle
+from xpoz._mcp._polling import PollingStrategy
+from xpoz._mcp._scheduler import AsyncPollScheduler, PollScheduler
+from xpoz.namespaces.twitter import AsyncTwitterNamespace, TwitterNamespace
+from xpoz.types.twitter import TwitterPost
+
+from .fakes import FakeServer
+
+FAST = PollingStrategy(initial_interval=0.01, multiplier=1)
+
+
+def _answer(_name: str, args: dict[str, Any]) -> dict[str, Any]:
+    if args.get("query") == "cached":
+        return {"status": "success", "results": [{"id": "hit"}]}
+    if "postIds" not in args:
+        return {"operationId": f"op-{args['query']}"}
+    if "inline" in args["postIds"]:
+        return {"status": "success", "results": [{"id": i} for i in args["postIds"]]}
+    return {"operationId": "op-ids-" + "-".join(args["postIds"])}
+
+
+def _server() -> tuple[FakeServer, threading.Event]:
+    """Every search starts an operation that finishes once the event is set."""
+    release = threading.Event()
+
+    def status(operation_id: str) -> dict[str, Any]:
+        if not release.is_set():
+            return {"status": "running"}
+        if operation_id.startswith("op-ids-"):
+            rows = [{"id": i} for i in operation_id.removeprefix("op-ids-").split("-")]
+        else:
+            rows = [{"id": operation_id, "text": f"post for {operation_id}"}]
+        return {
+            "status": "success",
+            "results": rows,
+            "pagination": {"totalRows": 1, "totalPages": 1, "pageNumber": 1},
+        }
+
+    return FakeServer(_answer, status=status), release
+
+
+def _started(server: FakeServer) -> list[str]:
+    answers = [_answer(call.name, call.args) for call in server.tool_calls]
+    return [answer["operationId"] for answer in answers if "operationId" in answer]
+
+
+def test_submit_returns_before_operation_finishes() -> None:
+    server, release = _server()
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    ns = TwitterNamespace(server.call, timeout=10, poller=scheduler)
+    try:
+        handles = [ns.search_posts.submit(f"q{i}") for i in range(20)]
+        assert all(isinstance(h, OperationHandle) for h in handles)
+        assert not any(h.done() for h in handles)
+        assert len(_started(server)) == 20
+
+        release.set()
+        results = [h.result(timeout=10) for h in handles]
+    finally:
+        scheduler.close()
+
+    assert results[3].data[0].id == "op-q3"
+    assert isinstance(results[3].data[0], TwitterPost)
+    assert results[3].pagination.total_rows == 1
+    assert len(server.tool_calls) == 20
+
+
+def test_submit_completes_immediately_without_operation() -> None:
+    server, _ = _server()
+    ns = TwitterNamespace(server.call, timeout=10)
+    handle = ns.search_posts.submit("cached")
+    assert handle.done()
+    assert handle.result().data[0].id == "hit"
+
+
+def test_submit_starts_every_chunk_of_a_batch() -> None:
+    server, release = _server()
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    ns = TwitterNamespace(server.call, timeout=10, poller=scheduler, max_batch_size=2)
+    try:
+        handle = ns.get_posts_by_ids.submit(["a", "b", "inline", "c", "d"])
+        assert _started(server) == ["op-ids-a-b", "op-ids-d"]
+        assert not handle.done()
+
+        release.set()
+        posts = handle.result(timeout=10)
+    finally:
+        scheduler.close()
+
+    # The chunk answered straight away is replayed to itself, not to the
+    # chunk after it, and nothing is requested again.
+    assert [p.id for p in posts] == ["a", "b", "inline", "c", "d"]
+    assert len(server.tool_calls) == 3
+
+
+def test_result_timeout_and_cancel() -> None:
+    server, _ = _server()
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    ns = TwitterNamespace(server.call, timeout=10, poller=scheduler)
+    try:
+        handle = ns.search_posts.submit("slow")
+        with pytest.raises(TimeoutError):
+            handle.result(timeout=0.05)
+        with pytest.raises(TimeoutError):
+            handle.exception(timeout=0.05)
+        assert handle.cancel()
+        with pytest.raises(OperationCancelledError):
+            handle.result()
+    finally:
+        scheduler.close()
+
+
+def test_submit_without_a_poller_needs_a_client() -> None:
+    ns = TwitterNamespace(FakeServer(_answer).call, timeout=10)
+    with pytest.raises(RuntimeError, match="connected client"):
+        ns.search_posts.submit("slow")
+
+
+def test_sync_handle_is_awaitable() -> None:
+    server, release = _server()
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    ns = TwitterNamespace(server.call, timeout=10, poller=scheduler)
+
+    async def run() -> Any:
+        handle = ns.search_posts.submit("q")
+        release.set()
+        return await handle
+
+    try:
+        assert asyncio.run(run()).data[0].id == "op-q"
+    finally:
+        scheduler.close()
+
+
+def test_method_metadata_survives_wrapping() -> None:
+    ns = TwitterNamespace(FakeServer(_answer).call, timeout=10)
+    assert ns.search_posts.allowed_fields == TwitterNamespace.search_posts.allowed_fields
+    assert ns.search_posts.__name__ == "search_posts"
+    assert ns.search_posts is ns.search_posts
+    other = TwitterNamespace(FakeServer(_answer).call, timeout=10)
+    assert other.search_posts is not ns.search_posts
+
+
+def test_async_submit_and_await() -> None:
+    server, release = _server()
+
+    async def run() -> list[Any]:
+        async with AsyncPollScheduler(server.acall, strategy=FAST) as scheduler:
+            ns = AsyncTwitterNamespace(server.acall, timeout=10, poller=scheduler)
+            handles = [await ns.search_posts.submit(f"q{i}") for i in range(10)]
+            assert all(isinstance(h, AsyncOperationHandle) for h in handles)
+            assert not any(h.done() for h in handles)
+            release.set()
+            return await asyncio.gather(*(h.result(timeout=10) for h in handles))
+
+    results = asyncio.run(run())
+    assert [r.data[0].id for r in results] == [f"op-q{i}" for i in range(10)]
+
+
+def test_async_cancel() -> None:
+    server, _ = _server()
+
+    async def run() -> None:
+        async with AsyncPollScheduler(server.acall, strategy=FAST) as scheduler:
+            ns = AsyncTwitterNamespace(server.acall, timeout=10, poller=scheduler)
+            handle = await ns.search_posts.submit("q")
+            assert handle.cancel()
+            with pytest.raises(OperationCancelledError):
+                await handle
+            assert scheduler.pending_count == 0
+
+    asyncio.run(run())
+
+
+def test_async_submit_starts_every_chunk_of_a_batch() -> None:
+    server, release = _server()
+
+    async def run() -> Any:
+        async with AsyncPollScheduler(server.acall, strategy=FAST) as scheduler:
+            ns = AsyncTwitterNamespace(
+                server.acall, timeout=10, poller=scheduler, max_batch_size=2
+            )
+            handle = await ns.get_posts_by_ids.submit(["a", "b", "inline", "c", "d"])
+            assert _started(server) == ["op-ids-a-b", "op-ids-d"]
+            assert not handle.done()
+            release.set()
+            return await handle.result(timeout=10)
+
+    posts = asyncio.run(run())
+    assert [p.id for p in posts] == ["a", "b", "inline", "c", "d"]
+    assert len(server.tool_calls) == 3
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from xpoz._cursor import AsyncCursorResult, CursorResult
+from xpoz._pagination import AsyncPaginatedResult, PaginatedResult
+from xpoz.types.common import PaginationInfo
+
+
+class _Pages:
+    """Builds PaginatedResults whose page fetches take ``delay`` seconds."""
+
+    def __init__(self, total_pages: int, delay: float = 0.0, fail_on: int | None = None):
+        self.total_pages = total_pages
+        self.delay = delay
+        self.fail_on = fail_on
+        self.fetched: list[int] = []
+        self.lock = threading.Lock()
+
+    def page(self, number: int) -> PaginatedResult[int]:
+        return PaginatedResult(
+            data=[number * 10 + i for i in range(3)],
+            pagination=PaginationInfo(
+                table_name="t",
+                total_rows=self.total_pages * 3,
+                total_pages=self.total_pages,
+                page_number=number,
+                page_size=3,
+                results_count=3,
+            ),
+            table_name="t",
+            export_operation_id=None,
+            fetch_page=self.fetch,
+            fetch_export=None,
+        )
+
+    def fetch(self, number: int, table_name: str | None) -> PaginatedResult[int]:
+        assert table_name == "t"
+        with self.lock:
+            self.fetched.append(number)
+        time.sleep(self.delay)
+        if number == self.fail_on:
+            raise RuntimeError(f"page {number} failed")
+        return self.page(number)
+
+
+def test_iter_items_yields_every_page_in_order() -> None:
+    pages = _Pages(total_pages=5)
+    items = list(pages.page(1).iter_items())
+    assert items == [n * 10 + i for n in range(1, 6) for i in range(3)]
+    assert sorted(pages.fetched) == [2, 3, 4, 5]
+
+
+def test_prefetch_overlaps_fetching_with_consumption() -> None:
+    pages = _Pages(total_pages=6, delay=0.05)
+    started = time.monotonic()
+    for _ in pages.page(1).iter_pages(prefetch=3):
+        time.sleep(0.05)  # consumer work
+    elapsed = time.monotonic() - started
+    # Sequential fetch + consume would take 5 * 0.05 + 6 * 0.05 = 0.55 s.
+    assert elapsed < 0.45
+
+
+def test_prefetch_zero_fetches_on_demand() -> None:
+    pages = _Pages(total_pages=4)
+    iterator = pages.page(1).iter_pages(prefetch=0)
+    next(iterator)
+    next(iterator)
+    assert pages.fetched == [2]
+
+
+def test_early_break_stops_prefetching() -> None:
+    pages = _Pages(total_pages=50, delay=0.01)
+    for page in pages.page(1).iter_pages(prefetch=2):
+        if page.pagination.page_number == 3:
+            break
+    time.sleep(0.05)
+    assert max(pages.fetched) <= 5
+
+
+def test_errors_propagate_and_stop_iteration() -> None:
+    pages = _Pages(total_pages=10, fail_on=4)
+    seen: list[int] = []
+    with pytest.raises(RuntimeError, match="page 4"):
+        for page in pages.page(1).iter_pages(prefetch=2):
+            seen.append(page.pagination.page_number)
+    assert seen == [1, 2, 3]
+
+
+def test_single_page_result_needs_no_fetch() -> None:
+    pages = _Pages(total_pages=1)
+    assert list(pages.page(1).iter_items()) == [10, 11, 12]
+    assert pages.fetched == []
+
+
+class _AsyncPages:
+    """Async counterpart of ``_Pages``; also tracks the peak number of fetches in flight."""
+
+    def __init__(self, total_pages: int, delay: float = 0.0, fail_on: int | None = None):
+        self.total_pages = total_pages
+        self.delay = delay
+        self.fail_on = fail_on
+        self.fetched: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def page(self, number: int) -> AsyncPaginatedResult[int]:
+        return AsyncPaginatedResult(
+            data=[number * 10 + i for i in range(3)],
+            pagination=PaginationInfo(
+                table_name="t",
+                total_rows=self.total_pages * 3,
+                total_pages=self.total_pages,
+                page_number=number,
+                page_size=3,
+                results_count=3,
+            ),
+            table_name="t",
+            export_operation_id=None,
+            fetch_page=self.fetch,
+            fetch_export=None,
+        )
+
+    async def fetch(self, number: int, table_name: str | None) -> AsyncPaginatedResult[int]:
+        assert table_name == "t"
+        self.fetched.append(number)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if number == self.fail_on:
+            raise RuntimeError(f"page {number} failed")
+        return self.page(number)
+
+
+def test_async_iter_items_fetches_concurrently_in_order() -> None:
+    pages = _AsyncPages(total_pages=40, delay=0.02)
+
+    async def run() -> list[int]:
+        return [item async for item in pages.page(1).iter_items(concurrency=8)]
+
+    started = time.monotonic()
+    items = asyncio.run(run())
+    elapsed = time.monotonic() - started
+    assert items == [n * 10 + i for n in range(1, 41) for i in range(3)]
+    assert pages.peak == 8
+    # One page at a time would take 39 * 0.02 = 0.78 s.
+    assert elapsed < 0.4
+
+
+def test_async_fetch_pages_keeps_requested_order() -> None:
+    pages = _AsyncPages(total_pages=10, delay=0.01)
+
+    async def run() -> list[int]:
+        result = await pages.page(1).fetch_pages([7, 2, 9, 3], concurrency=2)
+        return [page.pagination.page_number for page in result]
+
+    assert asyncio.run(run()) == [7, 2, 9, 3]
+    assert pages.peak == 2
+
+
+def test_async_fetch_pages_rejects_out_of_range() -> None:
+    pages = _AsyncPages(total_pages=3)
+    with pytest.raises(ValueError, match="out of range"):
+        asyncio.run(pages.page(1).fetch_pages(range(1, 5)))
+    assert pages.fetched == []
+
+
+def test_async_iter_pages_fetches_each_batch_when_reached() -> None:
+    pages = _AsyncPages(total_pages=20, delay=0.01)
+
+    async def run() -> None:
+        async for page in pages.page(1).iter_pages(concurrency=4):
+            await asyncio.sleep(0.02)
+            assert pages.in_flight == 0  # nothing runs while a page is held
+            if page.pagination.page_number == 6:
+                break
+
+    asyncio.run(run())
+    assert sorted(pages.fetched) == [2, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_async_early_break_leaves_the_caller_running() -> None:
+    pages = _AsyncPages(total_pages=20, delay=0.01)
+
+    async def run() -> str:
+        async for _ in pages.page(1).iter_items(concurrency=4):
+            break
+        async for page in pages.page(1).iter_pages(concurrency=4):
+            if page.pagination.page_number == 2:
+                break
+        await asyncio.sleep(0.02)
+        return "done"
+
+    assert asyncio.run(run()) == "done"
+    assert pages.in_flight == 0
+
+
+def test_async_iter_pages_aclose() -> None:
+    pages = _AsyncPages(total_pages=20, delay=0.01)
+
+    async def run() -> None:
+        iterator = pages.page(1).iter_pages(concurrency=4)
+        await iterator.__anext__()
+        await iterator.__anext__()
+        await iterator.aclose()
+
+    asyncio.run(run())
+    assert sorted(pages.fetched) == [2, 3, 4, 5]
+    assert pages.in_flight == 0
+
+
+def test_async_stream_pages_keeps_a_sliding_window_in_flight() -> None:
+    pages = _AsyncPages(total_pages=50, delay=0.01)
+    started_while_held: list[list[int]] = []
+
+    async def run() -> None:
+        async with pages.page(1).stream_pages(concurrency=4) as stream:
+            async for page in stream:
+                await asyncio.sleep(0.02)
+                started_while_held.append(sorted(pages.fetched))
+                if page.pagination.page_number == 3:
+                    break
+        assert pages.in_flight == 0  # leaving the block cancelled the window
+
+    asyncio.run(run())
+    # Taking page 2 starts page 6, so the next fetches run while page 2 is held.
+    assert started_while_held[1] == [2, 3, 4, 5, 6]
+    assert pages.peak == 4
+    assert sorted(pages.fetched) == [2, 3, 4, 5, 6, 7]
+
+
+def test_async_slow_page_does_not_stall_the_window() -> None:
+    pages = _AsyncPages(total_pages=8, delay=0.01)
+    slow = pages.fetch
+
+    async def fetch(number: int, table_name: str | None) -> AsyncPaginatedResult[int]:
+        if number == 2:
+            await asyncio.sleep(0.1)
+        return await slow(number, table_name)
+
+    first = pages.page(1)
+    first._fetch_page = fetch
+
+    async def run() -> list[int]:
+        async with first.stream_pages(concurrency=3) as stream:
+            return [page.pagination.page_number async for page in stream]
+
+    assert asyncio.run(run()) == list(range(1, 9))
+    # While page 2 was slow, pages 3 and 4 were fetched and buffered in order.
+    assert pages.fetched[:2] == [3, 4]
+
+
+def test_async_errors_propagate_with_original_type() -> None:
+    pages = _AsyncPages(total_pages=10, delay=0.01, fail_on=4)
+    seen: list[int] = []
+
+    async def run() -> None:
+        async for page in pages.page(1).iter_pages(concurrency=2):
+            seen.append(page.pagination.page_number)
+
+    with pytest.raises(RuntimeError, match="page 4"):
+        asyncio.run(run())
+    assert seen == [1, 2, 3]
+
+
+def test_async_stream_pages_raises_errors_in_order() -> None:
+    pages = _AsyncPages(total_pages=10, delay=0.01, fail_on=4)
+    seen: list[int] = []
+
+    async def run() -> None:
+        async with pages.page(1).stream_pages(concurrency=3) as stream:
+            async for page in stream:
+                seen.append(page.pagination.page_number)
+
+    with pytest.raises(RuntimeError, match="page 4"):
+        asyncio.run(run())
+    assert seen == [1, 2, 3]
+    assert pages.in_flight == 0
+
+
+class _Cursors:
+    """Builds cursor results whose next-page fetches take ``delay`` seconds."""
+
+    def __init__(self, total_pages: int, delay: float = 0.0, fail_on: int | None = None):
+        self.total_pages = total_pages
+        self.delay = delay
+        self.fail_on = fail_on
+        self.fetched: list[int] = []
+        self.cancelled: list[int] = []
+
+    def page(self, number: int) -> CursorResult[int]:
+        more = number < self.total_pages
+        return CursorResult([number], more, str(number + 1) if more else None, self.fetch)
+
+    def fetch(self, cursor: str) -> CursorResult[int]:
+        number = int(cursor)
+        self.fetched.append(number)
+        time.sleep(self.delay)
+        if number == self.fail_on:
+            raise RuntimeError(f"page {number} failed")
+        return self.page(number)
+
+    def async_page(self, number: int) -> AsyncCursorResult[int]:
+        more = number < self.total_pages
+        return AsyncCursorResult([number], more, str(number + 1) if more else None, self.fetch_async)
+
+    async def fetch_async(self, cursor: str) -> AsyncCursorResult[int]:
+        number = int(cursor)
+        self.fetched.append(number)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(number)
+            raise
+        if number == self.fail_on:
+            raise RuntimeError(f"page {number} failed")
+        return self.async_page(number)
+
+
+def test_cursor_prefetch_overlaps_next_request_with_consumption() -> None:
+    cursors = _Cursors(total_pages=6, delay=0.05)
+    started = time.monotonic()
+    items = []
+    for item in cursors.page(1).iter_items(prefetch=True):
+        items.append(item)
+        time.sleep(0.05)  # consumer work
+    elapsed = time.monotonic() - started
+    assert items == [1, 2, 3, 4, 5, 6]
+    # Fetching only after each page is consumed would take 5 * 0.05 + 6 * 0.05 = 0.55 s.
+    assert elapsed < 0.45
+
+
+def test_cursor_prefetch_stays_one_page_ahead() -> None:
+    cursors = _Cursors(total_pages=10)
+    for page in cursors.page(1).iter_pages(prefetch=True):
+        if page.data == [3]:
+            break
+    time.sleep(0.02)
+    # Page 4 was requested when page 3 arrived; it may be dropped before it starts.
+    assert cursors.fetched in ([2, 3], [2, 3, 4])
+
+
+def test_cursor_prefetch_raises_errors_in_order() -> None:
+    cursors = _Cursors(total_pages=10, fail_on=3)
+    seen: list[int] = []
+    with pytest.raises(RuntimeError, match="page 3"):
+        for item in cursors.page(1).iter_items(prefetch=True):
+            seen.append(item)  # noqa: PERF402 - keeps the items seen before the error
+    assert seen == [1, 2]
+
+
+def test_cursor_fetches_on_demand_by_default() -> None:
+    cursors = _Cursors(total_pages=4)
+    iterator = cursors.page(1).iter_pages()
+    next(iterator)
+    assert cursors.fetched == []
+    for item in cursors.page(1).iter_items():
+        if item == 2:
+            break
+    time.sleep(0.02)
+    assert cursors.fetched == [2]
+
+
+def test_async_cursor_stream_overlaps_and_keeps_order() -> None:
+    cursors = _Cursors(total_pages=6, delay=0.05)
+
+    async def run() -> list[int]:
+        items = []
+        async with cursors.async_page(1).stream_pages() as pages:
+            async for page in pages:
+                items.extend(page.data)
+                await asyncio.sleep(0.05)
+        return items
+
+    started = time.monotonic()
+    assert asyncio.run(run()) == [1, 2, 3, 4, 5, 6]
+    assert time.monotonic() - started < 0.45
+
+
+def test_async_cursor_leaving_the_stream_cancels_the_prefetch() -> None:
+    cursors = _Cursors(total_pages=10, delay=0.5)
+
+    async def run() -> None:
+        async with cursors.async_page(1).stream_pages() as pages:
+            async for _ in pages:
+                await asyncio.sleep(0.01)  # let the prefetch start
+                break
+        assert cursors.cancelled == [2]
+
+    started = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - started < 0.4
+
+
+def test_async_cursor_stream_raises_errors_in_order() -> None:
+    cursors = _Cursors(total_pages=10, fail_on=3)
+    seen: list[int] = []
+
+    async def run() -> None:
+        async with cursors.async_page(1).stream_pages() as pages:
+            async for page in pages:
+                seen.extend(page.data)
+
+    with pytest.raises(RuntimeError, match="page 3"):
+        asyncio.run(run())
+    assert seen == [1, 2]
+
+
+def test_async_cursor_fetches_on_demand() -> None:
+    cursors = _Cursors(total_pages=4)
+
+    async def run() -> None:
+        async for item in cursors.async_page(1).iter_items():
+            if item == 2:
+                break
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert cursors.fetched == [2]
+
+
+def test_async_cursor_early_break_leaves_the_caller_running() -> None:
+    cursors = _Cursors(total_pages=10, delay=0.01)
+
+    async def run() -> str:
+        async for _ in cursors.async_page(1).iter_items():
+            break
+        async with cursors.async_page(1).stream_pages() as pages:
+            async for _ in pages:
+                break
+        iterator = cursors.async_page(1).iter_pages()
+        await iterator.__anext__()
+        await iterator.__anext__()
+        await iterator.aclose()
+        await asyncio.sleep(0.02)
+        return "done"
+
+    assert asyncio.run(run()) == "done"
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from xpoz import ParquetSink
+from xpoz._cursor import AsyncCursorResult
+from xpoz._export import iter_csv_rows
+from xpoz._pagination import PaginatedResult
+from xpoz.types.common import PaginationInfo
+from xpoz.types.twitter import TwitterPost
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+DATES = ["2024-01-01", "2024-01-02"]
+
+
+def _rows(page: int, size: int = 4) -> list[dict[str, Any]]:
+    rows = []
+    for i in range(size):
+        row: dict[str, Any] = {"id": f"{page}-{i}", "created_at_date": DATES[i % 2]}
+        # Pages were fetched with different fields= projections.
+        if page % 2:
+            row["text"] = f"post {page}-{i}"
+        else:
+            row["like_count"] = i
+        rows.append(row)
+    return rows
+
+
+def _pages(total: int, size: int = 4) -> PaginatedResult[TwitterPost]:
+    def page(n: int) -> PaginatedResult[TwitterPost]:
+        return PaginatedResult(
+            data=None,
+            pagination=PaginationInfo(
+                table_name="t", total_rows=total * size, total_pages=total, page_number=n,
+                page_size=size, results_count=size,
+            ),
+            table_name="t",
+            export_operation_id=None,
+            fetch_page=lambda number, table: page(number),
+            fetch_export=None,
+            model=TwitterPost,
+            rows=_rows(n, size),
+        )
+
+    return page(1)
+
+
+def _files(root: Path) -> list[str]:
+    return sorted(str(p.relative_to(root)) for p in root.rglob("*") if p.is_file())
+
+
+def test_partitions_by_column_with_static_partitions(tmp_path: Path) -> None:
+    with ParquetSink(
+        tmp_path,
+        TwitterPost,
+        partition_by="created_at_date",
+        static_partitions={"platform": "twitter"},
+    ) as sink:
+        assert sink.write(_pages(3)) == 12
+    assert _files(tmp_path) == [
+        f"platform=twitter/created_at_date={date}/part-0.parquet" for date in DATES
+    ]
+    table = pq.read_table(tmp_path / "platform=twitter" / f"created_at_date={DATES[0]}")
+    assert sorted(table.column("id").to_pylist()) == ["1-0", "1-2", "2-0", "2-2", "3-0", "3-2"]
+
+
+def test_every_file_has_the_same_schema_across_projections(tmp_path: Path) -> None:
+    with ParquetSink(tmp_path, TwitterPost, partition_by="created_at_date") as sink:
+        sink.write(_pages(2))
+    schemas = [pq.read_schema(path) for path in sink.files]
+    assert all(schema.equals(sink.schema) for schema in schemas)
+    assert "created_at_date" not in sink.schema.names
+    table = pq.read_table(sink.files[0])
+    assert table.column("text").null_count == 2 and table.column("like_count").null_count == 2
+
+
+def test_row_groups_are_flushed_at_the_size_threshold(tmp_path: Path) -> None:
+    with ParquetSink(tmp_path, TwitterPost, columns=["id", "text"], row_group_bytes=1) as sink:
+        sink.write(_pages(3))
+        visible = [p for p in tmp_path.rglob("*.parquet") if not p.name.startswith(".")]
+        assert visible == []  # files only appear once complete
+    assert pq.ParquetFile(sink.files[0]).num_row_groups == 3
+    assert sink.rows_written == 12
+
+
+def test_buffer_limit_flushes_the_largest_partition(tmp_path: Path) -> None:
+    sink = ParquetSink(
+        tmp_path, TwitterPost, columns=["id", "created_at_date"],
+        partition_by="created_at_date", max_buffered_bytes=1,
+    )
+    sink.write(_pages(1))
+    assert sink.rows_written == 4
+    sink.close()
+
+
+def test_open_file_limit_starts_new_files(tmp_path: Path) -> None:
+    with ParquetSink(
+        tmp_path, TwitterPost, columns=["id", "created_at_date"],
+        partition_by="created_at_date", row_group_bytes=1, max_open_files=1,
+    ) as sink:
+        sink.write(_pages(2))
+    first_day = sorted(p.name for p in (tmp_path / f"created_at_date={DATES[0]}").iterdir())
+    assert len(first_day) > 1
+    total = sum(pq.read_metadata(path).num_rows for path in sink.files)
+    assert total == 8
+
+
+def test_error_in_block_discards_open_files(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError), ParquetSink(tmp_path, TwitterPost, row_group_bytes=1) as sink:
+        sink.write(_pages(1))
+        assert _files(tmp_path) == [".part-0.parquet"]
+        raise RuntimeError("boom")
+    assert _files(tmp_path) == []
+    assert sink.files == []
+
+
+def test_csv_export_rows_are_written(tmp_path: Path) -> None:
+    csv = b"id,likeCount,createdAtDate\n1,5,2024-01-01\n2,,2024-01-02\n"
+    with ParquetSink(tmp_path, TwitterPost, columns=["id", "like_count"]) as sink:
+        assert sink.write(iter_csv_rows([csv])) == 2
+    assert pq.read_table(sink.files[0]).to_pylist() == [
+        {"id": "1", "like_count": 5},
+        {"id": "2", "like_count": None},
+    ]
+
+
+def test_async_results(tmp_path: Path) -> None:
+    async def fetch(cursor: str) -> AsyncCursorResult[TwitterPost]:
+        return AsyncCursorResult(None, False, None, fetch, model=TwitterPost, rows=_rows(2))
+
+    async def run() -> int:
+        first = AsyncCursorResult(None, True, "2", fetch, model=TwitterPost, rows=_rows(1))
+        with ParquetSink(tmp_path, TwitterPost, partition_by="created_at_date") as sink:
+            return await sink.awrite(first)
+
+    assert asyncio.run(run()) == 8
+    assert len(_files(tmp_path)) == 2
+
+
+def test_partition_column_must_be_written(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="created_at_date"):
+        ParquetSink(tmp_path, TwitterPost, columns=["id"], partition_by="created_at_date")
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Awaitable, Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import pytest
 
-from xpoz._exceptions import OperationCancelledError, OperationFailedError
-from xpoz._mcp._polling import wait_for_result, wait_for_result_sync
+from xpoz._exceptions import (
+    OperationCancelledError,
+    OperationFailedError,
+    OperationTimeoutError,
+)
+from xpoz._mcp import _polling
+from xpoz._mcp._polling import PollingStrategy, wait_for_result, wait_for_result_sync
 from xpoz.namespaces._base import AsyncBaseNamespace, BaseNamespace
 
 
@@ -110,3 +116,62 @@ def test_async_call_and_maybe_poll_raises_on_sync_error() -> None:
         assert exc.value.error == "Auth failed"
 
     asyncio.run(run())
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_polling_strategy_grows_to_cap() -> None:
+    strategy = PollingStrategy(initial_interval=0.5, multiplier=2, max_interval=3)
+    delays = [strategy.next_delay(n, elapsed=0, timeout=100) for n in range(1, 6)]
+    assert delays == [0.5, 1, 2, 3, 3]
+
+
+def test_polling_strategy_never_sleeps_past_deadline() -> None:
+    strategy = PollingStrategy(initial_interval=4)
+    assert strategy.next_delay(1, elapsed=9, timeout=10) == 1
+    assert strategy.next_delay(1, elapsed=10, timeout=10) == 0
+
+
+def test_polling_strategy_honors_eta_hint() -> None:
+    strategy = PollingStrategy(initial_interval=0.25, max_hinted_interval=20)
+    assert strategy.next_delay(6, 0, 100, {"status": "running", "etaSeconds": 0.1}) == 0.25
+    assert strategy.next_delay(1, 0, 100, {"status": "running", "etaSeconds": 12}) == 12
+    assert strategy.next_delay(1, 0, 100, {"status": "running", "eta": 90}) == 20
+
+
+def test_polling_strategy_derives_eta_from_progress() -> None:
+    strategy = PollingStrategy(initial_interval=0.25)
+    assert strategy.next_delay(1, 4, 100, {"progress": 0.5}) == 4
+    assert strategy.next_delay(1, 4, 100, {"progress": 80}) == pytest.approx(1)
+
+
+def test_polling_sync_times_out_exactly_at_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(_polling, "time", clock)
+    mock = lambda _name, _args: {"status": "running"}
+    with pytest.raises(OperationTimeoutError):
+        wait_for_result_sync(mock, "op_abc", timeout=10, strategy=PollingStrategy())
+    assert clock.now == 10
+    assert clock.sleeps[:3] == [0.25, 0.5, 1]
+
+
+def test_polling_sync_resolves_short_operations_quickly(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(_polling, "time", clock)
+
+    def mock(_name: str, _args: dict[str, Any]) -> dict[str, Any]:
+        return {"status": "success" if clock.now >= 0.4 else "running"}
+
+    wait_for_result_sync(mock, "op_abc", timeout=10)
+    assert clock.now == 0.75
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from xpoz._transform._response_parser import _split_toon_row, parse_response_text
+
+
+def test_table_rows_with_quoted_cells() -> None:
+    text = (
+        "success: true\n"
+        "data[3]{id,text,likeCount,lang}:\n"
+        '  1,"hello, \\"world\\"",5,en\n'
+        "  2,plain,9007199254740993,null\n"
+        "  3,short\n"
+        "totalRows: 3"
+    )
+    assert parse_response_text(text) == {
+        "results": [
+            {"id": "1", "text": 'hello, \\"world\\"', "likeCount": 5, "lang": "en"},
+            {"id": "2", "text": "plain", "likeCount": "9007199254740993", "lang": None},
+            {"id": "3", "text": "short", "likeCount": None, "lang": None},
+        ],
+        "totalRows": 3,
+    }
+
+
+def test_header_count_is_only_a_hint() -> None:
+    fewer = parse_response_text("data[5]{a}:\n  1\n  2")
+    more = parse_response_text("data[1]{a}:\n  1\n  2\n  3")
+    assert fewer["results"] == [{"a": 1}, {"a": 2}]
+    assert more["results"] == [{"a": 1}, {"a": 2}, {"a": 3}]
+    huge = parse_response_text("data[1000000000000]{a}:\n  1")
+    assert huge["results"] == [{"a": 1}]
+
+
+def test_rows_stop_at_a_blank_line_and_the_section_is_skipped() -> None:
+    text = "data[2]{a}:\n  1\n\n  2\ncount: 4"
+    assert parse_response_text(text) == {"results": [{"a": 1}], "count": 4}
+
+
+def test_yaml_list_and_nested_data_block() -> None:
+    listed = "data[2]:\n  - id: 1\n    name: a\n  - id: 2\ntotal: 2"
+    assert parse_response_text(listed) == {
+        "results": [{"id": 1, "name": "a"}, {"id": 2}],
+        "total": 2,
+    }
+    block = (
+        "data:\n"
+        "  results[1]{id,score}:\n"
+        "    7,1.5\n"
+        "  meta:\n"
+        "    page: 2\n"
+        "  items[1]:\n"
+        "    - k: v\n"
+        "  empty:"
+    )
+    assert parse_response_text(block) == {
+        "results": [{"id": "7", "score": 1.5}],
+        "meta": {"page": 2},
+        "items": [{"k": "v"}],
+        "empty": None,
+    }
+
+
+def test_flat_operation_and_json_payloads() -> None:
+    assert parse_response_text("operationId: op_1\nstatus: running") == {
+        "operationId": "op_1",
+        "status": "running",
+    }
+    assert parse_response_text('{"results": []}') == {"results": []}
+    assert parse_response_text("   ") == {}
+
+
+def test_columns_are_coerced_by_their_model_type() -> None:
+    text = (
+        "data[2]{id,text,possiblySensitive,likeCount,videoDuration,unknownColumn}:\n"
+        "  123,true,false,7,2,42\n"
+        "  124,1.5,maybe,n/a,,null"
+    )
+    rows = parse_response_text(text)["results"]
+    assert isinstance(rows[0]["videoDuration"], float)
+    assert rows == [
+        {
+            "id": "123",
+            "text": "true",
+            "possiblySensitive": False,
+            "likeCount": 7,
+            "videoDuration": 2.0,
+            "unknownColumn": 42,
+        },
+        {
+            "id": "124",
+            "text": "1.5",
+            "possiblySensitive": "maybe",
+            "likeCount": "n/a",
+            "videoDuration": None,
+            "unknownColumn": None,
+        },
+    ]
+
+
+def test_split_toon_row() -> None:
+    assert _split_toon_row("a, b ,c") == ["a", "b", "c"]
+    assert _split_toon_row('"x,y",z,') == ['"x,y"', "z", ""]
+    assert _split_toon_row('"a\\",b",c') == ['"a\\",b"', "c"]
+    assert _split_toon_row('"open, never closed') == ['"open, never closed']
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+from xpoz import CircuitOpenError, RetryPolicy
+from xpoz._config import _tools
+from xpoz._exceptions import XpozError
+from xpoz._rest import AsyncRestTransport, RestTransport
+from xpoz._retry import _parse_retry_after, acall_with_retry, call_with_retry, is_idempotent
+
+NO_WAIT = RetryPolicy(initial_backoff=0, jitter=False)
+
+
+class _Flaky:
+    def __init__(self, failures: list[BaseException], value: Any = "ok"):
+        self.failures = list(failures)
+        self.value = value
+        self.calls = 0
+
+    def __call__(self) -> Any:
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return self.value
+
+
+def test_backoff_grows_exponentially_up_to_cap() -> None:
+    policy = RetryPolicy(initial_backoff=1, multiplier=2, max_backoff=5, jitter=False)
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_backoff_jitter_stays_within_bound() -> None:
+    policy = RetryPolicy(initial_backoff=1, multiplier=2)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(50))
+
+
+def test_backoff_honors_retry_after_within_cap() -> None:
+    policy = RetryPolicy(max_backoff=10)
+    assert policy.backoff(1, retry_after=7) == 7
+    assert policy.backoff(1, retry_after=60) is None
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    assert _parse_retry_after("3") == 3
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def test_retries_transient_errors_until_success() -> None:
+    fn = _Flaky([httpx.ReadError("reset"), httpx.RemoteProtocolError("eof")])
+    assert call_with_retry(NO_WAIT, NO_WAIT.breaker("mcp"), fn) == "ok"
+    assert fn.calls == 3
+
+
+def test_gives_up_after_max_attempts() -> None:
+    policy = RetryPolicy(max_attempts=2, initial_backoff=0, jitter=False)
+    fn = _Flaky([httpx.ReadError("reset")] * 5)
+    with pytest.raises(httpx.ReadError):
+        call_with_retry(policy, policy.breaker("mcp"), fn)
+    assert fn.calls == 2
+
+
+def test_does_not_retry_tool_errors() -> None:
+    fn = _Flaky([RuntimeError("MCP tool error (getTwitterUser): bad input")])
+    with pytest.raises(RuntimeError):
+        call_with_retry(NO_WAIT, NO_WAIT.breaker("mcp"), fn)
+    assert fn.calls == 1
+
+
+def test_non_idempotent_calls_only_retry_unsent_requests() -> None:
+    assert not is_idempotent(_tools.ADD_TRACKED_ITEMS)
+    assert is_idempotent("checkOperationStatus")
+
+    sent = _Flaky([httpx.ReadError("reset")])
+    with pytest.raises(httpx.ReadError):
+        call_with_retry(NO_WAIT, NO_WAIT.breaker("mcp"), sent, idempotent=False)
+
+    unsent = _Flaky([httpx.ConnectError("refused")])
+    assert call_with_retry(NO_WAIT, NO_WAIT.breaker("mcp"), unsent, idempotent=False) == "ok"
+
+
+def test_circuit_opens_after_threshold_and_fails_fast() -> None:
+    policy = RetryPolicy(max_attempts=1, failure_threshold=2, recovery_timeout=60)
+    breaker = policy.breaker("https://mcp.example")
+    for _ in range(2):
+        with pytest.raises(httpx.ReadError):
+            call_with_retry(policy, breaker, _Flaky([httpx.ReadError("reset")]))
+
+    fn = _Flaky([])
+    with pytest.raises(CircuitOpenError) as exc:
+        call_with_retry(policy, breaker, fn)
+    assert exc.value.endpoint == "https://mcp.example"
+    assert fn.calls == 0
+
+
+def test_circuit_half_opens_after_recovery_timeout() -> None:
+    policy = RetryPolicy(max_attempts=1, failure_threshold=1, recovery_timeout=0)
+    breaker = policy.breaker("mcp")
+    with pytest.raises(httpx.ReadError):
+        call_with_retry(policy, breaker, _Flaky([httpx.ReadError("reset")]))
+    assert breaker.is_open
+
+    assert call_with_retry(policy, breaker, _Flaky([])) == "ok"
+    assert not breaker.is_open
+
+
+def test_async_retry() -> None:
+    fn = _Flaky([httpx.ReadError("reset")])
+
+    async def call() -> Any:
+        return fn()
+
+    assert asyncio.run(acall_with_retry(NO_WAIT, NO_WAIT.breaker("mcp"), call)) == "ok"
+    assert fn.calls == 2
+
+
+_RESPONSES: list[tuple[int, dict[str, str]]] = []
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        status, headers = _RESPONSES.pop(0) if _RESPONSES else (200, {})
+        body = json.dumps({"results": [], "has_more": False, "status": status}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_rest_transport_retries_503_with_retry_after(base_url) -> None:
+    _RESPONSES[:] = [(503, {"Retry-After": "0"}), (502, {})]
+    transport = RestTransport(base_url, "key", retry=NO_WAIT)
+    try:
+        assert transport.get("/x", {})["status"] == 200
+    finally:
+        transport.close()
+    assert _RESPONSES == []
+
+
+def test_rest_transport_raises_after_exhausting_retries(base_url) -> None:
+    _RESPONSES[:] = [(503, {})] * 2
+    transport = RestTransport(
+        base_url, "key", retry=RetryPolicy(max_attempts=2, initial_backoff=0)
+    )
+    try:
+        with pytest.raises(XpozError, match="HTTP 503"):
+            transport.get("/x", {})
+    finally:
+        transport.close()
+
+
+def test_async_rest_transport_retries(base_url) -> None:
+    _RESPONSES[:] = [(429, {"Retry-After": "0"})]
+
+    async def run() -> dict[str, Any]:
+        transport = AsyncRestTransport(base_url, "key", retry=NO_WAIT)
+        try:
+            return await transport.get("/x", {})
+        finally:
+            await transport.close()
+
+    assert asyncio.run(run())["status"] == 200
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pydantic
+import pytest
+
+from xpoz._rows import _list_adapter, validate_rows
+from xpoz.types.reddit import RedditComment
+from xpoz.types.twitter import TwitterPost
+
+
+def test_validate_rows_matches_per_row_validation() -> None:
+    rows = [
+        {"id": "1", "like_count": "3", "hashtags": ["ai"], "unknown_extra": 1},
+        {"id": "2", "possibly_sensitive": "false"},
+        {},
+    ]
+    assert validate_rows(TwitterPost, rows) == [TwitterPost.model_validate(row) for row in rows]
+    assert validate_rows(TwitterPost, []) == []
+
+
+def test_adapters_are_cached_per_model() -> None:
+    assert _list_adapter(TwitterPost) is _list_adapter(TwitterPost)
+    assert _list_adapter(TwitterPost) is not _list_adapter(RedditComment)
+
+
+def test_invalid_rows_report_their_position() -> None:
+    with pytest.raises(pydantic.ValidationError) as info:
+        validate_rows(TwitterPost, [{"id": "1"}, {"like_count": "many"}])
+    assert info.value.errors()[0]["loc"] == (1, "like_count")
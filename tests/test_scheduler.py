@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from xpoz._exceptions import OperationFailedError, OperationTimeoutError
+from xpoz._mcp._polling import PollingStrategy
+from xpoz._mcp._scheduler import AsyncPollScheduler, PollScheduler, _TokenBucket
+from xpoz.namespaces._base import AsyncBaseNamespace, BaseNamespace
+
+from .fakes import FakeServer, finished
+
+FAST = PollingStrategy(initial_interval=0.01, multiplier=1)
+
+
+def _server(polls_needed: dict[str, int]) -> FakeServer:
+    """Operations finish after a set number of status checks."""
+
+    def status(op_id: str) -> dict[str, Any]:
+        polls_needed[op_id] -= 1
+        if op_id.startswith("bad"):
+            return {"status": "error", "error": "crawler failed"}
+        if polls_needed[op_id] <= 0:
+            return finished(op_id)
+        return {"status": "running"}
+
+    return FakeServer(lambda _name, args: {"operationId": args["op"]}, status=status)
+
+
+def test_token_bucket_caps_grants() -> None:
+    bucket = _TokenBucket(rate=10)
+    assert bucket.take(0.0, 25) == 10
+    assert bucket.take(0.0, 5) == 0
+    assert bucket.take(0.5, 10) == 5
+
+
+def test_sync_scheduler_resolves_many_operations() -> None:
+    polls = {f"op{i}": 3 for i in range(50)}
+    server = _server(polls)
+    scheduler = PollScheduler(server.call, strategy=FAST, max_qps=1000)
+    try:
+        futures = {op: scheduler.submit(op, timeout=10) for op in polls}
+        results = {op: f.result(timeout=10) for op, f in futures.items()}
+    finally:
+        scheduler.close()
+
+    assert results["op7"]["results"] == [{"id": "op7"}]
+    assert len(server.status_checks) == 150
+    assert scheduler.pending_count == 0
+
+
+def test_sync_scheduler_shares_duplicate_registrations() -> None:
+    server = _server({"op": 2})
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    try:
+        first = scheduler.submit("op", timeout=10)
+        second = scheduler.submit("op", timeout=10)
+        first.cancel()
+        assert second.result(timeout=10)["status"] == "success"
+    finally:
+        scheduler.close()
+    assert len(server.status_checks) == 2
+
+
+def test_sync_scheduler_caps_poll_rate() -> None:
+    polls = {f"op{i}": 2 for i in range(30)}
+    server = _server(polls)
+    scheduler = PollScheduler(server.call, strategy=FAST, max_qps=20)
+    try:
+        for f in [scheduler.submit(op, timeout=10) for op in polls]:
+            f.result(timeout=10)
+    finally:
+        scheduler.close()
+
+    times = sorted(call.at for call in server.status_checks)
+    span = times[-1] - times[0]
+    # 60 checks with a burst of 20 then 20/s need at least ~2 s.
+    assert span >= 1.8
+
+
+def test_sync_scheduler_propagates_failures_and_timeouts() -> None:
+    server = _server({"bad": 1, "slow": 10_000})
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    try:
+        with pytest.raises(OperationFailedError):
+            scheduler.wait("bad", timeout=10)
+        with pytest.raises(OperationTimeoutError):
+            scheduler.wait("slow", timeout=0.1)
+    finally:
+        scheduler.close()
+
+
+def test_namespace_waits_through_scheduler() -> None:
+    server = _server({"op_x": 2})
+    scheduler = PollScheduler(server.call, strategy=FAST)
+    ns = BaseNamespace(server.call, timeout=10, poller=scheduler)
+    try:
+        result = ns._call_and_maybe_poll("getTwitterPostsByKeywords", {"op": "op_x"})
+    finally:
+        scheduler.close()
+    assert result["results"] == [{"id": "op_x"}]
+
+
+def test_async_scheduler_resolves_many_operations() -> None:
+    polls = {f"op{i}": 3 for i in range(50)}
+    server = _server(polls)
+
+    async def run() -> list[dict[str, Any]]:
+        async with AsyncPollScheduler(server.acall, strategy=FAST, max_qps=1000) as scheduler:
+            return await asyncio.gather(*(scheduler.wait(op, timeout=10) for op in polls))
+
+    results = asyncio.run(run())
+    assert [r["results"][0]["id"] for r in results] == [f"op{i}" for i in range(50)]
+    assert len(server.status_checks) == 150
+
+
+def test_async_scheduler_failures_and_timeouts() -> None:
+    server = _server({"bad": 1, "slow": 10_000})
+
+    async def run() -> None:
+        async with AsyncPollScheduler(server.acall, strategy=FAST) as scheduler:
+            with pytest.raises(OperationFailedError):
+                await scheduler.wait("bad", timeout=10)
+            with pytest.raises(OperationTimeoutError):
+                await scheduler.wait("slow", timeout=0.1)
+
+    asyncio.run(run())
+
+
+def test_async_namespace_waits_through_scheduler() -> None:
+    server = _server({"op_x": 2})
+
+    async def run() -> dict[str, Any]:
+        async with AsyncPollScheduler(server.acall, strategy=FAST) as scheduler:
+            ns = AsyncBaseNamespace(server.acall, timeout=10, poller=scheduler)
+            return await ns._call_and_maybe_poll("getTwitterPostsByKeywords", {"op": "op_x"})
+
+    assert asyncio.run(run())["results"] == [{"id": "op_x"}]
+
+
+def test_async_scheduler_requires_start() -> None:
+    server = _server({"op": 1})
+    scheduler = AsyncPollScheduler(server.acall)
+
+    async def run() -> None:
+        with pytest.raises(RuntimeError):
+            await scheduler.wait("op", timeout=10)
+
+    asyncio.run(run())
+
+
+def test_async_scheduler_closes_from_another_task() -> None:
+    server = _server({"op": 1, "slow": 10_000})
+
+    async def run() -> None:
+        scheduler = AsyncPollScheduler(server.acall, strategy=FAST)
+        await asyncio.wait_for(scheduler.start(), timeout=1)
+        assert (await scheduler.wait("op", timeout=10))["results"] == [{"id": "op"}]
+        waiter = asyncio.create_task(scheduler.wait("slow", timeout=10))
+        await asyncio.sleep(0.02)
+        await asyncio.create_task(scheduler.aclose())
+        with pytest.raises(RuntimeError, match="closed"):
+            await waiter
+        await asyncio.sleep(0.02)  # the caller was not cancelled
+
+    asyncio.run(run())
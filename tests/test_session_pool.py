@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+import anyio
+import pytest
+from anyio.from_thread import start_blocking_portal
+
+from xpoz import RetryPolicy
+from xpoz._mcp._transport import SyncTransport, _pick_session, _PooledSession
+
+
+class _FakeSession:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[str] = []
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        self.calls.append(name)
+        await anyio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionResetError("stream reset")
+        return SimpleNamespace(
+            is_error=False,
+            content=[SimpleNamespace(text="id: 1")],
+        )
+
+
+def _slots(*sessions: Any) -> list[_PooledSession]:
+    return [_PooledSession(i, s) for i, s in enumerate(sessions)]
+
+
+def test_pick_session_prefers_least_loaded() -> None:
+    slots = _slots(_FakeSession(), _FakeSession(), _FakeSession())
+    slots[0].in_flight = 2
+    slots[1].in_flight = 1
+    slots[2].in_flight = 3
+    assert _pick_session(slots) is slots[1]
+
+
+def test_pick_session_skips_unhealthy_sessions() -> None:
+    slots = _slots(_FakeSession(), _FakeSession())
+    for _ in range(3):
+        slots[0].record_failure()
+    slots[1].in_flight = 5
+    assert not slots[0].healthy
+    assert _pick_session(slots) is slots[1]
+
+
+def test_session_recovers_after_success() -> None:
+    slot = _slots(_FakeSession())[0]
+    for _ in range(3):
+        slot.record_failure()
+    slot.record_success()
+    assert slot.healthy
+
+
+def test_pool_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        SyncTransport("http://example.invalid", "fake-key", pool_size=0)
+
+
+def _attach(transport: SyncTransport, sessions: list[_FakeSession]) -> Any:
+    portal_cm = start_blocking_portal()
+    transport._portal = portal_cm.__enter__()
+    transport._sessions = _slots(*sessions)
+    return portal_cm
+
+
+def test_call_tool_spreads_concurrent_calls_across_sessions() -> None:
+    sessions = [_FakeSession(delay=0.05) for _ in range(4)]
+    transport = SyncTransport("http://example.invalid", "fake-key", pool_size=4)
+    portal_cm = _attach(transport, sessions)
+    try:
+        barrier = threading.Barrier(8)
+
+        def worker(_: int) -> dict[str, Any]:
+            barrier.wait()
+            return transport.call_tool("getTwitterUser", {})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(worker, range(8)))
+    finally:
+        portal_cm.__exit__(None, None, None)
+
+    assert results == [{"id": 1}] * 8
+    assert [len(s.calls) for s in sessions] == [2, 2, 2, 2]
+    assert all(slot.in_flight == 0 for slot in transport._sessions)
+
+
+def test_call_tool_tracks_failures_per_session() -> None:
+    broken, working = _FakeSession(fail=True), _FakeSession()
+    transport = SyncTransport(
+        "http://example.invalid",
+        "fake-key",
+        pool_size=2,
+        retry=RetryPolicy(max_attempts=1),
+    )
+    portal_cm = _attach(transport, [broken, working])
+    try:
+        for _ in range(3):
+            with pytest.raises(ConnectionResetError):
+                transport.call_tool("getTwitterUser", {})
+            transport._sessions[1].calls = 99
+        status = transport.pool_status()
+        transport.call_tool("getTwitterUser", {})
+    finally:
+        portal_cm.__exit__(None, None, None)
+
+    assert status[0]["healthy"] is False
+    assert status[0]["consecutive_failures"] == 3
+    assert working.calls == ["getTwitterUser"]
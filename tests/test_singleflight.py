@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from xpoz._exceptions import OperationFailedError
+from xpoz._mcp._polling import PollingStrategy
+from xpoz._singleflight import AsyncSingleFlight, SingleFlight
+from xpoz.namespaces.twitter import AsyncTwitterNamespace, TwitterNamespace
+
+from .fakes import FakeServer, found
+
+FAST = PollingStrategy(initial_interval=0.01, multiplier=1)
+
+
+def _server(fail: bool = False) -> FakeServer:
+    """Every call starts ``op-1``, which finishes on the third status check."""
+    checks = 0
+
+    def status(_operation_id: str) -> dict[str, Any]:
+        nonlocal checks
+        checks += 1
+        if fail:
+            return {"status": "error", "error": "crawler failed"}
+        if checks < 3:
+            return {"status": "running"}
+        return found([{"id": "1", "username": "x"}])
+
+    return FakeServer(lambda _name, _args: {"operationId": "op-1"}, status=status, latency=0.02)
+
+
+def test_concurrent_identical_calls_share_one_request() -> None:
+    server = _server()
+    ns = TwitterNamespace(server.call, 10, polling=FAST, singleflight=SingleFlight())
+    barrier = threading.Barrier(20)
+
+    def worker(_: int) -> Any:
+        barrier.wait()
+        return ns.get_user("x")
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        users = list(pool.map(worker, range(20)))
+
+    assert {u.username for u in users} == {"x"}
+    assert len(server.tool_calls) == 1
+    assert len(server.status_checks) == 3
+
+
+def test_followers_receive_the_leaders_exception() -> None:
+    server = _server(fail=True)
+    ns = TwitterNamespace(server.call, 10, polling=FAST, singleflight=SingleFlight())
+    barrier = threading.Barrier(5)
+
+    def worker(_: int) -> BaseException | None:
+        barrier.wait()
+        try:
+            ns.get_user("x")
+        except OperationFailedError as exc:
+            return exc
+        return None
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        errors = list(pool.map(worker, range(5)))
+    assert all(isinstance(e, OperationFailedError) for e in errors)
+    assert len(server.tool_calls) == 1
+
+
+def test_different_arguments_are_not_coalesced() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.in_flight() == 0
+
+
+def test_async_concurrent_identical_calls_share_one_request() -> None:
+    server = _server()
+
+    async def run() -> list[Any]:
+        ns = AsyncTwitterNamespace(
+            server.acall, 10, polling=FAST, singleflight=AsyncSingleFlight()
+        )
+        return await asyncio.gather(*(ns.get_user("x") for _ in range(20)))
+
+    users = asyncio.run(run())
+    assert len(users) == 20
+    assert len(server.tool_calls) == 1
+
+
+def test_async_follower_takes_over_when_leader_is_cancelled() -> None:
+    flight: AsyncSingleFlight[str] = AsyncSingleFlight()
+    calls = 0
+
+    async def slow() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run() -> str:
+        leader = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "done"
+    assert calls == 2
+
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from xpoz._mcp._transport import _parse_tool_result
+
+
+def _text(text: str) -> TextContent:
+    return TextContent(type="text", text=text)
+
+
+def test_structured_content_is_used_as_is() -> None:
+    result = CallToolResult(
+        content=[_text("ignored: 1")],
+        structured_content={"results": [{"id": "1"}], "pagination": {"totalRows": 1}},
+    )
+    assert _parse_tool_result("t", result) == {
+        "results": [{"id": "1"}],
+        "pagination": {"totalRows": 1},
+    }
+
+
+def test_text_blocks_are_joined_and_parsed_without_structured_content() -> None:
+    result = CallToolResult(content=[_text("data[1]{id,likeCount}:\n"), _text("  7,3\nok: true")])
+    assert _parse_tool_result("t", result) == {
+        "results": [{"id": "7", "likeCount": 3}],
+        "ok": True,
+    }
+    legacy = SimpleNamespace(isError=False, structuredContent=None, content=[_text('{"a": 1}')])
+    assert _parse_tool_result("t", legacy) == {"a": 1}
+
+
+def test_error_results_raise_with_their_text() -> None:
+    result = CallToolResult(
+        content=[_text("bad "), _text("input")], structured_content={"x": 1}, is_error=True
+    )
+    with pytest.raises(RuntimeError, match="MCP tool error \\(t\\): bad input"):
+        _parse_tool_result("t", result)
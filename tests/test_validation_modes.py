@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from xpoz._rows import check_validation, parse_rows
+from xpoz.namespaces.twitter import TwitterNamespace
+from xpoz.types.twitter import TwitterPost, TwitterUser
+
+
+def _call(name: str, args: dict[str, Any]) -> dict[str, Any]:
+    if "username" in args or "identifier" in args or "userId" in args:
+        return {"status": "success", "results": [{"id": "7", "username": 1234, "verified": "true"}]}
+    return {
+        "status": "success",
+        "results": [{"id": "1", "likeCount": "5", "text": "hi", "createdAt": "x"}],
+        "pagination": {"totalRows": 1, "totalPages": 1, "pageNumber": 1, "resultsCount": 1},
+    }
+
+
+def test_full_and_none_modes() -> None:
+    rows = [{"id": "1", "like_count": "5"}]
+    assert parse_rows(TwitterPost, rows, "full")[0].like_count == 5
+    assert parse_rows(TwitterPost, rows, "none") is rows
+    with pytest.raises(ValueError, match="full, none"):
+        check_validation("trusted")
+
+
+@pytest.mark.parametrize(("validation", "kind"), [("full", TwitterPost), ("none", dict)])
+def test_namespace_results_follow_the_client_mode(validation: Any, kind: type) -> None:
+    ns = TwitterNamespace(_call, 10, validation=validation)
+    page = ns.search_posts("ai")
+    assert isinstance(page.data[0], kind)
+    user = ns.get_user("someone")
+    if validation == "none":
+        assert user == {"id": "7", "username": 1234, "verified": "true"}
+    else:
+        assert isinstance(user, TwitterUser) and user.username == "1234"